@@ -7,6 +7,7 @@ from aligned_textgrid.aligned_textgrid import AlignedTextGrid
 from aligned_textgrid.sequence_list import SequenceList
 from aligned_textgrid.custom_classes import custom_classes
 from aligned_textgrid.outputs.to_dataframe import to_df
+from aligned_textgrid.inputs.from_dataframe import from_df, from_arrays
 
 from importlib.metadata import version
 
@@ -37,5 +38,7 @@ __all__ = [
     "AlignedTextGrid",
     "custom_classes",
     "to_df",
+    "from_df",
+    "from_arrays",
     "__version__"
 ]
\ No newline at end of file
@@ -0,0 +1,13 @@
+"""
+Namespace for the entry classes generated by `custom_classes()`
+and `clone_class()`. Each hierarchy's classes are in a module
+`aligned_textgrid._generated.<key>`, which is added to `sys.modules`
+while the classes are alive.
+"""
+import sys
+
+def __getattr__(key: str):
+    module = sys.modules.get(f"{__name__}.{key}")
+    if module is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{key}'")
+    return module
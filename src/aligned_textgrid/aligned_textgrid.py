@@ -14,10 +14,14 @@ from aligned_textgrid.sequences.tiers import SequenceTier, TierGroup
 from aligned_textgrid.points.tiers import SequencePointTier, PointsGroup
 from aligned_textgrid.mixins.within import WithinMixins
 from aligned_textgrid.mixins.tiermixins import TierGroupMixins
-from aligned_textgrid.custom_classes import custom_classes, clone_class, get_class_hierarchy
+from aligned_textgrid.custom_classes import custom_classes, clone_class, get_class_hierarchy, \
+                                           _shared_clone
+from aligned_textgrid.inputs.read_textgrid import read_textgrid, tier_selected, TextGridData, TierData
+from aligned_textgrid.outputs.write_textgrid import write_textgrid
 from typing import Type, Literal
 from copy import copy
 import numpy as np
+import numpy.typing as npt
 from collections.abc import Sequence
 from pathlib import Path
 import warnings
@@ -42,6 +46,34 @@ class AlignedTextGrid(Sequence, WithinMixins):
             class for each tier within each tier group. Say, if only the first speaker
             had both a word and phone tier, and the remaining two had only a word tier,
             `[[Word, Phone], [Word], [Word]]`
+        reader (Literal["praatio", "native"] | None, optional):
+            How to read a TextGrid file. `"praatio"` reads it with 
+            `praatio.textgrid.openTextgrid()`. `"native"` uses 
+            [](`~aligned_textgrid.inputs.read_textgrid.read_textgrid`),
+            which reads tiers directly into columns and is considerably faster.
+            Defaults to `"praatio"`, or to `"native"` if `include_tiers`
+            is given.
+        include_tiers (Sequence[str], optional):
+            Tier names or regular expressions. If given, only tiers whose
+            names match one of them are loaded, and `entry_classes` are
+            assigned to the selected tiers. With the `"native"` reader,
+            other tiers are skipped while parsing. With the `"praatio"`
+            reader, every tier is still parsed, and the others are
+            dropped afterwards.
+        lazy (bool, optional):
+            If `True`, tiers within each TierGroup aren't related to each
+            other until the entries of one of them are first accessed. 
+            Accessing any entry then builds and relates every tier in 
+            that TierGroup. Reading `tier.labels`, `tier.starts` or 
+            `tier.ends` won't relate the tiers. TierGroups that need
+            to be cleaned up, like those with gaps between intervals,
+            are related right away.
+        isolate_classes (bool, optional):
+            Each AlignedTextGrid uses clones of `entry_classes`. By default,
+            AlignedTextGrids loaded with the same entry classes share their
+            clones. If `True`, this AlignedTextGrid gets its own. Methods that
+            change the class hierarchy, like `interleave_class()`, always
+            isolate the classes first.
     
     Attributes:
         entry_classes (list[Sequence[Type[SequenceInterval]]] | list[]): 
@@ -66,9 +98,14 @@ class AlignedTextGrid(Sequence, WithinMixins):
             Sequence[Type[SequenceInterval]]
               = [SequenceInterval],
         *,
-        textgrid_path: str =  None
+        textgrid_path: str =  None,
+        reader: Literal["praatio", "native"]|None = None,
+        include_tiers: Sequence[str] = None,
+        lazy: bool = False,
+        isolate_classes: bool = False
     ):
         self._cloned_classes = []
+        self._isolated = isolate_classes
         self._tier_groups = []
         self.contains = self.tier_groups
 
@@ -76,7 +113,13 @@ class AlignedTextGrid(Sequence, WithinMixins):
             textgrid = textgrid_path
 
         if textgrid:
-            self._process_textgrid_arg(textgrid, entry_classes)
+            self._process_textgrid_arg(
+                textgrid, 
+                entry_classes, 
+                reader, 
+                include_tiers,
+                lazy
+            )
         else:
             warnings.warn('Initializing an empty AlignedTextGrid')
             return
@@ -113,10 +156,23 @@ class AlignedTextGrid(Sequence, WithinMixins):
         return f"AlignedTextGrid with {n_groups} groups named {repr(group_names)} "\
                f"each with {repr(n_tiers)} tiers. {repr(entry_classes)}"
     
+    def __reduce__(self):
+        # Pickled as columns and superset indices,
+        # rather than as linked entries.
+        from aligned_textgrid.pickling import _reduce_aligned_textgrid
+        return _reduce_aligned_textgrid(self)
+
     def __setstate__(self, d):
         self.__dict__ = d
 
-    def _process_textgrid_arg(self, arg, entry_classes):
+    def _process_textgrid_arg(
+            self, 
+            arg, 
+            entry_classes, 
+            reader = None,
+            include_tiers = None,
+            lazy = False
+        ):
 
         # if passed a list of TierGroups
         if isinstance(arg, Sequence) and \
@@ -127,7 +183,15 @@ class AlignedTextGrid(Sequence, WithinMixins):
             return
 
         # if passed a Path-like value
-        if isinstance(arg, str) or isinstance(arg, Path):
+        if reader is None:
+            # Only the native reader skips unselected tiers.
+            reader = "praatio" if include_tiers is None else "native"
+        if reader not in ["praatio", "native"]:
+            raise ValueError(f"reader must be 'praatio' or 'native', not {repr(reader)}")
+
+        if (isinstance(arg, str) or isinstance(arg, Path)) and reader == "native":
+            tg = read_textgrid(arg, include_tiers = include_tiers)
+        elif isinstance(arg, str) or isinstance(arg, Path):
             arg_str = str(arg)
             tg = openTextgrid(
                 fnFullPath=arg_str, 
@@ -136,19 +200,62 @@ class AlignedTextGrid(Sequence, WithinMixins):
             )
         
         #if passed a praatio.textgrid.Textgrid
-        if isinstance(arg, Textgrid):
+        #or columns from aligned_textgrid.inputs
+        if isinstance(arg, Textgrid) or isinstance(arg, TextGridData):
             tg = arg
 
+        if include_tiers is not None:
+            tg = self._select_tiers(tg, include_tiers)
+
         # do nestifying etc here.
         tg_tiers, entry_classes = self._nestify_tiers(tg, entry_classes)
-        tier_groups = self._relate_tiers(tg_tiers, entry_classes)
+        tier_groups = self._relate_tiers(tg_tiers, entry_classes, lazy)
         self.tier_groups = tier_groups
+
+        # TierGroups related from known superset entries
+        # were cleaned up before they were stored.
+        if isinstance(tg, TextGridData) and (tg.related or tg.cleaned):
+            return
         self.cleanup()
 
 
+    def _select_tiers(
+            self,
+            tg: Textgrid|TextGridData,
+            include_tiers: Sequence[str]
+        ) -> Textgrid|TextGridData:
+        """_Private method_
+
+        Keeps only the tiers selected by `include_tiers`.
+        """
+        tiers = [
+            tier 
+            for tier in tg.tiers 
+            if tier_selected(tier.name, include_tiers)
+        ]
+
+        if len(tiers) < 1:
+            raise ValueError(f"No tiers matched {include_tiers}.")
+
+        if isinstance(tg, TextGridData):
+            return TextGridData(
+                xmin = tg.xmin, 
+                xmax = tg.xmax, 
+                tiers = tiers, 
+                cleaned = tg.cleaned
+            )
+
+        if len(tiers) == len(tg.tiers):
+            return tg
+
+        new_tg = Textgrid(minTimestamp = tg.minTimestamp, maxTimestamp = tg.maxTimestamp)
+        for tier in tiers:
+            new_tg.addTier(tier)
+        return new_tg
+
     def _extend_classes(
             self, 
-            tg: Textgrid, 
+            tg: Textgrid|TextGridData, 
             entry_classes
         ) -> list[list[Type[SequenceBaseClass]]]:
         """summary
@@ -202,6 +309,8 @@ class AlignedTextGrid(Sequence, WithinMixins):
             if issubclass(c.superset_class, Top)
         ]
 
+        clone = clone_class if self._isolated else _shared_clone
+
         points_clone = []
         for p in points:
             if p.__name__ in cloned_class_names:
@@ -209,7 +318,7 @@ class AlignedTextGrid(Sequence, WithinMixins):
                     self._cloned_classes[cloned_class_names.index(p.__name__)]
                 )
             else:
-                points_clone.append(clone_class(p))
+                points_clone.append(clone(p))
         tops_clone = []
         for t in tops:
             if t.__name__ in cloned_class_names:
@@ -217,7 +326,7 @@ class AlignedTextGrid(Sequence, WithinMixins):
                     self._cloned_classes[cloned_class_names.index(t.__name__)]
                 )
             else:
-                tops_clone.append(clone_class(t))
+                tops_clone.append(clone(t))
 
         full_seq_clone = []
         for tclone in tops_clone:
@@ -226,6 +335,40 @@ class AlignedTextGrid(Sequence, WithinMixins):
         full_clone = points_clone + full_seq_clone
         self._cloned_classes += full_clone
 
+    def _isolate_classes(self)->None:
+        """_Private method_
+
+        Replaces interval classes shared with other AlignedTextGrids
+        with clones of this AlignedTextGrid's own, so that changes 
+        to the class hierarchy don't affect the others.
+        """
+        if self._isolated:
+            return
+        self._isolated = True
+
+        shared = [
+            c for c in self._cloned_classes if issubclass(c, SequenceInterval)
+        ]
+        if len(shared) < 1:
+            return
+        
+        self._cloned_classes = [
+            c for c in self._cloned_classes if not c in shared
+        ]
+        self._reclone_classes(shared)
+        for tier_group in self.tier_groups:
+            if not isinstance(tier_group, TierGroup):
+                continue
+            new_classes = self._swap_classes(
+                tier_group.entry_classes, 
+                self._cloned_classes
+            )
+            for cl, tier in zip(new_classes, tier_group):
+                for entry in tier:
+                    cl._cast(entry)
+                tier.__init__(tier, entry_class = cl)
+            tier_group.__init__(tier_group)
+
     def _swap_classes(
             self, 
             orig_classes: list[SequenceInterval]|list[SequencePoint], 
@@ -241,9 +384,9 @@ class AlignedTextGrid(Sequence, WithinMixins):
     
     def _nestify_tiers(
         self,
-        textgrid: Textgrid,
+        textgrid: Textgrid|TextGridData,
         entry_classes: list
-    )->tuple[list[list[IntervalTier|PointTier]], list[list[Type[SequenceBaseClass]]]]:
+    )->tuple[list[list[IntervalTier|PointTier|TierData]], list[list[Type[SequenceBaseClass]]]]:
         """_private method to nestify tiers_
 
         Takes a flat list of tiers and nests them according to 
@@ -308,8 +451,9 @@ class AlignedTextGrid(Sequence, WithinMixins):
 
     def _relate_tiers(
             self, 
-            tg_tiers: list[list[IntervalTier|PointTier]], 
-            entry_classes: list[list[Type[SequenceBaseClass]]]
+            tg_tiers: list[list[IntervalTier|PointTier|TierData]], 
+            entry_classes: list[list[Type[SequenceBaseClass]]],
+            lazy: bool = False
         )->list[TierGroup|PointsGroup]:
         """_Private method_
 
@@ -333,16 +477,68 @@ class AlignedTextGrid(Sequence, WithinMixins):
             sequence_tier_list = []
             point_tier_list = []
             for tier, entry_class in zip(tier_group, classes):
+                if isinstance(tier, TierData):
+                    new_tier = self._tier_from_data(tier, entry_class)
+                elif issubclass(entry_class, SequencePoint):
+                    new_tier = SequencePointTier(tier, entry_class)
+                elif lazy:
+                    # Only the columns are kept until the group is related.
+                    new_tier = SequenceTier._from_columns(
+                        np.array([x.start for x in tier.entries], dtype = np.float64),
+                        np.array([x.end for x in tier.entries], dtype = np.float64),
+                        [x.label for x in tier.entries],
+                        entry_class = entry_class,
+                        name = tier.name
+                    )
+                else:
+                    new_tier = SequenceTier(tier, entry_class)
                 if issubclass(entry_class, SequencePoint):
-                    point_tier_list.append(SequencePointTier(tier, entry_class))
+                    point_tier_list.append(new_tier)
                 if issubclass(entry_class, SequenceInterval):
-                    sequence_tier_list.append(SequenceTier(tier, entry_class))
-            if len(sequence_tier_list) > 0:
-                tier_groups.append(TierGroup(sequence_tier_list))
+                    sequence_tier_list.append(new_tier)
+            sequence_parents = [
+                tier.parents if isinstance(tier, TierData) else None
+                for tier, entry_class in zip(tier_group, classes)
+                if issubclass(entry_class, SequenceInterval)
+            ]
+            if len(sequence_tier_list) > 0 and \
+               all([par is not None for par in sequence_parents]):
+                tier_groups.append(TierGroup._from_parents(
+                    sequence_tier_list, 
+                    sequence_parents,
+                    lazy = lazy
+                ))
+            elif len(sequence_tier_list) > 0:
+                tier_groups.append(TierGroup(sequence_tier_list, lazy = lazy))
             if len(point_tier_list) > 0:
                 tier_groups.append(PointsGroup(point_tier_list))   
         return tier_groups
     
+    def _tier_from_data(
+            self,
+            tier_data: TierData,
+            entry_class: Type[SequenceBaseClass]
+        ) -> SequenceTier|SequencePointTier:
+        """_Private method_
+
+        Builds a tier directly from the columns read
+        by `read_textgrid()`.
+        """
+        if issubclass(entry_class, SequencePoint):
+            return SequencePointTier.from_arrays(
+                tier_data.starts,
+                tier_data.labels,
+                entry_class = entry_class,
+                name = tier_data.name
+            )
+        return SequenceTier._from_columns(
+            tier_data.starts,
+            tier_data.ends,
+            tier_data.labels,
+            entry_class = entry_class,
+            name = tier_data.name
+        )
+
     def _set_group_names(self):
         tier_group_names = [x.name for x in self.tier_groups]
         duplicate_names = [
@@ -364,6 +560,15 @@ class AlignedTextGrid(Sequence, WithinMixins):
         for idx, name in enumerate(tier_group_names):
             setattr(self, name, self.tier_groups[idx])
 
+    def _restore_links(self):
+        """_Private method_
+
+        Re-creates links between entries that aren't part of
+        the tier hierarchy after unpickling. Subclasses that
+        add such links should override this.
+        """
+        pass
+
     @property
     def tier_groups(self) -> list[TierGroup|PointsGroup|None]:
         if self._tier_groups:
@@ -581,12 +786,13 @@ class AlignedTextGrid(Sequence, WithinMixins):
         if not name:
             raise ValueError("name must be specified")
         
+        self._isolate_classes()
         new_class = custom_classes([name])[0]
 
-        if type(above) is type:
+        if isinstance(above, type):
             above = above.__name__
         
-        if type(below) is type:
+        if isinstance(below, type):
             below = below.__name__
 
         if above:
@@ -685,9 +891,10 @@ class AlignedTextGrid(Sequence, WithinMixins):
             ```
         """
 
-        if type(name) is type:
+        if isinstance(name, type):
             name = name.__name__
 
+        self._isolate_classes()
         new_tier_groups = []
         for tg in self.tier_groups:
             entry_classes = [t.entry_class.__name__ for t in tg]
@@ -783,6 +990,32 @@ class AlignedTextGrid(Sequence, WithinMixins):
         """
         return [tgroup.get_intervals_at_time(time) for tgroup in self.tier_groups]
 
+    def get_intervals_at_times(
+            self,
+            times: npt.ArrayLike
+        ) -> list[npt.NDArray|None]:
+        """Get interval indices at an array of times
+
+        Returns an array of intervals at `times` for each
+        tier group. See 
+        [](`~aligned_textgrid.sequences.tiers.TierGroup.get_intervals_at_times`).
+
+        Args:
+            times (npt.ArrayLike): times
+
+        Returns:
+            (list[npt.NDArray|None]): 
+                For each tier group, an array of interval indices with 
+                a row for each tier, and -1 where a time falls in a gap.
+                `None` for point tier groups.
+        """
+        times = np.asarray(times, dtype = np.float64)
+        return [
+            tgroup.get_intervals_at_times(times) 
+            if isinstance(tgroup, TierGroup) else None
+            for tgroup in self.tier_groups
+        ]
+
     def return_textgrid(self) -> Textgrid:
         """Convert this `AlignedTextGrid` to a `praatio` `Textgrid`
         
@@ -794,6 +1027,19 @@ class AlignedTextGrid(Sequence, WithinMixins):
                 A `praatio` `Textgrid`
         """
         out_tg = Textgrid()
+        for tier, name in self._unique_tier_names():
+            out_tg.addTier(tier = tier.return_tier(name))
+        return out_tg
+
+    def _unique_tier_names(
+            self
+        ) -> list[tuple[SequenceTier|SequencePointTier, str]]:
+        """_Private method_
+
+        Pairs every tier with the name it is saved under,
+        renaming duplicate tier names.
+        """
+        out = []
         tier_names = []
         dup_idx = 0
         for group in self.tier_groups:
@@ -803,8 +1049,8 @@ class AlignedTextGrid(Sequence, WithinMixins):
                     name = f"{name}_{dup_idx}"
                     dup_idx += 1 
                 tier_names += [name]
-                out_tg.addTier(tier = tier.return_tier(name))
-        return out_tg
+                out.append((tier, name))
+        return out
 
     def save_textgrid(
             self, 
@@ -815,17 +1061,30 @@ class AlignedTextGrid(Sequence, WithinMixins):
                 "json", 
                 "textgrid_json"
                 ] 
-            = "long_textgrid"
+            = "long_textgrid",
+            writer: Literal["praatio", "native"] = "praatio"
         ):
         """Saves the current AlignedTextGrid
 
-        Uses the `praatio.data_classes.textgrid.Textgrid.save()` method.
+        Uses the `praatio.data_classes.textgrid.Textgrid.save()` method,
+        or with `writer="native"`, 
+        [](`~aligned_textgrid.outputs.write_textgrid.write_textgrid`), 
+        which writes the same file directly from tier columns.
 
         Args:
             save_path (str): path for saving the textgrid
             format (Literal["short_textgrid", "long_textgrid", "json", "textgrid_json"], optional): 
                 Save format.
+            writer (Literal["praatio", "native"], optional):
+                How to write the file.
         """
+        if writer not in ["praatio", "native"]:
+            raise ValueError(f"writer must be 'praatio' or 'native', not {repr(writer)}")
+
+        if writer == "native":
+            write_textgrid(self, save_path, format = format)
+            return
+
         out_tg = self.return_textgrid()
         out_tg.save(
             fn = save_path,
@@ -833,3 +1092,19 @@ class AlignedTextGrid(Sequence, WithinMixins):
             includeBlankSpaces = True
         )
 
+    def save_snapshot(
+            self,
+            save_path: str|Path
+        ):
+        """Saves a columnar snapshot of the current AlignedTextGrid
+
+        See [](`~aligned_textgrid.snapshot.save_snapshot`). Snapshots can be
+        loaded again with [](`~aligned_textgrid.snapshot.load_snapshot`)
+        without re-relating tiers.
+
+        Args:
+            save_path (str|Path): path for saving the snapshot
+        """
+        from aligned_textgrid.snapshot import save_snapshot
+        save_snapshot(self, save_path)
+
@@ -0,0 +1,456 @@
+"""
+Module for loading and exporting a corpus of TextGrid files
+in parallel worker processes.
+"""
+
+import os
+import traceback
+import multiprocessing
+import polars as pl
+from collections import deque
+from collections.abc import Sequence, Iterator, Iterable, Callable
+from concurrent.futures import ProcessPoolExecutor, Future, wait, FIRST_COMPLETED
+from pathlib import Path
+from typing import Type, Literal
+from aligned_textgrid.aligned_textgrid import AlignedTextGrid
+from aligned_textgrid.sequences.sequences import SequenceInterval
+from aligned_textgrid.points.points import SequencePoint
+from aligned_textgrid.outputs.to_dataframe import to_df
+
+FILE_ID = "file_id"
+# The schema of the index returned by `corpus_to_parquet()`.
+CORPUS_INDEX_SCHEMA = {
+    FILE_ID: pl.UInt32,
+    "path": pl.String,
+    "part": pl.String,
+    "rows": pl.UInt64,
+    "error": pl.String
+}
+
+# The AlignedTextGrid options for each worker process,
+# set once by `_init_worker()`.
+_worker_options = {}
+
+class CorpusResult:
+    """The result of loading one file of a corpus
+
+    Args:
+        path (Path):
+            The TextGrid file
+        textgrid (AlignedTextGrid | None, optional):
+            The loaded AlignedTextGrid, or `None` if loading failed.
+        error (Exception | None, optional):
+            The exception raised while loading, if any.
+        traceback (str | None, optional):
+            The formatted traceback of `error`.
+
+    Attributes:
+        ok (bool):
+            Whether the file was loaded
+    """
+    def __init__(
+            self,
+            path: Path,
+            textgrid: AlignedTextGrid|None = None,
+            error: Exception|None = None,
+            traceback: str|None = None
+        ):
+        self.path = path
+        self.textgrid = textgrid
+        self.error = error
+        self.traceback = traceback
+
+    def __repr__(self) -> str:
+        if self.ok:
+            return f"CorpusResult {repr(str(self.path))}"
+        return f"CorpusResult {repr(str(self.path))} failed: {repr(self.error)}"
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+def corpus_paths(
+        paths: str|Path|Iterable[str|Path],
+        pattern: str = "*.TextGrid"
+    ) -> list[Path]:
+    """List the files of a corpus
+
+    Args:
+        paths (str | Path | Iterable[str | Path]):
+            A directory, or an iterable of files and directories.
+        pattern (str, optional):
+            A glob pattern for files to find in directories.
+            Files within subdirectories aren't included.
+
+    Returns:
+        (list[Path]): The files, with each directory's files sorted
+    """
+    if isinstance(paths, (str, Path)):
+        paths = [paths]
+    files = []
+    for path in paths:
+        path = Path(path)
+        if path.is_dir():
+            files.extend(sorted(path.glob(pattern)))
+        else:
+            files.append(path)
+    return files
+
+def _init_worker(options: dict) -> None:
+    _worker_options.clear()
+    _worker_options.update(options)
+
+def _load_file(path: Path, options: dict) -> CorpusResult:
+    try:
+        atg = AlignedTextGrid(path, **options)
+    except Exception as e:
+        return CorpusResult(
+            path,
+            error = e,
+            traceback = traceback.format_exc()
+        )
+    return CorpusResult(path, textgrid = atg)
+
+def _load_chunk(
+        paths: list[Path],
+        options: dict|None = None
+    ) -> list[CorpusResult]:
+    options = _worker_options if options is None else options
+    return [_load_file(path, options) for path in paths]
+
+def _failed_load(
+        paths: list[Path],
+        error: Exception,
+        tb: str
+    ) -> list[CorpusResult]:
+    return [
+        CorpusResult(path, error = error, traceback = tb)
+        for path in paths
+    ]
+
+def _chunks(
+        items: list,
+        chunksize: int
+    ) -> Iterator[list]:
+    for idx in range(0, len(items), chunksize):
+        yield items[idx:idx+chunksize]
+
+def _chunk_results(
+        future: Future,
+        chunk: list,
+        on_error: Callable[[list, Exception, str], list]
+    ) -> list:
+    """Get the results of a chunk. If the chunk itself failed,
+    say if a worker process crashed, every item gets its error.
+    """
+    try:
+        return future.result()
+    except Exception as e:
+        return on_error(chunk, e, traceback.format_exc())
+
+def _next_results(
+        pending: deque[tuple[Future, list]],
+        ordered: bool,
+        on_error: Callable[[list, Exception, str], list]
+    ) -> Iterator:
+    """Remove and yield the results of the first pending chunk,
+    or of any finished chunks if they needn't be in order.
+    """
+    if ordered:
+        yield from _chunk_results(*pending.popleft(), on_error)
+        return
+    done, _ = wait(
+        [future for future, _ in pending],
+        return_when = FIRST_COMPLETED
+    )
+    for item in [item for item in pending if item[0] in done]:
+        pending.remove(item)
+        yield from _chunk_results(*item, on_error)
+
+def _map_chunks(
+        chunk_fn: Callable[[list, dict|None], list],
+        on_error: Callable[[list, Exception, str], list],
+        items: list,
+        options: dict,
+        max_workers: int,
+        chunksize: int,
+        ordered: bool
+    ) -> Iterator:
+    """Apply `chunk_fn` to chunks of `items` in a process pool,
+    sending `options` to each worker once, and yield the results
+    of each item.
+    """
+    if max_workers == 1:
+        for chunk in _chunks(items, chunksize):
+            yield from chunk_fn(chunk, options)
+        return
+
+    # Forked workers can deadlock on locks held by polars'
+    # threads in this process, so workers are started fresh.
+    max_pending = max_workers * 2
+    with ProcessPoolExecutor(
+        max_workers = max_workers,
+        mp_context = multiprocessing.get_context("spawn"),
+        initializer = _init_worker,
+        initargs = (options, )
+    ) as executor:
+        pending: deque[tuple[Future, list]] = deque()
+        for chunk in _chunks(items, chunksize):
+            pending.append((executor.submit(chunk_fn, chunk), chunk))
+            while len(pending) >= max_pending:
+                yield from _next_results(pending, ordered, on_error)
+        while pending:
+            yield from _next_results(pending, ordered, on_error)
+
+def _n_workers(
+        max_workers: int|None,
+        n_items: int,
+        chunksize: int
+    ) -> int:
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be at least 1, not {chunksize}")
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    return max(1, min(max_workers, -(-n_items // chunksize)))
+
+def load_corpus(
+        paths: str|Path|Iterable[str|Path],
+        entry_classes:
+            Sequence[Sequence[Type[SequenceInterval|SequencePoint]]] |
+            Sequence[Type[SequenceInterval|SequencePoint]]
+              = [SequenceInterval],
+        *,
+        max_workers: int|None = None,
+        chunksize: int = 8,
+        ordered: bool = True,
+        reader: Literal["praatio", "native"]|None = None,
+        include_tiers: Sequence[str] = None,
+        lazy: bool = False
+    ) -> Iterator[CorpusResult]:
+    """Load the TextGrid files of a corpus in parallel
+
+    Files are read and their tiers related in a pool of worker
+    processes, and each AlignedTextGrid is sent back pickled
+    as flat columns, with the index of each entry's superset entry.
+    Results are yielded as they arrive, and only a few chunks of
+    files are waiting to be collected at a time.
+
+    If a file can't be loaded, its error is returned in its
+    [](`~aligned_textgrid.corpus.CorpusResult`) and the other
+    files are still loaded.
+
+    Examples:
+        ```{python}
+        from aligned_textgrid import Word, Phone
+        from aligned_textgrid.corpus import load_corpus
+
+        for result in load_corpus("../usage/resources", [Word, Phone]):
+            print(result)
+        ```
+
+    Args:
+        paths (str | Path | Iterable[str | Path]):
+            A directory of TextGrid files, or an iterable
+            of files and directories.
+            See [](`~aligned_textgrid.corpus.corpus_paths`).
+        entry_classes (Sequence[Sequence[Type[SequenceInterval|SequencePoint]]] | Sequence[Type[SequenceInterval|SequencePoint]], optional):
+            Entry classes for every file, as for
+            [](`~aligned_textgrid.AlignedTextGrid`). They're sent
+            to each worker process once.
+        max_workers (int | None, optional):
+            The number of worker processes. Defaults to the number
+            of CPUs. If 1, files are loaded in this process.
+        chunksize (int, optional):
+            The number of files each worker loads at a time.
+        ordered (bool, optional):
+            If `True`, results are yielded in the order of `paths`.
+            Otherwise, they're yielded as soon as they're loaded.
+        reader (Literal["praatio", "native"] | None, optional):
+            How to read each file, as for
+            [](`~aligned_textgrid.AlignedTextGrid`). Defaults to
+            `"praatio"`, or to `"native"` if `include_tiers` is given,
+            like `AlignedTextGrid`. `"native"` is considerably faster.
+        include_tiers (Sequence[str], optional):
+            Tier names or regular expressions for the tiers to load.
+        lazy (bool, optional):
+            If `True`, tiers aren't related until their entries
+            are first accessed.
+
+    Returns:
+        (Iterator[CorpusResult]):
+            A generator of the result for each file
+    """
+    files = corpus_paths(paths)
+    max_workers = _n_workers(max_workers, len(files), chunksize)
+    options = dict(
+        entry_classes = entry_classes,
+        reader = reader,
+        include_tiers = include_tiers,
+        lazy = lazy
+    )
+    return _map_chunks(
+        _load_chunk,
+        _failed_load,
+        files,
+        options,
+        max_workers,
+        chunksize,
+        ordered
+    )
+
+def _export_file(
+        file_id: int,
+        path: Path,
+        options: dict
+    ) -> tuple[pl.DataFrame|None, str|None]:
+    try:
+        atg = AlignedTextGrid(path, **options["load"])
+        df = to_df(atg, with_subset = options["with_subset"])
+    except Exception as e:
+        return None, repr(e)
+    df = df.select(
+        pl.lit(file_id, dtype = pl.UInt32).alias(FILE_ID),
+        pl.all()
+    )
+    return df, None
+
+def _export_chunk(
+        chunk: list[tuple[int, Path]],
+        options: dict|None = None
+    ) -> list[tuple]:
+    """Write the rows of a chunk of files to one parquet file,
+    and return an index row for each file.
+    """
+    options = _worker_options if options is None else options
+    part = Path(options["out_dir"]) / f"part-{chunk[0][0]:06d}.parquet"
+    frames = []
+    index = []
+    for file_id, path in chunk:
+        df, error = _export_file(file_id, path, options)
+        if df is None:
+            index.append((file_id, str(path), None, 0, error))
+            continue
+        frames.append(df)
+        index.append((file_id, str(path), part.name, df.height, None))
+
+    if len(frames) > 0:
+        pl.concat(frames, how = "diagonal").write_parquet(part)
+    return index
+
+def _failed_export(
+        chunk: list[tuple[int, Path]],
+        error: Exception,
+        tb: str
+    ) -> list[tuple]:
+    return [
+        (file_id, str(path), None, 0, repr(error))
+        for file_id, path in chunk
+    ]
+
+def corpus_to_parquet(
+        paths: str|Path|Iterable[str|Path],
+        out_dir: str|Path,
+        entry_classes:
+            Sequence[Sequence[Type[SequenceInterval|SequencePoint]]] |
+            Sequence[Type[SequenceInterval|SequencePoint]]
+              = [SequenceInterval],
+        *,
+        with_subset: bool = True,
+        max_workers: int|None = None,
+        chunksize: int = 8,
+        reader: Literal["praatio", "native"]|None = None,
+        include_tiers: Sequence[str] = None
+    ) -> pl.DataFrame:
+    """Write the dataframes of a corpus to parquet files
+
+    Each file is loaded and converted with 
+    [](`~aligned_textgrid.outputs.to_dataframe.to_df`) in a pool
+    of worker processes. The rows of each chunk of files are
+    written by the worker to a `part-*.parquet` file in `out_dir`,
+    with a `file_id` column giving the index of the file in 
+    `paths`. Rows are never collected in this process, so each 
+    worker only holds one chunk of files at a time.
+
+    If every file has the same entry classes, the parts can be 
+    read together with `pl.scan_parquet(out_dir / "*.parquet")`.
+
+    Examples:
+        ```{python}
+        from aligned_textgrid import Word, Phone
+        from aligned_textgrid.corpus import corpus_to_parquet
+        import polars as pl
+        import tempfile
+        from pathlib import Path
+
+        out_dir = Path(tempfile.mkdtemp())
+        index = corpus_to_parquet(
+            "../usage/resources", 
+            out_dir, 
+            [Word, Phone]
+        )
+        print(index)
+        ```
+
+    Args:
+        paths (str | Path | Iterable[str | Path]):
+            A directory of TextGrid files, or an iterable
+            of files and directories.
+            See [](`~aligned_textgrid.corpus.corpus_paths`).
+        out_dir (str | Path):
+            The directory to write parquet files to. It's created
+            if it doesn't exist, and may not already have parts in it.
+        entry_classes (Sequence[Sequence[Type[SequenceInterval|SequencePoint]]] | Sequence[Type[SequenceInterval|SequencePoint]], optional):
+            Entry classes for every file, as for
+            [](`~aligned_textgrid.AlignedTextGrid`).
+        with_subset (bool, optional):
+            Passed to `to_df()`.
+        max_workers (int | None, optional):
+            The number of worker processes. Defaults to the number
+            of CPUs. If 1, files are exported in this process.
+        chunksize (int, optional):
+            The number of files written to each part.
+        reader (Literal["praatio", "native"] | None, optional):
+            How to read each file, as for
+            [](`~aligned_textgrid.AlignedTextGrid`). Defaults to
+            `"praatio"`, or to `"native"` if `include_tiers` is given,
+            like `AlignedTextGrid`. `"native"` is considerably faster.
+        include_tiers (Sequence[str], optional):
+            Tier names or regular expressions for the tiers to load.
+
+    Returns:
+        (pl.DataFrame):
+            An index with a row for each file, giving its `file_id`,
+            `path`, the `part` its rows were written to, the number of 
+            `rows`, and the `error` if it couldn't be exported.
+    """
+    files = corpus_paths(paths)
+    max_workers = _n_workers(max_workers, len(files), chunksize)
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents = True, exist_ok = True)
+    if any(out_dir.glob("part-*.parquet")):
+        raise ValueError(f"{out_dir} already has parquet parts in it.")
+
+    options = dict(
+        load = dict(
+            entry_classes = entry_classes,
+            reader = reader,
+            include_tiers = include_tiers
+        ),
+        with_subset = with_subset,
+        out_dir = str(out_dir)
+    )
+    index = list(_map_chunks(
+        _export_chunk,
+        _failed_export,
+        list(enumerate(files)),
+        options,
+        max_workers,
+        chunksize,
+        ordered = False
+    ))
+    return pl.DataFrame(
+        index, 
+        schema = CORPUS_INDEX_SCHEMA, 
+        orient = "row"
+    ).sort(FILE_ID)
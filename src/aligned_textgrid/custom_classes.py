@@ -2,8 +2,228 @@ from aligned_textgrid.sequences.sequences import *
 from aligned_textgrid.points.points import *
 from praatio.utilities.utils import Interval
 from typing import Type
+import importlib
+import itertools
+import copyreg
+import functools
+import hashlib
+import json
+import sys
+import types
+import weakref
+from collections import OrderedDict
+
+# Generated classes get the module `aligned_textgrid._generated.<key>`,
+# where the key is the kind of hierarchy, a short hash of its signature
+# (class names, point indices, or the class it was cloned from), and a
+# count of live hierarchies with the same signature. A module for each
+# key is added to `sys.modules` while its classes are alive, so `pickle`
+# can find them by name. Pickling one of these classes also saves the
+# full spec of its hierarchy (see `_reduce_class()`), so another process
+# can generate the hierarchy again.
+_GENERATED = "aligned_textgrid._generated"
+
+class _GeneratedType(type):
+    """The type of classes created by `custom_classes()` and 
+    `clone_class()`, so that they can be pickled along with 
+    the spec of their hierarchy.
+    """
+    pass
+
+# Live generated classes, by "<key>.<name>"
+_live_classes = weakref.WeakValueDictionary()
+# The first class of each live hierarchy, by key
+_live_keys = weakref.WeakValueDictionary()
+# The key and hierarchy spec of each generated class
+_class_specs = weakref.WeakKeyDictionary()
+# The superset and subset classes each generated
+# class had when it was registered.
+_registered_links = weakref.WeakKeyDictionary()
+# The local key of hierarchies generated again from
+# a pickle, by the key and members they were saved with.
+_local_keys = {}
+
+def _new_class(name:str, base:type, namespace:dict)->type:
+    meta = type(base)
+    if meta is type:
+        meta = _GeneratedType
+    return meta(name, (base, ), namespace)
+
+def _signature(spec:dict)->str:
+    """A short hash of what a hierarchy was generated from"""
+    signature = {
+        key: value 
+        for key, value in spec.items() 
+        if key != "members"
+    }
+    text = json.dumps(signature, separators = (",", ":"), sort_keys = True)
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:10]
+
+def _new_key(spec:dict)->str:
+    prefix = f"{spec['kind']}_{_signature(spec)}"
+    for n in itertools.count():
+        key = f"{prefix}_{n}"
+        if not key in _live_keys:
+            return key
+
+def _class_ref(entry_class:type)->str:
+    return f"{entry_class.__module__}:{entry_class.__qualname__}"
+
+def _resolve_ref(ref:str)->type:
+    module_name, qualname = ref.split(":")
+    obj = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+def _source_ref(entry_class:type)->str|dict:
+    """Describe the class a hierarchy is cloned from, by its 
+    importable name, or by its key and spec if it was generated.
+    """
+    if entry_class in _class_specs:
+        key, spec = _class_specs[entry_class]
+        return {"key": key, "spec": spec, "name": entry_class.__name__}
+    return _class_ref(entry_class)
+
+def _resolve_source(source:str|dict)->type:
+    if isinstance(source, dict):
+        return _generated_class(source["key"], source["spec"], source["name"])
+    return _resolve_ref(source)
+
+def _importable(entry_class:type)->bool:
+    """Check whether `pickle` can find a class by its qualified name.
+    """
+    if entry_class in _class_specs:
+        return True
+    try:
+        return _resolve_ref(_class_ref(entry_class)) is entry_class
+    except Exception:
+        return False
+
+def _link_refs(entry_class:type)->tuple:
+    return tuple(
+        None if linked is None else weakref.ref(linked)
+        for linked in [
+            getattr(entry_class, "superset_class", None), 
+            getattr(entry_class, "subset_class", None)
+        ]
+    )
 
-
+def _links_unchanged(entry_class:type)->bool:
+    """Check that a generated class still has the superset and
+    subset classes it was generated with. Other classes are
+    always unchanged.
+    """
+    if not entry_class in _registered_links:
+        return True
+    return _registered_links[entry_class] == _link_refs(entry_class)
+
+def _module_class(key:str, name:str)->type:
+    # The module __getattr__ of `aligned_textgrid._generated.<key>`
+    entry_class = _live_classes.get(f"{key}.{name}")
+    if entry_class is None:
+        raise AttributeError(f"module '{_GENERATED}.{key}' has no attribute '{name}'")
+    return entry_class
+
+def _drop_module(key:str)->None:
+    if not key in _live_keys:
+        sys.modules.pop(f"{_GENERATED}.{key}", None)
+        for origin in [x for x, y in _local_keys.items() if y == key]:
+            del _local_keys[origin]
+
+def _register_classes(
+        classes:list[type],
+        key:str,
+        spec:dict
+    )->None:
+    module_name = f"{_GENERATED}.{key}"
+    for entry_class in classes:
+        entry_class.__module__ = module_name
+        entry_class.__qualname__ = entry_class.__name__
+        _live_classes[f"{key}.{entry_class.__name__}"] = entry_class
+        _class_specs[entry_class] = (key, spec)
+        _registered_links[entry_class] = _link_refs(entry_class)
+    _live_keys[key] = classes[0]
+    _local_keys[(key, tuple(spec["members"]))] = key
+
+    if not module_name in sys.modules:
+        module = types.ModuleType(module_name)
+        module.__getattr__ = functools.partial(_module_class, key)
+        sys.modules[module_name] = module
+    weakref.finalize(classes[0], _drop_module, key)
+
+def _register_hierarchy(
+        classes:list[type],
+        spec:dict
+    )->None:
+    """Give the classes of a newly generated hierarchy an
+    importable module. Hierarchies that can't be generated
+    again by name are left as they are.
+    """
+    names = [entry_class.__name__ for entry_class in classes]
+    if len(set(names)) < len(names):
+        return
+    spec = dict(spec, members = names)
+    _register_classes(classes, _new_key(spec), spec)
+
+def _generate_hierarchy(spec:dict)->list[type]:
+    """Generate the classes described by a hierarchy spec
+    """
+    created = []
+    if spec["kind"] == "custom":
+        _custom_hierarchy(spec["names"], spec["points"], created)
+    elif spec["kind"] == "clone":
+        _clone(_resolve_source(spec["source"]), spec["recurse"], created)
+    elif spec["kind"] == "top":
+        _make_top(created)
+    elif spec["kind"] == "bottom":
+        _make_bottom(created)
+    else:
+        raise ValueError(f"Unknown class hierarchy kind {spec['kind']}")
+
+    # Top and Bottom class names are numbered in order of creation,
+    # and are restored to the names they were generated with.
+    for entry_class, name in zip(created, spec["members"]):
+        entry_class.__name__ = name
+    return created
+
+def _generated_class(key:str, spec:dict, name:str)->type:
+    """Find the generated class `name` from a hierarchy saved
+    as `key`, generating the hierarchy again if it isn't live.
+    """
+    members = spec["members"]
+    local_key = _local_keys.get((key, tuple(members)))
+    if local_key is not None:
+        entry_class = _live_classes.get(f"{local_key}.{name}")
+        if entry_class is not None:
+            return entry_class
+
+    classes = _generate_hierarchy(spec)
+    if key in _live_keys:
+        # Another hierarchy in this process has the same key
+        _register_classes(classes, _new_key(spec), spec)
+        _local_keys[(key, tuple(members))] = _class_specs[classes[0]][0]
+    else:
+        _register_classes(classes, key, spec)
+    return classes[members.index(name)]
+
+def _reduce_class(entry_class:_GeneratedType)->tuple|str:
+    if not entry_class in _class_specs:
+        return entry_class.__qualname__
+    key, spec = _class_specs[entry_class]
+    return (_generated_class, (key, spec, entry_class.__name__))
+
+copyreg.pickle(_GeneratedType, _reduce_class)
+
+def _class_namespace(entry_class:type)->dict:
+    """Copy a class namespace for a new subclass, leaving
+    out the slot descriptors the subclass inherits anyway.
+    """
+    namespace = dict(entry_class.__dict__)
+    slots = namespace.pop("__slots__", ())
+    for name in [*slots, "__dict__", "__weakref__", "__slotnames__"]:
+        namespace.pop(name, None)
+    return namespace
 
 def _top_constructor(self):
     Top.__init__(self)
@@ -11,29 +231,78 @@ def _top_constructor(self):
 def _bottom_constructor(self):
     Bottom.__init__(self)
 
-def _make_top()->SequenceInterval:
+# Top and Bottom classes are numbered from counters, since
+# `Top.__subclasses__()` grows with every hierarchy created.
+_top_ids = itertools.count(len(Top.__subclasses__()))
+_bottom_ids = itertools.count(len(Bottom.__subclasses__()))
 
-    n_top = len(Top.__subclasses__())
+def _make_top(created:list[type]|None = None)->SequenceInterval:
+
+    n_top = next(_top_ids)
     this_top_name = f"Top_{n_top}"
-    this_top = type(
+    this_top = _new_class(
         this_top_name,
-        (Top, ), 
+        Top, 
         {"__init__": _top_constructor}
     )
 
+    if created is None:
+        _register_hierarchy([this_top], {"kind": "top"})
+    else:
+        created.append(this_top)
     return this_top
 
-def _make_bottom()->SequenceInterval:
-    n_bottom = len(Bottom.__subclasses__())
+def _make_bottom(created:list[type]|None = None)->SequenceInterval:
+    n_bottom = next(_bottom_ids)
     this_bottom_name = f"Bottom_{n_bottom}"
-    this_bottom = type(
+    this_bottom = _new_class(
         this_bottom_name, 
-        (Bottom, ), 
+        Bottom, 
         {"__init__": _bottom_constructor}
     )
 
+    if created is None:
+        _register_hierarchy([this_bottom], {"kind": "bottom"})
+    else:
+        created.append(this_bottom)
     return this_bottom
 
+def _custom_hierarchy(
+        names:list[str],
+        points:list[int],
+        created:list[type]
+)->list[type[SequenceInterval]|type[SequencePoint]]:
+    """Create the classes for `custom_classes()`, 
+    in hierarchical order.
+    """
+    this_top = _make_top(created)
+    this_bottom = _make_bottom(created)
+
+    class_out_list = []
+    for idx, name in enumerate(names):
+        if idx in points:
+            class_out_list.append(
+                _new_class(name, SequencePoint, _class_namespace(SequencePoint))
+            )
+        else:
+            class_out_list.append(
+                _new_class(name, SequenceInterval, _class_namespace(SequenceInterval))
+            )
+    created += class_out_list
+
+    interval_classes = [x 
+                        for x in class_out_list 
+                        if issubclass(x, SequenceInterval)
+                        ]
+    for idx, entry in enumerate(interval_classes):
+        if idx == 0:
+            entry.set_superset_class(this_top)
+        if idx == len(interval_classes)-1:
+            entry.set_subset_class(this_bottom)
+        else:
+            entry.set_subset_class(interval_classes[idx+1])
+    return class_out_list
+
 def custom_classes(
         class_list:list[str] = [],
         return_order: list[str] | list[int] | None = None,
@@ -45,6 +314,9 @@ def custom_classes(
     `SequenceInterval` subclasses with those names. The first name passed to `class_list`
     will be at the top of the hierarchy, the second name will be the subset class of the 
     first, and so on.
+
+    The new classes can be pickled by reference. Another process 
+    that unpickles them re-creates their hierarchy once.
     
     Examples:
 
@@ -95,54 +367,27 @@ def custom_classes(
         (list[Type[SequenceInterval]]): A list of custom `SequenceInterval` subclasses
     """
 
-    this_top = _make_top()
-    this_bottom = _make_bottom()
-
     if return_order is None:
         return_order = class_list
 
-    class_out_list = []
-    if type(class_list) is str and len(points) == 0:
-        newclass = type(
-            class_list, 
-            (SequenceInterval, ), 
-            dict(SequenceInterval.__dict__)
-        )
-        newclass.set_superset_class(this_top)
-        newclass.set_subset_class(this_bottom)
-        return newclass
-    
-    if type(class_list) is str and len(points) != 0:
-        newclass = type(
-            class_list, 
-            (SequencePoint, ), 
-            dict(SequencePoint.__dict__)
-        )
-        return newclass
+    if type(class_list) is str:
+        names = [class_list]
+        points = [0] if len(points) != 0 else []
+    else:
+        names = list(class_list)
+        points = [idx for idx in range(len(names)) if idx in points]
+
+    created = []
+    class_out_list = _custom_hierarchy(names, points, created)
+    _register_hierarchy(
+        created, 
+        {"kind": "custom", "names": names, "points": points}
+    )
 
-    if type(class_list) is list:
-        for idx, name in enumerate(class_list):
-            if idx in points:
-                class_out_list.append(
-                    type(name, (SequencePoint,), dict(SequencePoint.__dict__))
-                )
-            else:
-                class_out_list.append(
-                    type(name, (SequenceInterval,), dict(SequenceInterval.__dict__))
-                )
-                
-        interval_classes = [x 
-                            for x in class_out_list 
-                            if issubclass(x, SequenceInterval)
-                            ]
-        for idx, entry in enumerate(interval_classes):
-            if idx == 0:
-                entry.set_superset_class(this_top)
-            if idx == len(interval_classes)-1:
-                entry.set_subset_class(this_bottom)
-            else:
-                entry.set_subset_class(interval_classes[idx+1])
+    if type(class_list) is str:
+        return class_out_list[0]
 
+    if type(class_list) is list:
         if type(return_order[0]) is int:
             return_list = [class_out_list[idx] for idx in return_order]
         elif type(return_order[0]) is str:
@@ -156,7 +401,8 @@ def clone_class(
         ) -> SequenceInterval|SequencePoint:
     """Clone an entry class. It will have the same name, but
     any changes to its class properties will not be reflected
-    in the original class.
+    in the original class. Like classes from `custom_classes()`,
+    clones of importable classes can be pickled by reference.
 
     Args:
         entry_class (SequenceInterval | SequencePoint): 
@@ -168,43 +414,98 @@ def clone_class(
     Returns:
         (SequenceInterval|SequencePoint): A cloned entry class
     """
-    
+    created = []
+    cloned = _clone(entry_class, recurse, created)
+    if _importable(entry_class):
+        _register_hierarchy(
+            created,
+            {"kind": "clone", "source": _source_ref(entry_class), "recurse": recurse}
+        )
+    return cloned
+
+def _clone(
+        entry_class:SequenceInterval|SequencePoint,
+        recurse:bool,
+        created:list[type]
+        ) -> SequenceInterval|SequencePoint:
+    """Clone an entry class, adding every class created
+    along the way to `created`.
+    """
     if issubclass(entry_class, SequenceInterval):
         if not issubclass(entry_class.superset_class, Top) \
         and not recurse:
             raise Exception("Entry class to clone must be top of hierarchy")
         
-        cloned = type(
+        cloned = _new_class(
                 entry_class.__name__, 
-                (entry_class, ), 
-                dict(entry_class.__dict__)
+                entry_class, 
+                _class_namespace(entry_class)
             )
+        created.append(cloned)
         
         if issubclass(cloned.superset_class, Top):
             cloned.set_superset_class(
-                _make_top()
+                _make_top(created)
             )
 
         if issubclass(cloned.subset_class, Bottom):
             cloned.set_subset_class(
-                _make_bottom()
+                _make_bottom(created)
             )
 
         if (not cloned is cloned.subset_class.superset_class) \
            and issubclass(cloned.subset_class, SequenceInterval):
-            new_subset = clone_class(cloned.subset_class, recurse=True)
+            new_subset = _clone(cloned.subset_class, True, created)
             cloned.set_subset_class(new_subset)
 
            
     if issubclass(entry_class, SequencePoint):
-        cloned = type(
+        cloned = _new_class(
                 entry_class.__name__, 
-                (entry_class, ), 
-                dict(entry_class.__dict__)
+                entry_class, 
+                _class_namespace(entry_class)
         )
+        created.append(cloned)
     
     return cloned
 
+# Clones shared between AlignedTextGrids loaded with the same 
+# entry classes, keyed by the hierarchy they were cloned from. 
+# Clones are dropped once no AlignedTextGrid uses them, apart 
+# from the most recently used, which are kept so that grids 
+# loaded one after another can reuse them.
+CLASS_CACHE_SIZE = 32
+_shared_clones = weakref.WeakValueDictionary()
+_shared_clone_links = weakref.WeakKeyDictionary()
+_recent_clones = OrderedDict()
+
+def _hierarchy_key(entry_class:type)->tuple:
+    if issubclass(entry_class, SequencePoint):
+        return (weakref.ref(entry_class), )
+    return tuple(
+        weakref.ref(x) 
+        for x in get_class_hierarchy(entry_class, [])
+    )
+
+def _shared_clone(
+        entry_class:SequenceInterval|SequencePoint
+    ) -> SequenceInterval|SequencePoint:
+    """Clone an entry class, or reuse a clone of the same
+    class hierarchy, if its hierarchy hasn't been changed.
+    """
+    key = _hierarchy_key(entry_class)
+    cloned = _shared_clones.get(key)
+    if cloned is None or _shared_clone_links.get(cloned) != _hierarchy_key(cloned):
+        cloned = clone_class(entry_class)
+        _shared_clones[key] = cloned
+        _shared_clone_links[cloned] = _hierarchy_key(cloned)
+
+    _recent_clones[key] = cloned
+    _recent_clones.move_to_end(key)
+    while len(_recent_clones) > CLASS_CACHE_SIZE:
+        _recent_clones.popitem(last = False)
+    return cloned
+
 def get_class_hierarchy(
         entry_class:SequenceInterval, 
         out_list = []
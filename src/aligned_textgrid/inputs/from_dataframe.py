@@ -0,0 +1,477 @@
+"""
+Module for building an AlignedTextGrid from a dataframe,
+or from arrays of tier columns.
+"""
+
+import polars as pl
+import numpy as np
+import warnings
+import numpy.typing as npt
+from aligned_textgrid.aligned_textgrid import AlignedTextGrid
+from aligned_textgrid.sequences.sequences import SequenceInterval, Top
+from aligned_textgrid.points.points import SequencePoint
+from aligned_textgrid.snapshot import _snapshot_classes
+from aligned_textgrid.inputs.read_textgrid import TierData, TextGridData, \
+                                                  INTERVAL_TIER, POINT_TIER
+from typing import Type
+from collections.abc import Sequence
+
+GROUP_COLUMN = "name"
+TIER_COLUMNS = ["entry_class", "tier"]
+
+def _tier_data(
+        tier_name: str,
+        starts: npt.NDArray,
+        ends: npt.NDArray|None,
+        labels: list[str],
+        parents: npt.NDArray|None
+    ) -> TierData:
+    """Make the columns of one tier. Tiers without
+    any end times are point tiers.
+    """
+    starts = np.asarray(starts, dtype = np.float64)
+    if ends is not None:
+        ends = np.asarray(ends, dtype = np.float64)
+    if ends is None or (len(ends) > 0 and np.all(np.isnan(ends))):
+        ends = None
+    elif np.any(np.isnan(ends)):
+        raise ValueError(f"Some entries in the {tier_name} tier have no end time.")
+    if np.any(np.isnan(starts)):
+        raise ValueError(f"Some entries in the {tier_name} tier have no start time.")
+    times = starts if ends is None else ends
+    return TierData(
+        name = tier_name,
+        tier_class = POINT_TIER if ends is None else INTERVAL_TIER,
+        xmin = float(starts.min()) if len(labels) > 0 else 0.0,
+        xmax = float(times.max()) if len(labels) > 0 else 0.0,
+        starts = starts,
+        ends = ends,
+        labels = labels,
+        parents = parents
+    )
+
+def _column_parents(
+        tier_df: pl.DataFrame
+    ) -> npt.NDArray|None:
+    if not "parent" in tier_df.columns or tier_df["parent"].null_count() > 0:
+        return None
+    return tier_df["parent"].to_numpy().astype(np.int64)
+
+def _long_groups(
+        df: pl.DataFrame,
+        tier_column: str
+    ) -> list[tuple[int, str|None, list[TierData]]]:
+    """Get the tiers of each group from a dataframe with
+    one row per entry, and a column naming its entry class.
+    """
+    # Groups with the same name are told apart
+    # by their tier indices starting over.
+    occurrence = pl.lit(0)
+    if "tier_index" in df.columns:
+        occurrence = (pl.col("tier_index").diff() < 0)\
+            .fill_null(False)\
+            .cum_sum()\
+            .over([GROUP_COLUMN, tier_column])
+    df = df.with_columns(_occurrence = occurrence)
+
+    groups = {}
+    for (name, occ, tier_name), tier_df in df.group_by(
+        [GROUP_COLUMN, "_occurrence", tier_column],
+        maintain_order = True
+    ):
+        if not (name, occ) in groups:
+            groups[(name, occ)] = (tier_df["_row"][0], name, [])
+        groups[(name, occ)][2].append(_tier_data(
+            tier_name,
+            tier_df["start"].to_numpy(),
+            tier_df["end"].to_numpy() if "end" in tier_df.columns else None,
+            tier_df["label"].to_list(),
+            _column_parents(tier_df)
+        ))
+    return list(groups.values())
+
+def _wide_groups(
+        df: pl.DataFrame
+    ) -> list[tuple[int, str|None, list[TierData]]]:
+    """Get the tiers of each group from a dataframe with one row
+    per bottom entry, and columns prefixed by entry class name for
+    each level, as returned by [](`~aligned_textgrid.to_df`).
+    """
+    prefixes = [col[:-len("_start")] for col in df.columns if col.endswith("_start")]
+    index_columns = [
+        f"{prefix}_tier_index"
+        for prefix in prefixes
+        if f"{prefix}_tier_index" in df.columns
+    ]
+
+    # Every row has an entry at the top level, so the first non-null
+    # tier index (or start time) belongs to the top entry. Groups with
+    # the same name are told apart by these starting over.
+    top_columns = index_columns
+    if len(top_columns) < 1:
+        top_columns = [f"{prefix}_start" for prefix in prefixes]
+    occurrence = (pl.coalesce(top_columns).diff() < 0)\
+        .fill_null(False)\
+        .cum_sum()\
+        .over(GROUP_COLUMN)
+    df = df.with_columns(_occurrence = occurrence)
+
+    groups = []
+    for (name, _), group_df in df.group_by(
+        [GROUP_COLUMN, "_occurrence"],
+        maintain_order = True
+    ):
+        tiers = []
+        upper_key = None
+        upper_keys = None
+        for prefix in prefixes:
+            start = f"{prefix}_start"
+            if group_df[start].null_count() == group_df.height:
+                continue
+            missing = [
+                col
+                for col in [f"{prefix}_end", f"{prefix}_label"]
+                if not col in group_df.columns
+            ]
+            if len(missing) > 0:
+                raise ValueError(f"The dataframe has no {missing} columns.")
+
+            # Each entry is repeated for every entry it contains, so
+            # rows with the same key are the same entry. Without a
+            # tier index, a new entry starts wherever the values change.
+            key = f"_key_{prefix}"
+            rows = group_df.filter(pl.col(start).is_not_null())
+            if f"{prefix}_tier_index" in rows.columns:
+                key_expr = pl.col(f"{prefix}_tier_index").cast(pl.Int64)
+            else:
+                parts = [start, f"{prefix}_end", f"{prefix}_label"]
+                if upper_key is not None:
+                    parts.append(upper_key)
+                key_expr = pl.any_horizontal([
+                    pl.col(col).ne_missing(pl.col(col).shift(1))
+                    for col in parts
+                ]).cast(pl.Int64).cum_sum()
+            rows = rows.with_columns(key_expr.alias(key))
+            group_df = group_df.join(
+                rows.select("_row", key),
+                on = "_row",
+                how = "left",
+                maintain_order = "left"
+            )
+            entries = rows.unique(
+                subset = key,
+                keep = "first",
+                maintain_order = True
+            ).sort(key)
+
+            parents = np.full(entries.height, -1, dtype = np.int64)
+            if upper_key is not None:
+                parents = np.searchsorted(
+                    upper_keys,
+                    entries[upper_key].to_numpy()
+                ).astype(np.int64)
+            tiers.append(_tier_data(
+                prefix,
+                entries[start].to_numpy(),
+                entries[f"{prefix}_end"].to_numpy(),
+                entries[f"{prefix}_label"].to_list(),
+                parents
+            ))
+            upper_key = key
+            upper_keys = entries[key].to_numpy()
+        groups.append((group_df["_row"][0], name, tiers))
+    return groups
+
+def _hierarchy_depth(entry_class: Type[SequenceInterval|SequencePoint]) -> int:
+    depth = 0
+    if issubclass(entry_class, SequencePoint):
+        return depth
+    while not issubclass(entry_class.superset_class, Top):
+        entry_class = entry_class.superset_class
+        depth += 1
+    return depth
+
+def _sort_tiers(
+        tiers: list[TierData]
+    ) -> None:
+    """Sort every tier in a group by start time, updating the
+    superset indices of the tier below. If the superset indices
+    can't be used to relate the tiers, they are dropped with
+    a warning.
+    """
+    new_positions = None
+    for idx, tier in enumerate(tiers):
+        if idx == 0 or tier.tier_class == POINT_TIER:
+            tier.parents = np.full(len(tier.labels), -1, dtype = np.int64)
+        elif tier.parents is not None:
+            n_upper = len(tiers[idx-1].labels)
+            if np.any(tier.parents >= n_upper) or np.any(tier.parents < -1):
+                raise ValueError(
+                    f"Superset indices for the {tier.name} tier "
+                    f"aren't between -1 and {n_upper-1}."
+                )
+            if new_positions is not None:
+                tier.parents = np.where(
+                    tier.parents >= 0,
+                    new_positions[np.maximum(tier.parents, 0)],
+                    -1
+                )
+
+        new_positions = None
+        if np.any(tier.starts[1:] < tier.starts[:-1]):
+            order = np.argsort(tier.starts, kind = "stable")
+            tier.starts = tier.starts[order]
+            if tier.ends is not None:
+                tier.ends = tier.ends[order]
+            tier.labels = [tier.labels[x] for x in order]
+            if tier.parents is not None:
+                tier.parents = tier.parents[order]
+            new_positions = np.empty_like(order)
+            new_positions[order] = np.arange(len(order))
+
+    if any([tier.parents is None for tier in tiers]):
+        for tier in tiers:
+            tier.parents = None
+        return
+
+    unordered = [
+        tier.name
+        for tier in tiers
+        if np.any(tier.parents[1:] < tier.parents[:-1])
+    ]
+    if len(unordered) > 0:
+        warnings.warn(
+            (
+                f"Superset indices for the {unordered[0]} tier are out of "
+                "order once it's sorted by start time, so tiers were "
+                "related by their timing instead."
+            )
+        )
+        for tier in tiers:
+            tier.parents = None
+
+def _from_groups(
+        groups: list[tuple[int, str|None, list[TierData]]],
+        entry_classes: Sequence[Type[SequenceInterval|SequencePoint]],
+        lazy: bool
+    ) -> AlignedTextGrid:
+    groups = sorted(groups, key = lambda x: x[0])
+    if len(groups) < 1:
+        raise ValueError("There are no entries to build an AlignedTextGrid from.")
+
+    point_groups = []
+    for _, name, tiers in groups:
+        tier_classes = set([tier.tier_class for tier in tiers])
+        if len(tier_classes) > 1:
+            raise ValueError(
+                f"Tier group {repr(name)} has both interval and point tiers."
+            )
+        point_groups.append(POINT_TIER in tier_classes)
+    group_classes = _snapshot_classes(
+        [[tier.name for tier in tiers] for _, _, tiers in groups],
+        point_groups,
+        entry_classes
+    )
+
+    all_tiers = []
+    ordered_classes = []
+    for (_, name, tiers), classes in zip(groups, group_classes):
+        # Order tiers from the top of their class hierarchy down,
+        # so that superset indices refer to the tier above.
+        order = sorted(
+            range(len(tiers)),
+            key = lambda idx: _hierarchy_depth(classes[idx])
+        )
+        tiers = [tiers[idx] for idx in order]
+        ordered_classes.append([classes[idx] for idx in order])
+        _sort_tiers(tiers)
+        for tier in tiers:
+            if name is not None:
+                tier.name = f"{name} - {tier.name}"
+            all_tiers.append(tier)
+
+    tg_data = TextGridData(
+        xmin = min([tier.xmin for tier in all_tiers]),
+        xmax = max([tier.xmax for tier in all_tiers]),
+        tiers = all_tiers
+    )
+    atg = AlignedTextGrid(tg_data, ordered_classes, lazy = lazy)
+
+    renamed = False
+    for tier_group, (_, name, _) in zip(atg.tier_groups, groups):
+        if name is None:
+            continue
+        renamed |= tier_group.name != name
+        tier_group._name = name
+    if renamed:
+        atg._set_group_names()
+    return atg
+
+def from_df(
+        df: pl.DataFrame,
+        entry_classes: Sequence[Type[SequenceInterval|SequencePoint]] = [],
+        lazy: bool = False
+    ) -> AlignedTextGrid:
+    """Build an AlignedTextGrid from a dataframe
+
+    Tiers are built from whole columns, rather than entry by
+    entry. The dataframe can either be
+
+    - In the format returned by [](`~aligned_textgrid.to_df`), with
+      a row for every bottom entry and `start`, `end` and `label`
+      columns prefixed by each entry class name. Each entry's
+      superset entry is taken from its row.
+    - In a long format, with a row for every entry, `start`, `end`
+      and `label` columns, and an `entry_class` (or `tier`) column
+      giving the entry class name. An optional `parent` column
+      gives the index of each entry's superset entry in the tier
+      above. This is the format returned by `to_df()` with
+      `with_subset = False`, and by `TierGroup.to_polars()`.
+
+    An optional `name` column gives the name of each tier group.
+    Groups with the same name are told apart by their `tier_index`
+    column starting over, or in the `to_df()` format, by their start
+    times starting over.
+
+    Where superset entries are known, tiers are related with them
+    rather than by their timing, and they aren't cleaned up. If they
+    are out of order once each tier is sorted by start time, the
+    tiers are related by their timing instead, with a warning.
+    Otherwise, `from_df(to_df(atg))` returns an AlignedTextGrid with
+    the same `to_df()` output as `atg`.
+
+    Examples:
+        ```{python}
+        import polars as pl
+        from aligned_textgrid import Word, Phone, from_df
+
+        df = pl.DataFrame({
+            "Word_label": ["the", "the", "dog", "dog", "dog"],
+            "Word_start": [0.0, 0.0, 0.5, 0.5, 0.5],
+            "Word_end": [0.5, 0.5, 1.0, 1.0, 1.0],
+            "Phone_label": ["DH", "AH0", "D", "AO1", "G"],
+            "Phone_start": [0.0, 0.2, 0.5, 0.6, 0.8],
+            "Phone_end": [0.2, 0.5, 0.6, 0.8, 1.0]
+        })
+        atg = from_df(df, entry_classes = [Word, Phone])
+        print(atg[0].Word[1].sub_labels)
+        ```
+
+    Args:
+        df (pl.DataFrame):
+            The dataframe of tier entries
+        entry_classes (Sequence[Type[SequenceInterval|SequencePoint]], optional):
+            Entry classes to use, matched by class name. `Word` and `Phone`
+            are always matched. For tier groups with other class names,
+            new classes are created with [](`~aligned_textgrid.custom_classes`),
+            from the top of the hierarchy down in the order the tiers appear.
+        lazy (bool, optional):
+            If `True`, tiers aren't related until their entries
+            are first accessed.
+
+    Returns:
+        (AlignedTextGrid): The new AlignedTextGrid
+    """
+    if not isinstance(df, pl.DataFrame):
+        df = pl.DataFrame(df)
+
+    tier_column = None
+    for col in TIER_COLUMNS:
+        if col in df.columns:
+            tier_column = col
+            break
+    if tier_column is None and "start" in df.columns:
+        tier_column = TIER_COLUMNS[0]
+        df = df.with_columns(
+            pl.lit(
+                SequenceInterval.__name__ if "end" in df.columns
+                else SequencePoint.__name__
+            ).alias(tier_column)
+        )
+
+    if GROUP_COLUMN in df.columns:
+        df = df.with_columns(pl.col(GROUP_COLUMN).cast(pl.String))
+    else:
+        df = df.with_columns(pl.lit(None, dtype = pl.String).alias(GROUP_COLUMN))
+    df = df.with_row_index("_row")
+
+    groups = []
+    if tier_column is not None:
+        long_df = df.filter(pl.col(tier_column).is_not_null())
+        if long_df.height > 0:
+            missing = [col for col in ["start", "label"] if not col in df.columns]
+            if len(missing) > 0:
+                raise ValueError(f"The dataframe has no {missing} columns.")
+            groups += _long_groups(long_df, tier_column)
+        df = df.filter(pl.col(tier_column).is_null())
+    if df.height > 0:
+        if not any([col.endswith("_start") for col in df.columns]):
+            raise ValueError("The dataframe has no start time columns.")
+        groups += _wide_groups(df)
+
+    return _from_groups(groups, entry_classes, lazy)
+
+def from_arrays(
+        starts: npt.ArrayLike,
+        ends: npt.ArrayLike|None,
+        labels: Sequence[str],
+        tiers: Sequence[str]|None = None,
+        parents: npt.ArrayLike|None = None,
+        groups: Sequence[str]|None = None,
+        entry_classes: Sequence[Type[SequenceInterval|SequencePoint]] = [],
+        lazy: bool = False
+    ) -> AlignedTextGrid:
+    """Build an AlignedTextGrid from arrays of tier columns
+
+    Each array has one value for every entry, in any tier.
+    See [](`~aligned_textgrid.inputs.from_dataframe.from_df`)
+    for how they are grouped into tiers and related.
+
+    Args:
+        starts (npt.ArrayLike):
+            Start times, or point times
+        ends (npt.ArrayLike | None):
+            End times, `NaN` for entries in point tiers.
+            If `None`, every tier is a point tier.
+        labels (Sequence[str]):
+            Labels
+        tiers (Sequence[str] | None, optional):
+            The entry class name of each entry's tier. If `None`,
+            all entries are in one `SequenceInterval` (or
+            `SequencePoint`) tier.
+        parents (npt.ArrayLike | None, optional):
+            The index of each entry's superset entry in the tier above,
+            or -1. If `None`, tiers are related by their timing.
+        groups (Sequence[str] | None, optional):
+            The name of each entry's tier group.
+        entry_classes (Sequence[Type[SequenceInterval|SequencePoint]], optional):
+            Entry classes to use, matched by class name.
+        lazy (bool, optional):
+            If `True`, tiers aren't related until their entries
+            are first accessed.
+
+    Returns:
+        (AlignedTextGrid): The new AlignedTextGrid
+    """
+    columns = {
+        "start": pl.Series(np.asarray(starts, dtype = np.float64)),
+        "label": pl.Series(labels, dtype = pl.String)
+    }
+    if ends is None:
+        default_tier = SequencePoint.__name__
+    else:
+        default_tier = SequenceInterval.__name__
+        columns["end"] = pl.Series(np.asarray(ends, dtype = np.float64))
+    columns[TIER_COLUMNS[0]] = pl.Series(
+        [default_tier] * len(columns["label"]) if tiers is None else tiers,
+        dtype = pl.String
+    )
+    if parents is not None:
+        columns["parent"] = pl.Series(np.asarray(parents, dtype = np.int64))
+    if groups is not None:
+        columns[GROUP_COLUMN] = pl.Series(groups, dtype = pl.String)
+
+    lengths = set([len(x) for x in columns.values()])
+    if len(lengths) > 1:
+        raise ValueError("All arrays must have the same length.")
+    return from_df(pl.DataFrame(columns), entry_classes, lazy)
@@ -0,0 +1,425 @@
+"""
+Module for reading Praat TextGrid files directly into
+tier columns, without building `praatio` objects.
+"""
+
+import numpy as np
+import numpy.typing as npt
+import re
+from pathlib import Path
+from collections.abc import Sequence
+
+INTERVAL_TIER = "IntervalTier"
+POINT_TIER = "TextTier"
+
+# In the long format, every value follows an `=`.
+_LONG_VALUE = re.compile(r'=\s*("(?:[^"]|"")*"|[^\s"]+)')
+# In the short format, values are separated by whitespace.
+_SHORT_VALUE = re.compile(r'"(?:[^"]|"")*"|[^\s"]+')
+# Each long format tier starts with an `item [n]:` line.
+_ITEM = re.compile(r'item \[\d+\]:[ \t]*$', re.M)
+
+class TierData:
+    """The columns of a single TextGrid tier
+
+    Args:
+        name (str):
+            The tier name
+        tier_class (str):
+            Either `"IntervalTier"` or `"TextTier"`
+        xmin (float):
+            The tier start time
+        xmax (float):
+            The tier end time
+        starts (npt.NDArray):
+            Interval start times, or point times
+        ends (npt.NDArray | None):
+            Interval end times. `None` for point tiers.
+        labels (list[str]):
+            Interval or point labels
+        parents (npt.NDArray | None, optional):
+            For each entry, the index of its superset entry in
+            the tier above, or -1. `None` if this isn't known.
+
+    Attributes:
+        entries (int):
+            The number of intervals or points
+    """
+    def __init__(
+            self,
+            name: str,
+            tier_class: str,
+            xmin: float,
+            xmax: float,
+            starts: npt.NDArray,
+            ends: npt.NDArray|None,
+            labels: list[str],
+            parents: npt.NDArray|None = None
+        ):
+        self.name = name
+        self.tier_class = tier_class
+        self.xmin = xmin
+        self.xmax = xmax
+        self.starts = starts
+        self.ends = ends
+        self.labels = labels
+        self.parents = parents
+
+    def __repr__(self) -> str:
+        return f"{self.tier_class} {repr(self.name)} with {len(self.labels)} entries"
+
+    @property
+    def entries(self) -> int:
+        return len(self.labels)
+
+class TextGridData:
+    """The tiers of a TextGrid file
+
+    Args:
+        xmin (float):
+            The TextGrid start time
+        xmax (float):
+            The TextGrid end time
+        tiers (list[TierData]):
+            The tiers, in file order
+        cleaned (bool, optional):
+            Whether the tiers were already cleaned up, as when
+            they're stored from an AlignedTextGrid.
+
+    Attributes:
+        tier_names (list[str]):
+            The tier names, in file order
+        related (bool):
+            Whether the superset entry of every entry is known
+    """
+    def __init__(
+            self,
+            xmin: float,
+            xmax: float,
+            tiers: list[TierData],
+            cleaned: bool = False
+        ):
+        self.xmin = xmin
+        self.xmax = xmax
+        self.tiers = tiers
+        self.cleaned = cleaned
+
+    def __repr__(self) -> str:
+        return f"TextGridData with {len(self.tiers)} tiers {repr(self.tier_names)}"
+
+    @property
+    def tier_names(self) -> list[str]:
+        return [tier.name for tier in self.tiers]
+
+    @property
+    def related(self) -> bool:
+        return len(self.tiers) > 0 and \
+            all([tier.parents is not None for tier in self.tiers])
+
+def tier_selected(
+        name: str,
+        include_tiers: Sequence[str]|None = None
+    ) -> bool:
+    """Check whether a tier name is selected
+
+    Args:
+        name (str):
+            A tier name
+        include_tiers (Sequence[str] | None, optional):
+            Tier names or regular expressions. A tier is selected
+            if its name is equal to, or fully matches, any of them.
+            If `None`, every tier is selected.
+
+    Returns:
+        (bool): Whether the tier is selected
+    """
+    if include_tiers is None:
+        return True
+    if isinstance(include_tiers, str):
+        include_tiers = [include_tiers]
+    return any(
+        name == pattern or re.fullmatch(pattern, name)
+        for pattern in include_tiers
+    )
+
+def _decode(raw: bytes) -> str:
+    if raw.startswith((b"\xff\xfe", b"\xfe\xff")):
+        return raw.decode("utf-16")
+    try:
+        return raw.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        return raw.decode("utf-16")
+
+def _unquote(value: str) -> str:
+    if not value.startswith('"'):
+        raise ValueError(f"Expected a quoted string in TextGrid, found {value}")
+    return value[1:-1].replace('""', '"')
+
+def _entry_order(
+        starts: npt.NDArray,
+        ends: npt.NDArray|None,
+        labels: list[str]
+    ) -> npt.NDArray|None:
+    """Get the order that sorts entries by time, then label,
+    or `None` if they are already in order.
+    """
+    if np.all(starts[1:] > starts[:-1]):
+        return None
+    if ends is None:
+        keys = list(zip(starts.tolist(), labels))
+    else:
+        keys = list(zip(starts.tolist(), ends.tolist(), labels))
+    order = sorted(range(len(keys)), key = keys.__getitem__)
+    return np.array(order, dtype = np.int64)
+
+def _check_intervals(
+        name: str,
+        starts: npt.NDArray,
+        ends: npt.NDArray,
+        labels: list[str]
+    ) -> None:
+    """Check that the intervals of a tier, sorted by start time,
+    each end after they start and don't overlap.
+    """
+    if np.any(starts >= ends):
+        idx = int(np.argmax(starts >= ends))
+        raise ValueError(
+            f"In tier {repr(name)}, the start time of an interval "
+            f"({starts[idx]}) cannot occur after its end time ({ends[idx]})"
+        )
+    if np.any(ends[:-1] > starts[1:]):
+        idx = int(np.argmax(ends[:-1] > starts[1:]))
+        raise ValueError(
+            f"In tier {repr(name)}, two intervals overlap in time: "
+            f"({starts[idx]}, {ends[idx]}, {labels[idx]}) and "
+            f"({starts[idx+1]}, {ends[idx+1]}, {labels[idx+1]})"
+        )
+
+def _make_tier(
+        tier_class: str,
+        name: str,
+        xmin: float,
+        xmax: float,
+        values: list[str]
+    ) -> TierData:
+    if tier_class == INTERVAL_TIER:
+        # -0 has been seen as a start time, and adding
+        # 0 turns it into a plain 0.
+        starts = np.array(values[0::3], dtype = np.float64) + 0.0
+        ends = np.array(values[1::3], dtype = np.float64) + 0.0
+        labels = [_unquote(x).strip() for x in values[2::3]]
+    else:
+        starts = np.array(values[0::2], dtype = np.float64) + 0.0
+        ends = None
+        labels = [_unquote(x).strip() for x in values[1::2]]
+
+    order = _entry_order(starts, ends, labels)
+    if order is not None:
+        starts = starts[order]
+        labels = [labels[idx] for idx in order]
+        if ends is not None:
+            ends = ends[order]
+
+    if ends is not None:
+        _check_intervals(name, starts, ends, labels)
+
+    return TierData(
+        name = name,
+        tier_class = tier_class,
+        xmin = xmin,
+        xmax = xmax,
+        starts = starts,
+        ends = ends,
+        labels = labels
+    )
+
+def _long_sections(
+        data: str,
+        body_idx: int
+    ) -> list[tuple[int, int]]|None:
+    """Find the start and end of each `item [n]:` section
+    of a long format TextGrid, so that tiers can be skipped
+    without reading their entries.
+    """
+    headings = []
+    in_quote = False
+    last = body_idx
+    idx = data.find("item [", body_idx)
+    while idx >= 0:
+        match = _ITEM.match(data, idx)
+        if match:
+            # A section heading can't be inside a label.
+            in_quote ^= data.count('"', last, idx) % 2 == 1
+            last = idx
+            if not in_quote:
+                headings.append((idx, match.end()))
+        idx = data.find("item [", idx + 1)
+    if len(headings) < 1:
+        return None
+    ends = [heading_start for heading_start, _ in headings[1:]] + [len(data)]
+    return [
+        (heading_end, end)
+        for (_, heading_end), end in zip(headings, ends)
+    ]
+
+def _token_tiers(
+        values: list[str],
+        n_tiers: int
+    ):
+    """Yield the header values of each tier, and a function
+    returning its entry values, from a list of all values.
+    """
+    idx = 3
+    for _ in range(n_tiers):
+        head = values[idx:idx+5]
+        idx += 5
+        if len(head) < 5:
+            yield head, None
+            return
+        width = 3 if _unquote(head[0]) == INTERVAL_TIER else 2
+        size = int(head[4]) * width
+        tier_values = values[idx:idx+size]
+        idx += size
+        yield head, lambda tier_values = tier_values: tier_values
+
+def _section_tiers(
+        data: str,
+        sections: list[tuple[int, int]]
+    ):
+    """Yield the header values of each tier, and a function
+    returning its entry values, from long format sections.
+    """
+    for start, end in sections:
+        head = []
+        body_start = start
+        for match in _LONG_VALUE.finditer(data, start, end):
+            head.append(match.group(1))
+            body_start = match.end()
+            if len(head) == 5:
+                break
+        yield head, lambda body_start = body_start, end = end: \
+            _LONG_VALUE.findall(data, body_start, end)
+
+def parse_textgrid(
+        data: str,
+        include_tiers: Sequence[str]|None = None
+    ) -> TextGridData:
+    """Parse the text of a long or short format TextGrid
+
+    Args:
+        data (str):
+            The contents of a TextGrid file
+        include_tiers (Sequence[str] | None, optional):
+            Tier names or regular expressions for the tiers to keep.
+            Other tiers are skipped without converting their values.
+
+    Returns:
+        (TextGridData): The parsed TextGrid
+    """
+    if not "ooTextFile" in data or not "TextGrid" in data:
+        raise ValueError("Only text TextGrid files can be read.")
+
+    class_idx = data.index("TextGrid", data.index("ooTextFile"))
+    body_idx = data.find("\n", class_idx)
+    if body_idx < 0:
+        body_idx = len(data)
+
+    header = data[:body_idx]
+    is_short = "ooTextFile short" in header or "item [" not in data
+    sections = None if is_short else _long_sections(data, body_idx)
+    if sections is None:
+        values = [
+            x
+            for x in (_SHORT_VALUE if is_short else _LONG_VALUE).findall(data, body_idx)
+            if not x.startswith("<")
+        ]
+        tg_values = values[:3]
+    else:
+        tg_values = _LONG_VALUE.findall(data, body_idx, sections[0][0])
+
+    xmin = float(tg_values[0])
+    xmax = float(tg_values[1])
+    n_tiers = int(tg_values[2]) if len(tg_values) > 2 else 0
+
+    if sections is not None and len(sections) != n_tiers:
+        raise ValueError(
+            f"TextGrid should have {n_tiers} tiers, but {len(sections)} were found."
+        )
+
+    if sections is None:
+        tier_chunks = _token_tiers(values, n_tiers)
+    else:
+        tier_chunks = _section_tiers(data, sections)
+
+    tiers = []
+    tier_names = set()
+    for head, get_values in tier_chunks:
+        if len(head) < 5:
+            raise ValueError("The TextGrid file ended early.")
+        tier_class = _unquote(head[0])
+        name = _unquote(head[1])
+        if is_short:
+            name = name.strip()
+
+        # Duplicated names get a numeric suffix,
+        # as with `praatio`'s "rename" mode.
+        new_name = name
+        suffix = 2
+        while new_name in tier_names:
+            new_name = f"{name}_{suffix}"
+            suffix += 1
+        tier_names.add(new_name)
+
+        if not tier_selected(new_name, include_tiers):
+            continue
+
+        tier_xmin = float(head[2])
+        tier_xmax = float(head[3])
+        n_entries = int(head[4])
+        width = 3 if tier_class == INTERVAL_TIER else 2
+        tier_values = get_values()
+        if len(tier_values) != n_entries * width:
+            raise ValueError(
+                f"Tier {repr(name)} should have {n_entries} entries, "
+                f"but {len(tier_values) // width} were found."
+            )
+
+        tiers.append(
+            _make_tier(tier_class, new_name, tier_xmin, tier_xmax, tier_values)
+        )
+
+    return TextGridData(xmin = xmin, xmax = xmax, tiers = tiers)
+
+def read_textgrid(
+        path: str|Path,
+        include_tiers: Sequence[str]|None = None
+    ) -> TextGridData:
+    """Read a long or short format TextGrid file
+
+    The file is read in a single pass, and every tier's
+    start times, end times and labels are returned as columns.
+    Tiers with duplicated names are renamed as `praatio`
+    does, by appending `_2`, `_3`, etc.
+
+    Examples:
+        ```{python}
+        from aligned_textgrid.inputs.read_textgrid import read_textgrid
+
+        tg_data = read_textgrid("../usage/resources/the_dog.TextGrid")
+        print(tg_data)
+        ```
+
+    Args:
+        path (str | Path):
+            Path to a TextGrid file. UTF-8 and UTF-16
+            encoded files can be read.
+        include_tiers (Sequence[str] | None, optional):
+            Tier names or regular expressions for the tiers to keep.
+            See [](`~aligned_textgrid.inputs.read_textgrid.tier_selected`).
+            Other tiers are skipped while parsing.
+
+    Returns:
+        (TextGridData): The parsed TextGrid
+    """
+    raw = Path(path).read_bytes()
+    return parse_textgrid(_decode(raw), include_tiers = include_tiers)
@@ -1,6 +1,7 @@
 from praatio.utilities.constants import Interval, Point
 from praatio.data_classes.interval_tier import IntervalTier
 from praatio.data_classes.point_tier import PointTier
+from aligned_textgrid.sequence_list import SequenceList
 from typing import Type, Any, TYPE_CHECKING, TypeVar
 import warnings
 import sys
@@ -17,6 +18,46 @@ PraatioType = TypeVar("PraatioType", Interval, Point)
 
 class SequenceBaseClass:
 
+    # Instance fields are declared as __slots__ on
+    # SequenceInterval and SequencePoint. Those include
+    # `_listed`, which holds weak references to the 
+    # SequenceLists an entry has been placed in, so that 
+    # later edits can update their cached columns.
+    __slots__ = ()
+
+    # Set on the shared `#` edge entries, which can't be edited.
+    _frozen = False
+
+    @property
+    def label(self)->Any:
+        return self._label
+    
+    @label.setter
+    def label(self, label:Any):
+        self._label = label
+        self._edited()
+
+    def __getstate__(self)->tuple:
+        # Weak references can't be pickled, and a copy
+        # isn't in the original's lists anyway.
+        slots = {}
+        for cls in type(self).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                if name in ("__dict__", "__weakref__"):
+                    continue
+                if hasattr(self, name):
+                    slots[name] = getattr(self, name)
+        slots["_listed"] = None
+        return (getattr(self, "__dict__", None) or None, slots)
+
+    def _edited(self, old_start:float|None = None)->None:
+        if self._listed is not None:
+            SequenceList._notify_edit(self, old_start)
+        elif self._frozen:
+            raise AttributeError(
+                f"The '#' edge entry of {type(self).__name__} can't be modified."
+            )
+
     @classmethod
     def _cast(cls, obj:SeqType, re_init = False)->SeqType:
         if not isinstance(obj, SequenceBaseClass):
@@ -43,6 +84,7 @@ class PrecedenceMixins:
         first (SequenceInterval): The first interval in the subset list
         last (SequenceInterval): The last interval in the subset list
     """
+    __slots__ = ()
 
     @property
     def first(self)->'SequenceInterval':
@@ -110,17 +152,34 @@ class PrecedenceMixins:
         else:
             raise Exception(f"Previous segment must be an instance of {type(self).__name__}")
     
+    @classmethod
+    def _edge(cls)->SeqType:
+        """The `#` entry shared by all instances of a class
+        as their `prev` or `fol` at the edge of a sequence.
+
+        It's stored in the class's own namespace, so a
+        copied namespace (from `custom_classes()` or
+        `clone_class()`) gets its own on first use.
+        """
+        edge = cls.__dict__.get("_edge_entry")
+        if type(edge) is cls:
+            return edge
+        
+        if "Interval" in cls._seq_type.__name__:
+            edge = cls(Interval(None, None, "#"))
+        elif "Point" in cls._seq_type.__name__:
+            edge = cls(Point(None, "#"))
+        edge._frozen = True
+        cls._edge_entry = edge
+        return edge
+
     def set_final(self)->None:
         """Sets the current object as having no `fol` entry
         
         While `self.fol` is defined for these entries, the actual
         instance does not appear in `self.super_instance.subset_list`
         """
-        
-        if "Interval" in self._seq_type.__name__:
-            self.set_fol(type(self)(Interval(None, None, "#")))
-        elif "Point" in self._seq_type.__name__:
-            self.set_fol(type(self)(Point(None, "#")))
+        self.set_fol(type(self)._edge())
 
     def set_initial(self)->None:
         """Sets the current object as having no `prev` entry
@@ -128,10 +187,25 @@ class PrecedenceMixins:
         While `self.prev` is defined for these entries, the actual 
         instance does not appear in `self.super_instance.subset_list`
         """
-        if "Interval" in self._seq_type.__name__:
-            self.set_prev(type(self)(Interval(None, None, "#")))
-        elif "Point" in self._seq_type.__name__:
-            self.set_prev(type(self)(Point(None, "#")))
+        self.set_prev(type(self)._edge())
+
+    @classmethod
+    def _link_entries(cls, entries:list[SeqType])->None:
+        """Link a run of entries of this class in order, with
+        the first and last linked to the edge entry.
+
+        This gives the same links as calling `set_initial()`,
+        `set_prev()`, `set_fol()` and `set_final()` on each entry 
+        in turn, but sets them in one pass.
+        """
+        edge = cls._edge()
+        prevs = [edge] + entries[:-1]
+        fols = entries[1:] + [edge]
+        for entry, prev, fol in zip(entries, prevs, fols):
+            # `#` entries aren't linked to their neighbors
+            if entry.label != "#":
+                entry.prev = prev
+                entry.fol = fol
 
 class InTierMixins:
     """Methods and attrubites relating `Sequence*` objects to tiers.
@@ -140,12 +214,13 @@ class InTierMixins:
         tier_index (int):
           Index of the current entry within its tier
     """
+    __slots__ = ()
 
     ## Tier operations
     @property
     def tier_index(self:SeqType)->int:
         if not self.intier is None:
-            return self.intier.index(self)
+            return self.intier.sequence_list.index(self)
         else:
             return None
     
@@ -4,6 +4,8 @@ from functools import reduce
 import re
 import warnings
 import numpy as np
+import numpy.typing as npt
+import polars as pl
 import sys
 from collections.abc import Sequence
 if sys.version_info >= (3,11):
@@ -24,6 +26,10 @@ if TYPE_CHECKING:
 TierType = TypeVar("TierType", 'SequenceTier', 'SequencePointTier')
 TierGroupType = TypeVar("TierGroupType", 'TierGroup', 'PointsGroup')
 
+def _read_only(array: npt.NDArray) -> npt.NDArray:
+    view = array.view()
+    view.flags.writeable = False
+    return view
 
 
 class TierMixins:
@@ -106,8 +112,7 @@ class TierMixins:
         if new in self:
             return
         
-        ## triggers precedence resetting
-        self.sequence_list += [new]
+        self._insert_entry(new)
         if hasattr(new, "subset_list") \
            and len(new) > 0 \
            and self.within:
@@ -126,6 +131,42 @@ class TierMixins:
 
 
 
+    def _insert_entry(self, new:'SequenceInterval|SequencePoint')->None:
+        """Insert an entry into the tier's SequenceList in place,
+        and link it to the entries on either side of it.
+        """
+        seq_list = self.sequence_list
+        n = len(seq_list)
+        seq_list.append(new)
+        if len(seq_list) == n:
+            # an entry equal in value was already in the tier
+            return
+        idx = seq_list.index(new)
+
+        new.intier = self
+        new.tiername = self.name
+        if idx == 0:
+            new.set_initial()
+        else:
+            new.set_prev(seq_list[idx-1])
+        if idx == len(seq_list)-1:
+            new.set_final()
+        else:
+            new.set_fol(seq_list[idx+1])
+        if getattr(self, "_contains", None) is seq_list:
+            new.within = self
+
+        if hasattr(new, "end"):
+            starts = seq_list.starts
+            ends = seq_list.ends
+            lo = max(idx-1, 0)
+            hi = min(idx+2, len(seq_list))
+            if np.any(ends[lo:hi-1] > starts[lo+1:hi]):
+                warnings.warn(
+                    "Some intervals provided overlap in time. "
+                    f"{new} overlaps a neighboring interval."
+                )
+
     def concat(self:TierType, new:TierType):
         """Horizontally concatenate a new tier.
 
@@ -147,6 +188,27 @@ class TierMixins:
 
         self.sequence_list = lhs
 
+    def index(
+            self, 
+            entry:'SequenceInterval|SequencePoint', 
+            start:int = 0, 
+            stop:int|None = None
+        )->int:
+        """Get the index of an entry in the tier
+
+        Args:
+            entry (SequenceInterval|SequencePoint):
+                The entry to find.
+            start (int, optional):
+                Only search from this index. Defaults to 0.
+            stop (int | None, optional):
+                Only search up to this index. Defaults to None.
+
+        Returns:
+            (int): The index of `entry`
+        """
+        return self.sequence_list.index(entry, start, stop)
+
     @property
     def first(self) -> 'SequenceInterval|SequencePoint':
         if hasattr(self, "sequence_list") and len(self.sequence_list) > 0:
@@ -164,9 +226,48 @@ class TierMixins:
             raise IndexError(f"{type(self).__name__} tier with name"\
                              f" {self.name} has empty sequence_list")
         raise AttributeError(f"{type(self).__name__} is not indexable.")
-    
 
-    
+    def to_numpy(self) -> dict[str, npt.NDArray]:
+        """Get the tier's columns as NumPy arrays
+
+        Start and end times are read-only views of the arrays the tier
+        already keeps, so they aren't copied, and lazy tiers don't create
+        their entries. Labels are converted to a `StringDType` array.
+
+        Returns:
+            (dict[str, npt.NDArray]):
+                `"start"`, `"end"` (for interval tiers) and `"label"` arrays.
+        """
+        arrays = {
+            name: _read_only(column)
+            for name, column in self._column_arrays().items()
+        }
+        arrays["label"] = _read_only(
+            np.array(self.labels, dtype = np.dtypes.StringDType())
+        )
+        return arrays
+
+    def to_polars(self) -> pl.DataFrame:
+        """Get the tier's columns as a polars DataFrame
+
+        The time columns share memory with the tier's arrays. Polars
+        DataFrames are Arrow record batches, and can be read by other
+        Arrow libraries (e.g. `pyarrow.table()`) without copying. A tier
+        can also be passed to them directly.
+
+        Returns:
+            (pl.DataFrame):
+                `start`, `end` (for interval tiers) and `label` columns.
+        """
+        columns = [
+            pl.Series(name, _read_only(column), dtype = pl.Float64)
+            for name, column in self._column_arrays().items()
+        ]
+        columns.append(pl.Series("label", self.labels, dtype = pl.String))
+        return pl.DataFrame(columns)
+
+    def __arrow_c_stream__(self, requested_schema = None):
+        return self.to_polars().__arrow_c_stream__(requested_schema)
 
 class TierGroupMixins:
     """Methods and attributes for grouped tiers
@@ -295,16 +396,23 @@ class TierGroupMixins:
         """
         self._class_check(new)
         increment = self.xmax
+
+        # Shifting the top-most entries shifts
+        # everything they contain as well.
         for t1, t2 in zip(self, new):
-            for interval in t2:
-                if interval.super_instance is not None:
+            for entry in t2:
+                if getattr(entry, "super_instance", None) is not None:
                     continue
-                if interval in t1:
+                if entry in t1:
                     continue
-                interval._shift(increment)
-                t1.append(interval)
-
+                entry._shift(increment)
 
+        for t1, t2 in zip(self, new):
+            sequence_list = t1.sequence_list
+            sequence_list.extend(t2.sequence_list)
+            t1.sequence_list = sequence_list
+        
+        self.re_relate()
 
     def _set_tier_names(self):
         entry_class_names = [x.__name__ for x in self.entry_classes]
@@ -340,6 +448,60 @@ class TierGroupMixins:
 
     def re_relate(self):
         self.__init__(self)
+
+    def to_numpy(self) -> dict[str, dict[str, npt.NDArray]]:
+        """Get the columns of each tier as NumPy arrays
+
+        See [](`~aligned_textgrid.mixins.tiermixins.TierMixins.to_numpy`).
+        In a `TierGroup`, each tier also has a `"parent"` array with the
+        index of each entry's superset entry in the tier above, or -1.
+        Lazy groups whose superset indices are already known (e.g. loaded
+        from a snapshot) aren't related to get them.
+
+        Returns:
+            (dict[str, dict[str, npt.NDArray]]):
+                The arrays of each tier, by entry class name.
+        """
+        parents = None
+        if hasattr(self, "_superset_indices"):
+            parents = self._superset_indices()
+        arrays = {}
+        for idx, tier in enumerate(self.tier_list):
+            tier_arrays = tier.to_numpy()
+            if parents is not None:
+                tier_arrays["parent"] = _read_only(parents[idx])
+            arrays[tier.entry_class.__name__] = tier_arrays
+        return arrays
+
+    def to_polars(self) -> pl.DataFrame:
+        """Get the columns of every tier as one polars DataFrame
+
+        The rows of each tier are stacked, with a `tier` column
+        giving their entry class name, and in a `TierGroup`, a
+        `parent` column. See
+        [](`~aligned_textgrid.mixins.tiermixins.TierGroupMixins.to_numpy`).
+
+        Returns:
+            (pl.DataFrame): The columns of every tier
+        """
+        parents = None
+        if hasattr(self, "_superset_indices"):
+            parents = self._superset_indices()
+        frames = []
+        for idx, tier in enumerate(self.tier_list):
+            df = tier.to_polars()
+            if parents is not None:
+                df = df.with_columns(
+                    parent = pl.Series(_read_only(parents[idx]), dtype = pl.Int64)
+                )
+            frames.append(df.select(
+                pl.lit(tier.entry_class.__name__, dtype = pl.String).alias("tier"),
+                pl.all()
+            ))
+        return pl.concat(frames, how = "vertical")
+
+    def __arrow_c_stream__(self, requested_schema = None):
+        return self.to_polars().__arrow_c_stream__(requested_schema)
     
     def get_longest_name_string(
             self,
@@ -26,6 +26,7 @@ class WithinMixins:
         id (str):
             An id derived from the `within_path`.
     """
+    __slots__ = ()
 
     @property
     def within(self)->Within:
@@ -56,25 +57,47 @@ class WithinMixins:
     @property
     def within_index(self)->int:
         if hasattr(self, "_within") and hasattr(self.within, "_contains"):
-            return self.within.contains.index(self)
+            contains = self.within.contains
+            idx = getattr(self, "_within_index", None)
+            if idx is not None \
+                and idx < len(contains) \
+                and contains[idx] is self:
+                return idx
+            idx = contains.index(self)
+            self._within_index = idx
+            return idx
         return None
     
-    def _get_within_path(self, obj:Contained)->list[int]:
-        path = []
-        if not obj.within_index is None:
-            path += [obj.within_index]
-            path += self._get_within_path(obj.within)
-            return path
+    def _cached_path(self)->tuple:
+        """Get the within path and id of the current object,
+        as a `(container path, path, id)` tuple.
+
+        These are cached on each object, and reused while its
+        `within_index` is unchanged and its container's cached
+        path is the same tuple, so they're built top down.
+        """
+        idx = self.within_index
+        if idx is None:
+            return ((), (), "")
+        
+        within = self.within
+        upper_path = within._cached_path()[1] \
+            if isinstance(within, WithinMixins) else ()
+        cached = getattr(self, "_id", None)
+        if cached is not None \
+            and cached[0] is upper_path \
+            and cached[1][-1] == idx:
+            return cached
         
-        return path
+        path = upper_path + (idx,)
+        cached = (upper_path, path, "-".join([str(x) for x in path]))
+        self._id = cached
+        return cached
 
     @property
     def within_path(self)->list[int]:
-        path =  self._get_within_path(obj = self)
-        path.reverse()
-        return path
+        return list(self._cached_path()[1])
     
     @property
     def id(self)->str:
-        path = self.within_path
-        return "-".join([str(x) for x in path])
\ No newline at end of file
+        return self._cached_path()[2]
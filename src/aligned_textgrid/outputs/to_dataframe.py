@@ -1,4 +1,6 @@
 import polars as pl
+import numpy as np
+import numpy.typing as npt
 from aligned_textgrid import SequenceInterval, \
                              SequencePoint, \
                              SequenceTier, \
@@ -7,86 +9,244 @@ from aligned_textgrid import SequenceInterval, \
 
 from aligned_textgrid.sequences.tiers import TierGroup
 from aligned_textgrid.points.tiers import PointsGroup
+from collections.abc import Sequence
 
+COLUMNS = [
+    "id",
+    "tier_index",
+    "label",
+    "start",
+    "end"
+]
+COLUMN_TYPES = {
+    "id": pl.String,
+    "tier_index": pl.Int64,
+    "label": pl.String,
+    "start": pl.Float64,
+    "end": pl.Float64
+}
 
-def sequence_to_df(
-        obj: SequenceInterval | SequencePoint,
-        with_subset: bool = True
-        ) -> pl.DataFrame:
-    
-    attributes_to_get = [
-        "id",
-        "tier_index",
-        "label",
-        "start", 
-        "end"
-    ]
+def _select_columns(
+        columns: Sequence[str]|None
+    ) -> list[str]:
+    if columns is None:
+        return list(COLUMNS)
+    if isinstance(columns, str):
+        columns = [columns]
+    unknown = [x for x in columns if not x in COLUMNS]
+    if len(unknown) > 0:
+        raise ValueError(
+            f"Unknown columns {unknown}. columns must be from {COLUMNS}."
+        )
+    if len(columns) < 1:
+        raise ValueError("At least one column must be selected.")
+    return [x for x in COLUMNS if x in columns]
 
-    class_name = type(obj).__name__
+def _level_frame(
+        values: dict[str, Sequence|npt.NDArray|pl.Series],
+        columns: list[str],
+        level: int,
+        parents: npt.NDArray|None,
+        prefix: str|None
+    ) -> pl.DataFrame:
+    """Make a dataframe for one level of the hierarchy, with
+    internal `_row` and `_parent` columns for joining levels.
+    """
+    n = len(values["label"])
+    data = {f"_row{level}": pl.Series(np.arange(n), dtype = pl.Int64)}
+    if parents is not None:
+        data[f"_parent{level}"] = pl.Series(parents, dtype = pl.Int64)
+    for col in columns:
+        if not col in values:
+            continue
+        name = col if prefix is None else f"{prefix}_{col}"
+        data[name] = pl.Series(values[col], dtype = COLUMN_TYPES[col])
+    return pl.DataFrame(data)
 
-    if isinstance(obj, SequencePoint):
-        attributes_to_get.pop(
-            attributes_to_get.index("end")
+def _join_levels(
+        frames: list[pl.DataFrame]
+    ) -> pl.DataFrame:
+    """Join each level onto the one above it, repeating each entry
+    for every entry it contains.
+    """
+    out = frames[0]
+    for level, frame in enumerate(frames[1:], start = 1):
+        out = out.join(
+            frame,
+            left_on = f"_row{level-1}",
+            right_on = f"_parent{level}",
+            how = "left",
+            maintain_order = "left_right"
         )
+    return out.select(pl.exclude("^_(row|parent)\\d+$"))
 
-    col_names = attributes_to_get
-    if isinstance(obj, SequenceInterval) and with_subset:
-        col_names = [
-            f"{class_name}_{att}" for att in attributes_to_get
-        ]
+def _tier_ids(
+        tier: SequenceTier|SequencePointTier,
+        parents: npt.NDArray|None = None,
+        upper_ids: pl.Series|None = None
+    ) -> pl.Series:
+    """Get the `id` of every entry in a tier. Entries within
+    a superset entry extend its id with their index in its
+    subset list. Other entries extend the tier's id.
+    """
+    n = len(tier)
+    tier_id = tier.id
+    tier_prefix = f"{tier_id}-" if tier_id else ""
+    index = pl.int_range(pl.len(), dtype = pl.Int64)
+    df = pl.DataFrame({
+        "parent": pl.Series(
+            np.full(n, -1, dtype = np.int64) if parents is None else parents,
+            dtype = pl.Int64
+        )
+    })
+    own_id = pl.lit(tier_prefix) + index.cast(pl.String)
+    if upper_ids is None or len(upper_ids) < 1:
+        return df.select(own_id.alias("id")).to_series()
 
+    df = df.with_columns(
+        upper_id = upper_ids.gather(np.maximum(df["parent"].to_numpy(), 0))
+    )
+    within_index = index.over("parent")
+    return df.select(
+        pl.when(pl.col("parent") >= 0)
+        .then(pl.concat_str([pl.col("upper_id"), within_index], separator = "-"))
+        .otherwise(own_id)
+        .alias("id")
+    ).to_series()
 
-    sub_df_rows = None
-    if len(obj.contains) > 0 and with_subset:
-        sub_df_list = [sequence_to_df(x) for x in obj.contains]
-        sub_df = pl.concat(sub_df_list, how="diagonal")
-        sub_df_rows = sub_df.shape[0]
+def _tier_values(
+        tier: SequenceTier|SequencePointTier,
+        columns: list[str],
+        ids: pl.Series|None
+    ) -> dict[str, Sequence|npt.NDArray|pl.Series]:
+    values = {"label": list(tier.labels)}
+    if "id" in columns:
+        values["id"] = ids
+    if "tier_index" in columns:
+        values["tier_index"] = np.arange(len(tier))
+    if "start" in columns:
+        values["start"] = tier.times if isinstance(tier, SequencePointTier) \
+            else tier.starts
+    if "end" in columns and isinstance(tier, SequenceTier):
+        values["end"] = tier.ends
+    return values
 
-    out_dict = {
-        att: getattr(obj, att)
-        for att in attributes_to_get
-    }
+def _tier_levels(
+        tier: SequenceTier|SequencePointTier,
+        with_subset: bool
+    ) -> tuple[list[SequenceTier|SequencePointTier], list[npt.NDArray|None], int]:
+    """Get the tiers from the top of a tier's group down to the tier,
+    or down to the bottom if `with_subset`, along with their parent
+    indices and the position of the tier.
+    """
+    group = tier.within
+    if not isinstance(group, TierGroup) or not tier in group.tier_list:
+        return [tier], [None], 0
+    tier_idx = group.tier_list.index(tier)
+    end = len(group.tier_list) if with_subset else tier_idx + 1
+    return group.tier_list[:end], group._superset_indices()[:end], tier_idx
 
-    df = pl.DataFrame(out_dict, schema=col_names)
-    if sub_df_rows:
-        df = df.with_columns(
-            n=pl.lit(sub_df_rows)
-        ).select(
-            pl.exclude("n").repeat_by("n").explode()
-        )
-        df = pl.concat([df, sub_df], how="horizontal")
+def _entry_values(
+        entries: list[SequenceInterval|SequencePoint],
+        columns: list[str]
+    ) -> dict[str, list]:
+    values = {"label": [entry.label for entry in entries]}
+    for col in columns:
+        if col == "end" and any([isinstance(x, SequencePoint) for x in entries]):
+            continue
+        values[col] = [getattr(entry, col) for entry in entries]
+    return values
+
+def sequence_to_df(
+        obj: SequenceInterval | SequencePoint,
+        with_subset: bool = True,
+        columns: Sequence[str]|None = None
+        ) -> pl.DataFrame:
+    columns = _select_columns(columns)
+    class_name = type(obj).__name__
 
     if isinstance(obj, SequencePoint) or not with_subset:
-        df = df.with_columns(
+        df = _level_frame(_entry_values([obj], columns), columns, 0, None, None)
+        return df.select(
+            pl.exclude("_row0"),
             entry_class = pl.lit(class_name)
         )
 
-    return df
-
+    # Each level holds the entries contained by the level above.
+    frames = []
+    entries = [obj]
+    parents = None
+    while len(entries) > 0:
+        frames.append(_level_frame(
+            _entry_values(entries, columns),
+            columns,
+            len(frames),
+            parents,
+            type(entries[0]).__name__
+        ))
+        parents = [
+            idx
+            for idx, entry in enumerate(entries)
+            for _ in entry.contains
+        ]
+        entries = [x for entry in entries for x in entry.contains]
+    return _join_levels(frames)
 
 def tier_to_df(
-        obj: SequenceInterval | SequencePointTier,
-        with_subset: bool = True
+        obj: SequenceTier | SequencePointTier,
+        with_subset: bool = True,
+        columns: Sequence[str]|None = None
         ) -> pl.DataFrame:
-    
-    all_interval_dfs = [
-        sequence_to_df(x, with_subset) for x in obj
-    ]
+    columns = _select_columns(columns)
+    tiers, parents, tier_idx = _tier_levels(obj, with_subset)
 
-    out_df = pl.concat(all_interval_dfs, how="diagonal")
-    return out_df
+    # Ids depend on the ids of superset entries,
+    # so they're found from the top tier down.
+    ids = [None] * len(tiers)
+    if "id" in columns:
+        upper_ids = None
+        for idx, tier in enumerate(tiers):
+            ids[idx] = _tier_ids(tier, parents[idx], upper_ids)
+            upper_ids = ids[idx]
+
+    if isinstance(obj, SequencePointTier) or not with_subset:
+        df = _level_frame(
+            _tier_values(obj, columns, ids[tier_idx]),
+            columns,
+            0,
+            None,
+            None
+        )
+        return df.select(
+            pl.exclude("_row0"),
+            entry_class = pl.lit(obj.entry_class.__name__)
+        )
+
+    frames = [
+        _level_frame(
+            _tier_values(tier, columns, ids[idx]),
+            columns,
+            idx - tier_idx,
+            None if idx == tier_idx else parents[idx],
+            tier.entry_class.__name__
+        )
+        for idx, tier in enumerate(tiers)
+        if idx >= tier_idx
+    ]
+    return _join_levels(frames)
 
 
 def tiergroup_to_df(
         obj: TierGroup | PointsGroup,
-        with_subset: bool = True
+        with_subset: bool = True,
+        columns: Sequence[str]|None = None
         ) -> pl.DataFrame:
 
     if isinstance(obj, TierGroup) and with_subset:
-        out_df = tier_to_df(obj[0], with_subset)
+        out_df = tier_to_df(obj[0], with_subset, columns)
     else:
         all_df = [
-            tier_to_df(x, with_subset) for x in obj
+            tier_to_df(x, with_subset, columns) for x in obj
         ]
         out_df = pl.concat(all_df, how = "diagonal")
 
@@ -100,11 +260,12 @@ def tiergroup_to_df(
 
 def textgrid_to_df(
         obj: AlignedTextGrid,
-        with_subset: bool = True
+        with_subset: bool = True,
+        columns: Sequence[str]|None = None
         ) -> pl.DataFrame:
 
     all_df = [
-        tiergroup_to_df(x, with_subset) for x in obj
+        tiergroup_to_df(x, with_subset, columns) for x in obj
     ]
 
     out_df = pl.concat(all_df, how="diagonal")
@@ -116,27 +277,35 @@ def to_df(
         obj: SequenceInterval | SequencePoint | SequenceTier |
         SequencePointTier | TierGroup | PointsGroup |
         AlignedTextGrid,
-        with_subset: bool = True        
+        with_subset: bool = True,
+        columns: Sequence[str]|None = None
         ) -> pl.DataFrame:
     """Return an `aligned_textgrid` object as a dataframe
 
+    Tiers are converted from their start time, end time and label
+    columns, and from the index of each entry's superset entry,
+    rather than entry by entry.
+
     Args:
         obj (SequenceInterval | SequencePoint | SequenceTier | SequencePointTier | TierGroup | PointsGroup | AlignedTextGrid): An `aligned_textgrid` object
         with_subset (bool, optional): Whether or not to include subset relationships. Defaults to True.
+        columns (Sequence[str] | None, optional): Which of `"id"`, `"tier_index"`, `"label"`,
+            `"start"` and `"end"` to include for each entry. Defaults to all of them.
+            Leaving out `"id"` saves building a string for every entry.
 
     Returns:
         (pl.DataFrame): A polars dataframe
     """
     if isinstance(obj, SequenceInterval) or isinstance(obj, SequencePoint):
-       return sequence_to_df(obj, with_subset)
-    
+       return sequence_to_df(obj, with_subset, columns)
+
     if isinstance(obj, SequenceTier) or isinstance(obj, SequencePointTier):
-        return tier_to_df(obj, with_subset)
-    
+        return tier_to_df(obj, with_subset, columns)
+
     if isinstance(obj, TierGroup) or isinstance(obj, PointsGroup):
-        return tiergroup_to_df(obj, with_subset)
+        return tiergroup_to_df(obj, with_subset, columns)
 
     if isinstance(obj, AlignedTextGrid):
-        return textgrid_to_df(obj, with_subset)
+        return textgrid_to_df(obj, with_subset, columns)
 
     raise ValueError("obj is not an aligned-textgrid class.")
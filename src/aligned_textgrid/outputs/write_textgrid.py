@@ -0,0 +1,431 @@
+"""
+Module for writing Praat TextGrid files directly from tier
+columns, without building `praatio` objects.
+
+Tiers are prepared and written one at a time, and each tier's
+entries are written to the file in chunks of `CHUNK_SIZE`.
+"""
+
+import numpy as np
+import numpy.typing as npt
+import json
+from aligned_textgrid.inputs.read_textgrid import INTERVAL_TIER, POINT_TIER
+from itertools import islice
+from typing import Literal, TextIO, Iterator, TYPE_CHECKING
+from pathlib import Path
+
+if TYPE_CHECKING:
+    from aligned_textgrid import AlignedTextGrid, SequenceTier, SequencePointTier
+
+# Intervals shorter than this are merged into their neighbors,
+# as `praatio` does when saving.
+MIN_INTERVAL_LENGTH = 0.00000001
+# The number of entries formatted before each write.
+CHUNK_SIZE = 4096
+_TAB = " " * 4
+
+def _num_to_str(value: float) -> str:
+    # Matches praatio.utilities.my_math.numToStr()
+    if abs(value - int(value)) <= 1e-14 * max(abs(value), abs(int(value))):
+        return "%d" % value
+    return repr(value)
+
+def _escape(text: str) -> str:
+    return text.replace('"', '""')
+
+class _TierColumns:
+    """The entries of one tier, ready to be written
+    """
+    def __init__(
+            self,
+            name: str,
+            tier_class: str,
+            columns: list[npt.NDArray|list[str]]
+        ):
+        self.name = name
+        self.tier_class = tier_class
+        self.columns = columns
+        self.xmin = float(columns[0].min())
+        self.xmax = float(columns[-2].max())
+
+    @property
+    def size(self) -> int:
+        return len(self.columns[-1])
+
+    def to_lists(self) -> None:
+        self.columns = [
+            x.tolist() if isinstance(x, np.ndarray) else x
+            for x in self.columns
+        ]
+
+def _chunks(lines: Iterator[str]) -> Iterator[str]:
+    """Join formatted entries into strings of
+    at most `CHUNK_SIZE` entries.
+    """
+    while True:
+        chunk = "".join(islice(lines, CHUNK_SIZE))
+        if not chunk:
+            return
+        yield chunk
+
+def _sorted_columns(columns: list) -> list:
+    """Sort entries by time, then label, if they aren't in order
+    """
+    times = np.asarray(columns[0])
+    if np.all(times[1:] > times[:-1]):
+        return columns
+    entries = sorted(zip(*[
+        x.tolist() if isinstance(x, np.ndarray) else x
+        for x in columns
+    ]))
+    return [
+        np.array(x, dtype = np.float64) if idx < len(columns)-1 else list(x)
+        for idx, x in enumerate(zip(*entries))
+    ]
+
+def _check_tier(
+        tier: 'SequenceTier|SequencePointTier',
+        name: str
+    ) -> None:
+    """Check that a tier can be written, using only
+    its time columns.
+    """
+    if len(tier) < 1:
+        kind = "points" if hasattr(tier, "times") else "intervals"
+        raise ValueError(f"Tier {repr(name)} has no {kind} to write.")
+    if hasattr(tier, "times"):
+        return
+
+    starts = np.asarray(tier.starts, dtype = np.float64)
+    ends = np.asarray(tier.ends, dtype = np.float64)
+    order = None
+    if not np.all(starts[1:] > starts[:-1]):
+        order = np.lexsort((ends, starts))
+        starts = starts[order]
+        ends = ends[order]
+
+    if np.any(starts >= ends):
+        idx = int(np.argmax(starts >= ends))
+        raise ValueError(
+            f"The start time of an interval ({starts[idx]}) "
+            f"cannot occur after its end time ({ends[idx]})"
+        )
+    if np.any(ends[:-1] > starts[1:]):
+        idx = int(np.argmax(ends[:-1] > starts[1:]))
+        tier_labels = [label.strip() for label in tier.labels]
+        if order is not None:
+            tier_labels = [tier_labels[x] for x in order]
+        raise ValueError(
+            "Two intervals in the same tier overlap in time:\n"
+            f"({starts[idx]}, {ends[idx]}, {tier_labels[idx]}) and "
+            f"({starts[idx+1]}, {ends[idx+1]}, {tier_labels[idx+1]})"
+        )
+
+def _interval_columns(
+        name: str,
+        starts: npt.NDArray,
+        ends: npt.NDArray,
+        labels: list[str]
+    ) -> _TierColumns:
+    starts, ends, labels = _sorted_columns([
+        np.asarray(starts, dtype = np.float64),
+        np.asarray(ends, dtype = np.float64),
+        [label.strip() for label in labels]
+    ])
+    return _TierColumns(
+        name = name,
+        tier_class = INTERVAL_TIER,
+        columns = [starts, ends, labels]
+    )
+
+def _point_columns(
+        name: str,
+        times: npt.NDArray,
+        labels: list[str]
+    ) -> _TierColumns:
+    times, labels = _sorted_columns([
+        np.asarray(times, dtype = np.float64),
+        [label.strip() for label in labels]
+    ])
+    return _TierColumns(
+        name = name,
+        tier_class = POINT_TIER,
+        columns = [times, labels]
+    )
+
+def _fill_blanks(
+        tier: _TierColumns,
+        xmin: float,
+        xmax: float
+    ) -> None:
+    """Fill gaps between intervals, and between the intervals
+    and the TextGrid's start and end, with empty intervals.
+    """
+    starts, ends, labels = tier.columns
+    new_starts = [starts[0]]
+    new_ends = [ends[0]]
+    new_labels = [labels[0]]
+    for idx in range(1, len(starts)):
+        if ends[idx-1] < starts[idx]:
+            new_starts.append(ends[idx-1])
+            new_ends.append(starts[idx])
+            new_labels.append("")
+        new_starts.append(starts[idx])
+        new_ends.append(ends[idx])
+        new_labels.append(labels[idx])
+
+    if new_starts[0] < xmin:
+        raise ValueError(
+            "The entries are shorter than the min time specified in the textgrid."
+        )
+    if new_starts[0] > xmin:
+        new_starts.insert(0, xmin)
+        new_ends.insert(0, new_starts[1])
+        new_labels.insert(0, "")
+
+    if new_ends[-1] > xmax:
+        raise ValueError(
+            "The entries are longer than the max time specified in the textgrid."
+        )
+    if new_ends[-1] < xmax:
+        new_starts.append(new_ends[-1])
+        new_ends.append(xmax)
+        new_labels.append("")
+
+    tier.columns = [new_starts, new_ends, new_labels]
+
+def _remove_ultrashort(
+        tier: _TierColumns,
+        xmin: float
+    ) -> None:
+    """Merge intervals shorter than `MIN_INTERVAL_LENGTH`
+    into the preceding interval.
+    """
+    starts, ends, labels = tier.columns
+    if all([end - start >= MIN_INTERVAL_LENGTH for start, end in zip(starts, ends)]):
+        return
+
+    new_entries = []
+    for start, end, label in zip(starts, ends, labels):
+        if end - start < MIN_INTERVAL_LENGTH:
+            if len(new_entries) > 0:
+                last_start, _, last_label = new_entries[-1]
+                new_entries[-1] = (last_start, end, last_label)
+        elif len(new_entries) == 0 and start != xmin:
+            new_entries.append((xmin, end, label))
+        else:
+            new_entries.append((start, end, label))
+
+    for idx in range(len(new_entries)-1):
+        diff = abs(new_entries[idx][1] - new_entries[idx+1][0])
+        if diff > 0 and diff < MIN_INTERVAL_LENGTH:
+            new_entries[idx] = (
+                new_entries[idx][0],
+                new_entries[idx+1][0],
+                new_entries[idx][2]
+            )
+
+    tier.columns = [list(x) for x in zip(*sorted(new_entries))]
+
+def _long_header(tier: _TierColumns, tier_num: int) -> str:
+    kind = "intervals" if tier.tier_class == INTERVAL_TIER else "points"
+    return (
+        _TAB + "item [%d]:\n" % tier_num +
+        _TAB * 2 + 'class = "%s" \n' % tier.tier_class +
+        _TAB * 2 + 'name = "%s" \n' % _escape(tier.name) +
+        _TAB * 2 + "xmin = %s \n" % _num_to_str(tier.xmin) +
+        _TAB * 2 + "xmax = %s \n" % _num_to_str(tier.xmax) +
+        _TAB * 2 + "%s: size = %d \n" % (kind, tier.size)
+    )
+
+def _long_entries(tier: _TierColumns) -> Iterator[str]:
+    if tier.tier_class == INTERVAL_TIER:
+        starts, ends, labels = tier.columns
+        return (
+            (
+                _TAB * 2 + "intervals [%d]:\n" % (idx + 1) +
+                _TAB * 3 + "xmin = %s \n" % _num_to_str(start) +
+                _TAB * 3 + "xmax = %s \n" % _num_to_str(end) +
+                _TAB * 3 + 'text = "%s" \n' % _escape(label)
+            )
+            for idx, (start, end, label) in enumerate(zip(starts, ends, labels))
+        )
+    times, labels = tier.columns
+    return (
+        (
+            _TAB * 2 + "points [%d]:\n" % (idx + 1) +
+            _TAB * 3 + "number = %s \n" % _num_to_str(time) +
+            _TAB * 3 + 'mark = "%s" \n' % _escape(label)
+        )
+        for idx, (time, label) in enumerate(zip(times, labels))
+    )
+
+def _short_header(tier: _TierColumns) -> str:
+    return (
+        '"%s"\n' % tier.tier_class +
+        '"%s"\n' % _escape(tier.name) +
+        "%s\n%s\n%s\n" % (
+            _num_to_str(tier.xmin),
+            _num_to_str(tier.xmax),
+            tier.size
+        )
+    )
+
+def _short_entries(tier: _TierColumns) -> Iterator[str]:
+    if tier.tier_class == INTERVAL_TIER:
+        starts, ends, labels = tier.columns
+        return (
+            '%s\n%s\n"%s"\n' % (_num_to_str(start), _num_to_str(end), _escape(label))
+            for start, end, label in zip(starts, ends, labels)
+        )
+    times, labels = tier.columns
+    return (
+        '%s\n"%s"\n' % (_num_to_str(time), _escape(label))
+        for time, label in zip(times, labels)
+    )
+
+def _json_chunks(tier: _TierColumns) -> Iterator[str]:
+    # Chunks of the same text as json.dumps() of the
+    # whole list of entries, without its brackets.
+    entries = zip(*tier.columns)
+    sep = ""
+    while True:
+        chunk = [list(entry) for entry in islice(entries, CHUNK_SIZE)]
+        if len(chunk) < 1:
+            return
+        yield sep + _dumps(chunk)[1:-1]
+        sep = ", "
+
+def _dumps(obj) -> str:
+    return json.dumps(obj, ensure_ascii = False)
+
+def _prepare_tier(
+        tier: 'SequenceTier|SequencePointTier',
+        name: str,
+        xmin: float,
+        xmax: float
+    ) -> _TierColumns:
+    if hasattr(tier, "times"):
+        columns = _point_columns(name, tier.times, tier.labels)
+        columns.to_lists()
+        return columns
+    columns = _interval_columns(name, tier.starts, tier.ends, tier.labels)
+    columns.to_lists()
+    _fill_blanks(columns, xmin, xmax)
+    _remove_ultrashort(columns, xmin)
+    return columns
+
+def _write_tiers(
+        tiers: list[tuple['SequenceTier|SequencePointTier', str]],
+        xmin: float,
+        xmax: float,
+        file: TextIO,
+        format: str
+    ) -> None:
+    if format in ["long_textgrid", "short_textgrid"]:
+        file.write('File type = "ooTextFile"\n')
+        file.write('Object class = "TextGrid"\n\n')
+
+    if format == "long_textgrid":
+        file.write("xmin = %s \n" % _num_to_str(xmin))
+        file.write("xmax = %s \n" % _num_to_str(xmax))
+        file.write("tiers? <exists> \n")
+        file.write("size = %d \n" % len(tiers))
+        file.write("item []: \n")
+    elif format == "short_textgrid":
+        file.write("%s\n%s\n" % (_num_to_str(xmin), _num_to_str(xmax)))
+        file.write("<exists>\n%d\n" % len(tiers))
+    elif format == "textgrid_json":
+        file.write('{"xmin": %s, "xmax": %s, "tiers": [' % (_dumps(xmin), _dumps(xmax)))
+    else:
+        file.write('{"start": %s, "end": %s, "tiers": {' % (_dumps(xmin), _dumps(xmax)))
+
+    for idx, (tier, name) in enumerate(tiers):
+        # Only one tier's entries are held at a time.
+        columns = _prepare_tier(tier, name, xmin, xmax)
+
+        if format == "long_textgrid":
+            file.write(_long_header(columns, idx + 1))
+            file.writelines(_chunks(_long_entries(columns)))
+        elif format == "short_textgrid":
+            file.write(_short_header(columns))
+            file.writelines(_chunks(_short_entries(columns)))
+        elif format == "textgrid_json":
+            file.write(
+                ('' if idx == 0 else ', ') +
+                '{"class": %s, "name": %s, "xmin": %s, "xmax": %s, "entries": [' % (
+                    _dumps(columns.tier_class),
+                    _dumps(columns.name),
+                    _dumps(columns.xmin),
+                    _dumps(columns.xmax)
+                )
+            )
+            file.writelines(_json_chunks(columns))
+            file.write("]}")
+        else:
+            file.write(
+                ('' if idx == 0 else ', ') +
+                '%s: {"type": %s, "entries": [' % (
+                    _dumps(columns.name),
+                    _dumps(columns.tier_class)
+                )
+            )
+            file.writelines(_json_chunks(columns))
+            file.write("]}")
+
+    if format == "textgrid_json":
+        file.write("]}")
+    elif format == "json":
+        file.write("}}")
+
+def write_textgrid(
+        atg: 'AlignedTextGrid',
+        file: str|Path|TextIO,
+        format: Literal[
+            "short_textgrid",
+            "long_textgrid",
+            "json",
+            "textgrid_json"
+        ] = "long_textgrid"
+    ) -> None:
+    """Write an AlignedTextGrid as a TextGrid file
+
+    Every tier is written directly from its start, end and label
+    columns. The header is written from the tiers' `xmin` and `xmax`,
+    and then tiers are prepared and written one at a time, in chunks
+    of entries, so the whole file is never held in memory. The output 
+    is the same as
+    `AlignedTextGrid.return_textgrid().save(..., includeBlankSpaces = True)`:
+    gaps are filled with empty intervals, labels are stripped,
+    and tiers with duplicate names are renamed.
+
+    Args:
+        atg (AlignedTextGrid):
+            The AlignedTextGrid to write
+        file (str | Path | TextIO):
+            A path, or a file opened for writing text
+        format (Literal["short_textgrid", "long_textgrid", "json", "textgrid_json"], optional):
+            The file format
+    """
+    if not format in ["short_textgrid", "long_textgrid", "json", "textgrid_json"]:
+        raise ValueError(
+            "format must be one of 'short_textgrid', 'long_textgrid', "
+            f"'json' or 'textgrid_json', not {repr(format)}"
+        )
+
+    tiers = atg._unique_tier_names()
+    if len(tiers) < 1:
+        raise ValueError("An empty AlignedTextGrid can't be written.")
+
+    # Checked before anything is written.
+    for tier, name in tiers:
+        _check_tier(tier, name)
+
+    xmin = min([float(tier.xmin) for tier, _ in tiers])
+    xmax = max([float(tier.xmax) for tier, _ in tiers])
+
+    if isinstance(file, str) or isinstance(file, Path):
+        with open(file, "w", encoding = "utf-8") as f:
+            _write_tiers(tiers, xmin, xmax, f, format)
+        return
+    _write_tiers(tiers, xmin, xmax, file, format)
@@ -0,0 +1,326 @@
+"""
+Module for pickling AlignedTextGrids, TierGroups and tiers
+as flat columns, rather than as linked entries.
+"""
+
+import numpy as np
+import numpy.typing as npt
+import warnings
+from aligned_textgrid.mixins.mixins import SequenceBaseClass
+from aligned_textgrid.mixins.within import WithinMixins
+from aligned_textgrid.sequences.sequences import SequenceInterval
+from aligned_textgrid.points.points import SequencePoint
+from aligned_textgrid.sequences.tiers import SequenceTier, TierGroup
+from aligned_textgrid.points.tiers import SequencePointTier, PointsGroup
+from aligned_textgrid.custom_classes import custom_classes, _importable, _links_unchanged
+from aligned_textgrid.inputs.read_textgrid import TierData, TextGridData, \
+                                                  INTERVAL_TIER, POINT_TIER
+from typing import Type, Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from aligned_textgrid import AlignedTextGrid
+
+# An entry class is described either by an importable class,
+# which pickles by reference, or by its name and whether it
+# is a point class.
+ClassDescriptor = Type[SequenceBaseClass] | tuple[str, bool]
+
+def _class_descriptor(
+        entry_class: Type[SequenceBaseClass]
+    ) -> ClassDescriptor:
+    # Classes cloned by an AlignedTextGrid keep the name of the
+    # class they were cloned from. The original class is used, 
+    # so that it's cloned again when the AlignedTextGrid is rebuilt,
+    # unless the hierarchy has been changed since cloning.
+    if _links_unchanged(entry_class):
+        for base in reversed(entry_class.__mro__):
+            if base.__name__ == entry_class.__name__ \
+               and _links_unchanged(base) \
+               and _importable(base):
+                return base
+    return (entry_class.__name__, issubclass(entry_class, SequencePoint))
+
+def _descriptor_classes(
+        descriptors: list[ClassDescriptor],
+        created: dict
+    ) -> list[Type[SequenceBaseClass]]:
+    """Get or create the entry classes for a list of descriptors.
+    Classes created with `custom_classes()` are stored in `created`
+    so that groups with the same hierarchy share them.
+    """
+    if all([isinstance(x, type) for x in descriptors]):
+        return list(descriptors)
+
+    names = [
+        x.__name__ if isinstance(x, type) else x[0]
+        for x in descriptors
+    ]
+    points = [
+        idx
+        for idx, x in enumerate(descriptors)
+        if (issubclass(x, SequencePoint) if isinstance(x, type) else x[1])
+    ]
+    key = (tuple(names), tuple(points))
+    if not key in created:
+        created[key] = custom_classes(names, points = points)
+    return created[key]
+
+def _tier_parents(
+        upper_tier: SequenceTier,
+        lower_tier: SequenceTier
+    ) -> npt.NDArray:
+    """For each entry in `lower_tier`, get the index of its
+    superset entry in `upper_tier`, or -1.
+    """
+    upper_idx = {id(entry): idx for idx, entry in enumerate(upper_tier)}
+    return np.array(
+        [
+            upper_idx.get(id(entry.super_instance), -1)
+            for entry in lower_tier
+        ],
+        dtype = np.int64
+    )
+
+def _group_parents(group: TierGroup) -> list[npt.NDArray]|None:
+    """Get the superset indices of every tier in a TierGroup,
+    or `None` if they can't be used to relate the tiers again.
+    """
+    parents = group._superset_indices()
+    for lower_parents in parents[1:]:
+        if np.any(lower_parents[1:] < lower_parents[:-1]):
+            return None
+    return parents
+
+def _entry_features(
+        tier: SequenceTier|SequencePointTier
+    ) -> dict[int, dict[str, Any]]:
+    """Get the features set on entries, leaving out links
+    to other entries and tiers.
+    """
+    if getattr(tier, "_columns", None) is not None:
+        return {}
+    features = {}
+    for idx, entry in enumerate(tier.sequence_list):
+        if not entry.__dict__:
+            continue
+        values = {
+            key: value
+            for key, value in entry.__dict__.items()
+            if not isinstance(value, (SequenceBaseClass, WithinMixins))
+        }
+        if values:
+            features[idx] = values
+    return features
+
+def _set_features(
+        tier: SequenceTier|SequencePointTier,
+        features: dict[int, dict[str, Any]]
+    ) -> None:
+    for idx, values in features.items():
+        entry = tier[idx]
+        for key, value in values.items():
+            setattr(entry, key, value)
+
+def _tier_state(
+        tier: SequenceTier|SequencePointTier
+    ) -> tuple:
+    if isinstance(tier, SequencePointTier):
+        return (tier.name, tier.times, None, list(tier.labels), _entry_features(tier))
+    return (tier.name, tier.starts, tier.ends, list(tier.labels), _entry_features(tier))
+
+def _tier_from_state(
+        state: tuple,
+        entry_class: Type[SequenceBaseClass]
+    ) -> SequenceTier|SequencePointTier:
+    name, starts, ends, labels, _ = state
+    if issubclass(entry_class, SequencePoint):
+        return SequencePointTier.from_arrays(
+            starts, labels, entry_class = entry_class, name = name
+        )
+    return SequenceTier._from_columns(
+        starts, ends, labels, entry_class = entry_class, name = name
+    )
+
+def _reduce_tier(tier: SequenceTier|SequencePointTier) -> tuple:
+    return (
+        _rebuild_tier,
+        (_class_descriptor(tier.entry_class), _tier_state(tier))
+    )
+
+def _rebuild_tier(
+        descriptor: ClassDescriptor,
+        state: tuple
+    ) -> SequenceTier|SequencePointTier:
+    entry_class, = _descriptor_classes([descriptor], {})
+    tier = _tier_from_state(state, entry_class)
+    _set_features(tier, state[-1])
+    return tier
+
+def _group_state(group: TierGroup|PointsGroup) -> tuple:
+    parents = None
+    if isinstance(group, TierGroup):
+        parents = _group_parents(group)
+    return (
+        POINT_TIER if isinstance(group, PointsGroup) else INTERVAL_TIER,
+        [_class_descriptor(x) for x in group.entry_classes],
+        group._name,
+        [_tier_state(tier) for tier in group.tier_list],
+        parents
+    )
+
+def _reduce_group(group: TierGroup|PointsGroup) -> tuple:
+    lazy = isinstance(group, TierGroup) and group._relation_pending
+    return (_rebuild_group, (_group_state(group), lazy))
+
+def _rebuild_group(
+        state: tuple,
+        lazy: bool = False
+    ) -> TierGroup|PointsGroup:
+    tier_class, descriptors, name, tier_states, parents = state
+    entry_classes = _descriptor_classes(descriptors, {})
+    tiers = [
+        _tier_from_state(tier_state, entry_class)
+        for tier_state, entry_class in zip(tier_states, entry_classes)
+    ]
+    if tier_class == POINT_TIER:
+        group = PointsGroup(tiers)
+    elif parents is not None:
+        group = TierGroup._from_parents(tiers, parents, lazy = lazy)
+    else:
+        group = TierGroup(tiers, lazy = lazy)
+    group._name = name
+    for tier, tier_state in zip(tiers, tier_states):
+        _set_features(tier, tier_state[-1])
+    return group
+
+def _textgrid_attrs(
+        atg: 'AlignedTextGrid'
+    ) -> tuple[dict[str, Any], dict[str, tuple[int, ...]]]:
+    """Get the attributes of an AlignedTextGrid that aren't
+    rebuilt from its tier groups. Attributes set to one of its
+    tier groups or tiers are kept as their index path.
+    """
+    paths = {}
+    for group_idx, group in enumerate(atg.tier_groups):
+        paths[id(group)] = (group_idx,)
+        for tier_idx, tier in enumerate(group.tier_list):
+            paths[id(tier)] = (group_idx, tier_idx)
+
+    values = {}
+    links = {}
+    for key, value in atg.__dict__.items():
+        if key in ("_cloned_classes", "_isolated", "_tier_groups", "_contains"):
+            continue
+        if id(value) in paths:
+            links[key] = paths[id(value)]
+        else:
+            values[key] = value
+    return values, links
+
+def _reduce_aligned_textgrid(atg: 'AlignedTextGrid') -> tuple:
+    interval_groups = [
+        group for group in atg.tier_groups if isinstance(group, TierGroup)
+    ]
+    lazy = len(interval_groups) > 0 and \
+        all([group._relation_pending for group in interval_groups])
+    bounds = None
+    if len(atg.tier_groups) > 0:
+        bounds = (float(atg.xmin), float(atg.xmax))
+    values, links = _textgrid_attrs(atg)
+    return (
+        _rebuild_aligned_textgrid,
+        (
+            type(atg), 
+            [_group_state(group) for group in atg.tier_groups], 
+            lazy,
+            atg._isolated,
+            bounds,
+            values,
+            links
+        )
+    )
+
+def _rebuild_aligned_textgrid(
+        cls: Type['AlignedTextGrid'],
+        group_states: list[tuple],
+        lazy: bool = False,
+        isolate_classes: bool = False,
+        bounds: tuple[float, float]|None = None,
+        values: dict[str, Any]|None = None,
+        links: dict[str, tuple[int, ...]]|None = None
+    ) -> 'AlignedTextGrid':
+    from aligned_textgrid.aligned_textgrid import AlignedTextGrid
+
+    atg = cls.__new__(cls)
+    if len(group_states) < 1:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            AlignedTextGrid.__init__(atg, isolate_classes = isolate_classes)
+        atg.__dict__.update(values or {})
+        return atg
+
+    created = {}
+    group_classes = []
+    tiers = []
+    for tier_class, descriptors, _, tier_states, parents in group_states:
+        group_classes.append(_descriptor_classes(descriptors, created))
+        for idx, (name, starts, ends, labels, _) in enumerate(tier_states):
+            tier_parents = None
+            if tier_class == POINT_TIER:
+                tier_parents = np.full(len(labels), -1, dtype = np.int64)
+            elif parents is not None:
+                tier_parents = parents[idx]
+            times = starts if ends is None else ends
+            if len(labels) > 0:
+                xmin, xmax = float(starts.min()), float(times.max())
+            elif bounds is not None:
+                xmin, xmax = bounds
+            else:
+                xmin, xmax = 0.0, 0.0
+            tiers.append(TierData(
+                name = name,
+                tier_class = tier_class,
+                xmin = xmin,
+                xmax = xmax,
+                starts = starts,
+                ends = ends,
+                labels = labels,
+                parents = tier_parents
+            ))
+
+    if bounds is None:
+        bounds = (
+            min([tier.xmin for tier in tiers]),
+            max([tier.xmax for tier in tiers])
+        )
+    tg_data = TextGridData(
+        xmin = bounds[0],
+        xmax = bounds[1],
+        tiers = tiers,
+        cleaned = True
+    )
+    AlignedTextGrid.__init__(
+        atg, 
+        tg_data, 
+        group_classes, 
+        lazy = lazy, 
+        isolate_classes = isolate_classes
+    )
+
+    renamed = False
+    for group, state in zip(atg.tier_groups, group_states):
+        renamed |= group.name != state[2]
+        group._name = state[2]
+        for tier, tier_state in zip(group.tier_list, state[3]):
+            _set_features(tier, tier_state[-1])
+    if renamed:
+        atg._set_group_names()
+
+    atg.__dict__.update(values or {})
+    for key, path in (links or {}).items():
+        target = atg.tier_groups[path[0]]
+        if len(path) > 1:
+            target = target.tier_list[path[1]]
+        setattr(atg, key, target)
+    atg._restore_links()
+    return atg
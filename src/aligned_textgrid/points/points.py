@@ -65,11 +65,31 @@ class  SequencePoint(SequenceBaseClass, PrecedenceMixins, InTierMixins, WithinMi
             (should be <= 0).
     """
 
+    # Fixed fields are slots. Anything else, like attributes
+    # added by subclasses, goes in `__dict__`.
+    __slots__ = (
+        "_listed",
+        "_label",
+        "_time",
+        "fol",
+        "prev",
+        "intier",
+        "tiername",
+        "pointspool",
+        "_within",
+        "_contains",
+        "_within_index",
+        "_id",
+        "__dict__",
+        "__weakref__"
+    )
+
     def __init__(
             self,
             point: list|tuple|Point|Self = (None, None)
         ):
-        self._seq_type = SequencePoint
+        if not hasattr(self, "_listed"):
+            self._listed = None
         if isinstance(point, SequencePoint):
             point = Point(point.time, point.label)
 
@@ -94,9 +114,8 @@ class  SequencePoint(SequenceBaseClass, PrecedenceMixins, InTierMixins, WithinMi
         self.prev:SequencePoint|None = None
 
         if self.label != "#":
-            self.set_final()
-        if self.label != "#":
-            self.set_initial()
+            # as set_final() and set_initial() would
+            self.fol = self.prev = type(self)._edge()
 
 
     def __repr__(self) -> str:
@@ -131,7 +150,9 @@ class  SequencePoint(SequenceBaseClass, PrecedenceMixins, InTierMixins, WithinMi
     
     @time.setter
     def time(self, time):
+        old_time = self._time if self._listed is not None else None
         self._time = time
+        self._edited(old_time)
 
     @property
     def start(self):
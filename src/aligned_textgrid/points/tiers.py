@@ -9,6 +9,7 @@ from aligned_textgrid.mixins.tiermixins import TierMixins, TierGroupMixins
 from aligned_textgrid.mixins.within import WithinMixins
 from aligned_textgrid.sequence_list import SequenceList
 import numpy as np
+import numpy.typing as npt
 from typing import Type
 from collections.abc import Sequence
 
@@ -100,19 +101,94 @@ class SequencePointTier(Sequence, TierMixins, WithinMixins):
         self.name = name
         entry_order = np.argsort([x.time for x in self.entry_list])
         self.entry_list = [self.entry_list[idx] for idx in entry_order]
-        self.sequence_list = SequenceList()
+        self._sequence_list = SequenceList()
        
         for entry in self.entry_list:
             this_point = self.entry_class._cast(entry)
-            self.sequence_list.append(this_point)
+            self._sequence_list.append(this_point)
         self.__set_precedence()
     
+    @classmethod
+    def from_arrays(
+            cls,
+            times:npt.ArrayLike,
+            labels:Sequence[str],
+            entry_class:Type[SequencePoint] = SequencePoint,
+            name:str|None = None
+        )->Self:
+        """Create a tier from arrays of times and labels
+
+        The arrays are copied and sorted by time once, and the points
+        are created in a single pass, with their precedence set once.
+
+        Examples:
+            ```{python}
+            from aligned_textgrid import SequencePointTier
+
+            point_tier = SequencePointTier.from_arrays(
+                [1, 0],
+                ["b", "a"]
+            )
+            print(point_tier.labels)
+            ```
+
+        Args:
+            times (npt.ArrayLike):
+                Point times
+            labels (Sequence[str]):
+                Labels
+            entry_class (Type[SequencePoint], optional):
+                The entry class of the tier.
+            name (str | None, optional):
+                The tier name. Defaults to the entry class name.
+
+        Returns:
+            (SequencePointTier): The new tier
+        """
+        times = np.array(times, dtype = np.float64)
+        labels = list(labels)
+        if times.ndim != 1 or len(times) != len(labels):
+            raise ValueError(
+                "times and labels must be one dimensional and the same length."
+            )
+        if np.any(times[1:] < times[:-1]):
+            order = np.argsort(times, kind = "stable")
+            times = times[order]
+            labels = [labels[idx] for idx in order]
+
+        tier = cls(entry_class = entry_class)
+        if name is not None:
+            tier.name = name
+        points = [
+            entry_class(Point(time, label))
+            for time, label in zip(times.tolist(), labels)
+        ]
+        tier.entry_list = points
+        tier._sequence_list = SequenceList._from_sorted(
+            list(points),
+            times,
+            times,
+            list(labels)
+        )
+        tier.__set_precedence()
+        return tier
+
     def __getitem__(self, idx):
         return self.sequence_list[idx]
     
     def __len__(self):
         return len(self.sequence_list)
 
+    def __contains__(self, entry):
+        # Entries are compared by identity, as when
+        # searching the tier entry by entry.
+        return self.sequence_list._has_entry(entry)
+
+    def __reduce__(self):
+        # Pickled as columns, rather than as linked entries.
+        from aligned_textgrid.pickling import _reduce_tier
+        return _reduce_tier(self)
+
     def __set_precedence(self):
         for idx,seq in enumerate(self.sequence_list):
             self.__set_intier(seq)
@@ -136,17 +212,28 @@ class SequencePointTier(Sequence, TierMixins, WithinMixins):
     def __repr__(self):
         return f"Sequence Point tier of {self.entry_class.__name__};"
 
+    @property
+    def sequence_list(self)->SequenceList:
+        return self._sequence_list
+    
+    @sequence_list.setter
+    def sequence_list(self, new:Sequence):
+        self._sequence_list = SequenceList(*new)
+        self.__set_precedence()
+
+    def _column_arrays(self)->dict[str, npt.NDArray]:
+        return {"start": self.sequence_list.starts}
+
     @property
     def times(self):
-        return self.sequence_list.starts
+        return self.sequence_list.starts.copy()
     
     @times.setter
     def times(self, new_times):
         if not len(self.sequence_list) == len(new_times):
             raise Exception("There aren't the same number of new start times as intervals")
         
-        for p, t in zip(self.sequence_list, new_times):
-            p.time = t
+        self.sequence_list._set_times(starts = new_times)
 
     @property
     def labels(self):
@@ -167,7 +254,7 @@ class SequencePointTier(Sequence, TierMixins, WithinMixins):
             return None
         
     def _shift(self, increment):
-        self.times += increment
+        self.times = self.sequence_list.starts + increment
     
     def cleanup(self):
         pass
@@ -268,6 +355,11 @@ class PointsGroup(Sequence, TierGroupMixins, WithinMixins):
     def __len__(self):
         return len(self.tier_list)
 
+    def __reduce__(self):
+        # Pickled as columns, rather than as linked entries.
+        from aligned_textgrid.pickling import _reduce_group
+        return _reduce_group(self)
+
     def shift(
         self, 
         increment: float
@@ -318,7 +410,7 @@ class PointsGroup(Sequence, TierGroupMixins, WithinMixins):
     @property    
     def xmax(self):
         times = np.array(
-            [t.xmin for t in self.tier_list]
+            [t.xmax for t in self.tier_list]
         )
         return times.max()
     
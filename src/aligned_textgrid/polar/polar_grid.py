@@ -38,6 +38,11 @@ class PolarGrid(AlignedTextGrid):
         self._name_groups()
         self._set_group_names()
                 
+    def _restore_links(self):
+        self._set_named_accessors()
+        self._relate_levels_and_ranges()
+        self._relate_levels_and_points()
+
     def _set_named_accessors(self):
         for tg in self.tier_groups:
             for tier in tg:
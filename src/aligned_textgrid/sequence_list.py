@@ -1,5 +1,6 @@
 import numpy as np
 import warnings
+import weakref
 import sys
 from collections.abc import Sequence
 if sys.version_info >= (3,11):
@@ -13,6 +14,45 @@ if TYPE_CHECKING:
 
 SeqVar = TypeVar("SeqVar", 'SequenceInterval', 'SequencePoint')
 
+def _entry_key(value:SeqVar)->tuple:
+    """The (start, end, label) or (time, label) key
+    used for value equality between entries.
+    """
+    if hasattr(value, "time"):
+        return (value.time, value.label)
+    return (value.start, value.end, value.label)
+
+def _register(value:SeqVar, seq_list:'SequenceList')->None:
+    """Record on `value` that it has been placed in `seq_list`.
+
+    An entry's `_listed` slot holds None, a weak reference
+    to the one list it is in, or a list of weak references.
+    """
+    ref = weakref.ref(seq_list)
+    listed = value._listed
+    if listed is None or listed is ref:
+        value._listed = ref
+        return
+    if not isinstance(listed, list):
+        listed = [listed]
+    if not any(x is ref for x in listed):
+        listed = [x for x in listed if x() is not None]
+        listed.append(ref)
+    value._listed = listed if len(listed) > 1 else listed[0]
+
+def _unregister(value:SeqVar, seq_list:'SequenceList')->None:
+    """Record on `value` that it is no longer in `seq_list`"""
+    listed = value._listed
+    if listed is None:
+        return
+    if not isinstance(listed, list):
+        listed = [listed]
+    kept = [x for x in listed if x() is not None and x() is not seq_list]
+    if len(kept) < 1:
+        value._listed = None
+    else:
+        value._listed = kept if len(kept) > 1 else kept[0]
+
 class SequenceList(Sequence):
     """A list of SequenceIntervals or SequencePoints that
     remains sorted
@@ -23,16 +63,53 @@ class SequenceList(Sequence):
 
     Attributes:
         starts (np.array):
-            An array of start times
+            A read-only array of start times
         ends (np.array):
-            An array of end times
+            A read-only array of end times
         labels (list[str]):
             A list of labels
+        version (int):
+            A counter that increases every time entries are
+            inserted, removed or reordered.
     """
 
+    __slots__ = (
+        "_values",
+        "entry_class",
+        "_version",
+        "_col_valid",
+        "_col_shared",
+        "_col_starts",
+        "_col_ends",
+        "_col_labels",
+        "_members",
+        "_keys",
+        "_keys_valid",
+        "_entry_keys",
+        "_positions",
+        "_positions_version",
+        "__weakref__"
+    )
+
+    # Entries keep weak references to the lists they are in
+    # (see `_register()`). When the time or label of an entry
+    # changes, each of those lists writes the new value into 
+    # its cached columns. The columns are copied first if a 
+    # view of them has been returned (`_col_shared`), so that
+    # views already handed out don't change.
+
     def __init__(self, *args:SeqVar):
         self._values = []
         self.entry_class = None
+        self._version = 0
+        self._col_valid = False
+        self._col_shared = False
+        self._members = {}
+        self._keys = None
+        self._keys_valid = False
+        self._entry_keys = {}
+        self._positions = None
+        self._positions_version = -1
         if len(args) > 0:
             pass
         else:
@@ -43,9 +120,33 @@ class SequenceList(Sequence):
             raise ValueError("All values must have the same class.")
         
         self.entry_class = all_ecs.pop()
-        self._values += args
+        self._reset_values(list(args))
         self._sort()
 
+    @classmethod
+    def _from_sorted(
+            cls,
+            values:list[SeqVar],
+            starts:np.ndarray,
+            ends:np.ndarray,
+            labels:list
+        )->Self:
+        """Create a list from entries already sorted by start
+        time, along with their columns, without sorting them or
+        reading the columns back from the entries.
+        """
+        output = cls()
+        if len(values) < 1:
+            return output
+        output.entry_class = values[0].entry_class
+        output._reset_values(values)
+        output._col_starts = starts
+        output._col_ends = ends
+        output._col_labels = list(labels)
+        output._col_valid = True
+        output._col_shared = True
+        return output
+
     def __getitem__(self:Sequence[SeqVar], idx:int)->SeqVar:
         return self._values[idx]
     
@@ -56,47 +157,137 @@ class SequenceList(Sequence):
         if len(self) < 1:
             return False
         
-        if other in self._values:
+        if id(other) in self._members:
             return True
         
-        self_tuples = [tuple(x.return_praatio()) for x in self]
-        other_tuple = tuple(other.return_praatio())
-        if other_tuple in self_tuples:
-            return True
+        other_key = _entry_key(other)
+        keys = self._key_index()
+        if keys is None:
+            return other_key in [_entry_key(x) for x in self._values]
         
-        return False
+        try:
+            return other_key in keys
+        except TypeError:
+            return False
     
+    def _has_entry(self, value:SeqVar)->bool:
+        """Whether `value` itself is in the list"""
+        return id(value) in self._members
+
     def __add__(self, other:Sequence[SeqVar]) -> Self:
 
         if not isinstance(self, Sequence):
             raise ValueError("Only a list, tuple, or SequenceList can be added to SequenceList")
 
+        incoming = self._incoming(other)
+
+        if len(incoming) < 1:
+            return self
+
+        output = SequenceList()
+        output.entry_class = self.entry_class
+        output._reset_values(list(self._values))
+        if self._columns_valid():
+            output._col_starts = self._col_starts[:len(self)].copy()
+            output._col_ends = self._col_ends[:len(self)].copy()
+            output._col_labels = list(self._col_labels)
+            output._col_valid = True
+
+        output._merge(incoming)
+        output._check_no_overlaps()
+        return output
+
+    def _incoming(self, other:Sequence[SeqVar]) -> list[SeqVar]:
+        """Filter out entries already in the list, check
+        their class, and cast them to the list's entry class.
+        """
         other = [x for x in other if x not in self]
 
         if len(other) < 1:
-            return self
+            return []
 
         unique_other_classes = set([x.__class__ for x in other])
 
         if len(unique_other_classes) > 1:
             raise ValueError("All values in added list must have the same class.")
-    
-        if len(unique_other_classes) < 1:
-            return self
         
         incoming_class = next(iter(unique_other_classes))
         if self.entry_class and not (issubclass(incoming_class, self.entry_class) or (issubclass(self.entry_class, incoming_class))):
             raise ValueError("All values in added list must have the same class as original list.")
         
         if not self.entry_class:
-            self.entry_class = next(iter(unique_other_classes))
+            self.entry_class = incoming_class
 
-        new_list = self._values + [x for x in other]
-        new_intervals = [self.entry_class._cast(x) if not x.entry_class is self.entry_class else x for x in new_list]
-        output =  SequenceList(*new_intervals)
-        output._sort()
-        output._check_no_overlaps()
-        return output
+        return [
+            self.entry_class._cast(x) if not x.entry_class is self.entry_class else x 
+            for x in other
+        ]
+
+    def _merge(self, incoming:list[SeqVar])->None:
+        """Merge a list of new entries into the sorted list
+
+        The incoming entries are sorted, and then each
+        is placed after any existing entries with the same 
+        start time in a single pass over both lists.
+        """
+        self._sort()
+        other = SequenceList()
+        other._reset_values(incoming)
+        other._sort()
+
+        starts = self.starts
+        ends = self.ends
+        labels = self._col_labels
+        other_starts = other.starts
+        insert_at = starts.searchsorted(other_starts, side = "right")
+
+        merged = []
+        merged_labels = []
+        prev = 0
+        for idx, value, label in zip(insert_at, other._values, other._col_labels):
+            merged += self._values[prev:idx]
+            merged_labels += labels[prev:idx]
+            merged.append(value)
+            merged_labels.append(label)
+            prev = idx
+        merged += self._values[prev:]
+        merged_labels += labels[prev:]
+
+        col_starts = np.insert(starts, insert_at, other_starts)
+        col_ends = np.insert(ends, insert_at, other.ends)
+
+        self._values = merged
+        for value in other._values:
+            _register(value, self)
+            self._members[id(value)] = self._members.get(id(value), 0) + 1
+        self._version += 1
+
+        self._col_starts = col_starts
+        self._col_ends = col_ends
+        self._col_labels = merged_labels
+        self._col_valid = True
+        self._col_shared = False
+
+        for value in other._values:
+            self._add_key(value)
+
+    def extend(self:Sequence[SeqVar], values:Sequence[SeqVar])->None:
+        """Add several SequenceIntervals or SequencePoints to the list
+
+        Entries already in the list are skipped. The rest are sorted
+        and merged into the list in a single pass.
+
+        Args:
+            values (Sequence[SeqVar]):
+                A list or SequenceList of SequenceIntervals or
+                SequencePoints
+        """
+        incoming = self._incoming(values)
+        if len(incoming) < 1:
+            return
+        
+        self._merge(incoming)
+        self._check_no_overlaps()
 
     def __repr__(self):
         return self._values.__repr__()
@@ -105,11 +296,383 @@ class SequenceList(Sequence):
         if len(self._values) < 1:
             return
         
-        if np.all(self.starts[:-1] <= self.starts[1:]):
+        starts = self.starts
+        if np.all(starts[:-1] <= starts[1:]):
             return
 
-        item_order = np.argsort(self.starts)
+        item_order = np.argsort(starts)
         self._values = [self._values[idx] for idx in item_order]
+        self._version += 1
+        self._col_starts = self._col_starts[item_order]
+        self._col_ends = self._col_ends[item_order]
+        self._col_labels = [self._col_labels[idx] for idx in item_order]
+        self._col_shared = False
+
+    def _reset_values(self, values:list[SeqVar])->None:
+        self._values = values
+        self._members = {}
+        for value in values:
+            _register(value, self)
+            self._members[id(value)] = self._members.get(id(value), 0) + 1
+        self._version += 1
+        self._col_valid = False
+        self._keys_valid = False
+
+    @staticmethod
+    def _notify_edit(value:SeqVar, old_start:float|None = None)->None:
+        """Pass an edit to `value` on to every list it is in"""
+        listed = value._listed
+        refs = listed if isinstance(listed, list) else (listed,)
+        for ref in refs:
+            seq_list = ref()
+            if seq_list is not None:
+                seq_list._entry_edited(value, old_start)
+
+    def _entry_edited(
+            self, 
+            value:SeqVar, 
+            old_start:float|None = None
+        )->None:
+        """Update the cached columns after the time or label
+        of `value` has changed. If its start time (or time) 
+        was changed, `old_start` is the previous one.
+        """
+        count = self._members.get(id(value))
+        if count is None:
+            return
+        if self._keys_valid and self._keys is not None:
+            for _ in range(count):
+                self._drop_key(value)
+            for _ in range(count):
+                self._add_key(value)
+        if not self._col_valid:
+            return
+        if count > 1:
+            self._col_valid = False
+            return
+
+        # The start column still holds the entry's old start
+        # time, so the entry is found by binary search on that.
+        idx = None
+        if self._positions_version == self._version:
+            idx = self._positions.get(id(value))
+        if idx is None:
+            idx = self._bisect_entry(value, old_start)
+        if idx is None:
+            idx = self.index(value)
+        if self._col_shared:
+            self._col_starts = self._col_starts.copy()
+            self._col_ends = self._col_ends.copy()
+            self._col_shared = False
+
+        if hasattr(value, "time"):
+            start = end = value.time
+        else:
+            start, end = value.start, value.end
+        self._col_starts[idx] = np.nan if start is None else start
+        self._col_ends[idx] = np.nan if end is None else end
+        self._col_labels[idx] = value.label
+
+    def _key_index(self)->dict|None:
+        """The entries in the list, grouped by their keys. 
+        This is built on first use, and then kept current as 
+        entries are added, removed or edited. If entries have 
+        unhashable labels, this is None.
+        """
+        if self._keys_valid:
+            return self._keys
+        
+        keys = {}
+        entry_keys = {}
+        try:
+            for value in self._values:
+                key = _entry_key(value)
+                keys.setdefault(key, []).append(value)
+                entry_keys[id(value)] = key
+        except TypeError:
+            keys = None
+            entry_keys = {}
+        
+        self._keys = keys
+        self._entry_keys = entry_keys
+        self._keys_valid = True
+        return self._keys
+
+    def _add_key(self, value:SeqVar)->None:
+        if not self._keys_valid or self._keys is None:
+            return
+        try:
+            key = _entry_key(value)
+            self._keys.setdefault(key, []).append(value)
+        except TypeError:
+            self._keys = None
+            self._entry_keys = {}
+            return
+        self._entry_keys[id(value)] = key
+
+    def _drop_key(self, value:SeqVar)->None:
+        """Remove one occurrence of `value` from the key index"""
+        if not self._keys_valid or self._keys is None:
+            return
+        key = self._entry_keys[id(value)]
+        same_key = self._keys[key]
+        for idx, x in enumerate(same_key):
+            if x is value:
+                del same_key[idx]
+                break
+        if len(same_key) < 1:
+            del self._keys[key]
+        if id(value) not in self._members:
+            del self._entry_keys[id(value)]
+    
+    def _index_entry(self, value:SeqVar)->int:
+        """Get the index of `value`, preferring the identical
+        entry and then the first entry equal in value.
+        """
+        if id(value) in self._members:
+            return self.index(value)
+
+        value_key = _entry_key(value)
+        keys = self._key_index()
+        if keys is None:
+            for idx, x in enumerate(self._values):
+                if _entry_key(x) == value_key:
+                    return idx
+            raise ValueError(f"{value} is not in SequenceList")
+
+        try:
+            matches = keys.get(value_key)
+        except TypeError:
+            matches = None
+        if not matches:
+            raise ValueError(f"{value} is not in SequenceList")
+        return min(self.index(x) for x in matches)
+
+    def _bisect_entry(
+            self, 
+            value:SeqVar, 
+            start:float|None = None
+        )->int|None:
+        """Find an entry by binary search on the cached
+        start times, if they are current. `start` is the 
+        time to search for, defaulting to the entry's own.
+        """
+        if not self._columns_valid():
+            return None
+        
+        if start is None:
+            start = value.time if hasattr(value, "time") else value.start
+        if start is None:
+            return None
+        
+        starts = self._col_starts[:len(self)]
+        idx = int(starts.searchsorted(start))
+        while idx < len(self) and starts[idx] == start:
+            if self._values[idx] is value:
+                return idx
+            idx += 1
+        return None
+
+    def index(
+            self, 
+            value:SeqVar, 
+            start:int = 0, 
+            stop:int|None = None
+        )->int:
+        """Get the index of an entry
+
+        Entry positions are cached, and the cache is rebuilt 
+        after the list is sorted, inserted into, or popped from.
+        Between rebuilds, entries are located by binary search 
+        on their start times.
+
+        Args:
+            value (SequenceInterval|SequencePoint):
+                The entry to find
+            start (int, optional):
+                Only search from this index. Defaults to 0.
+            stop (int | None, optional):
+                Only search up to this index. Defaults to None.
+
+        Returns:
+            (int): The index of `value`
+        """
+        if stop is None:
+            stop = len(self)
+
+        idx = None
+        if self._positions_version == self._version:
+            idx = self._positions.get(id(value))
+        elif id(value) in self._members:
+            idx = self._bisect_entry(value)
+            if idx is None:
+                self._build_positions()
+                idx = self._positions.get(id(value))
+
+        if idx is not None and start <= idx < stop:
+            return idx
+
+        return self._values.index(value, start, stop)
+
+    def _build_positions(self)->None:
+        self._positions = {}
+        for idx in range(len(self._values)-1, -1, -1):
+            self._positions[id(self._values[idx])] = idx
+        self._positions_version = self._version
+
+    def _columns_valid(self)->bool:
+        return self._col_valid
+
+    def _build_columns(self)->None:
+        """Rebuild the cached start, end and label columns
+        from the entries.
+        """
+        start_attr, end_attr = "start", "end"
+        if len(self._values) > 0 and hasattr(self._values[0], "time"):
+            start_attr, end_attr = "time", "time"
+
+        self._col_starts = np.array(
+            [getattr(x, start_attr) for x in self._values],
+            dtype = np.float64
+        )
+        self._col_ends = np.array(
+            [getattr(x, end_attr) for x in self._values],
+            dtype = np.float64
+        )
+        self._col_labels = [x.label for x in self._values]
+        self._col_valid = True
+        self._col_shared = False
+
+    def _columns(self)->None:
+        if not self._columns_valid():
+            self._build_columns()
+
+    def _column_view(self, column:np.ndarray)->np.ndarray:
+        view = column[:len(self._values)]
+        view.flags.writeable = False
+        self._col_shared = True
+        return view
+
+    def _insert_entry(self, idx:int, value:SeqVar)->None:
+        """Insert an entry, updating the cached columns in place
+        if they are current.
+        """
+        n = len(self._values)
+        valid = self._columns_valid()
+        positions_valid = self._positions_version == self._version
+        self._values.insert(idx, value)
+        _register(value, self)
+        self._version += 1
+        if positions_valid and idx == n:
+            self._positions.setdefault(id(value), n)
+            self._positions_version = self._version
+        self._members[id(value)] = self._members.get(id(value), 0) + 1
+        self._add_key(value)
+
+        if not valid:
+            return
+
+        if hasattr(value, "time"):
+            start = end = value.time
+        else:
+            start, end = value.start, value.end
+
+        if start is None:
+            start = np.nan
+        if end is None:
+            end = np.nan
+
+        if idx == n and n < self._col_starts.size:
+            # Appending into spare capacity doesn't touch
+            # any previously returned views.
+            self._col_starts[n] = start
+            self._col_ends[n] = end
+        else:
+            capacity = max(8, 2 * (n+1))
+            new_starts = np.empty(capacity, dtype = np.float64)
+            new_ends = np.empty(capacity, dtype = np.float64)
+            new_starts[:idx] = self._col_starts[:idx]
+            new_ends[:idx] = self._col_ends[:idx]
+            new_starts[idx] = start
+            new_ends[idx] = end
+            new_starts[idx+1:n+1] = self._col_starts[idx:n]
+            new_ends[idx+1:n+1] = self._col_ends[idx:n]
+            self._col_starts = new_starts
+            self._col_ends = new_ends
+            self._col_shared = False
+
+        self._col_labels.insert(idx, value.label)
+
+    def _pop_entry(self, idx:int)->SeqVar:
+        """Remove the entry at `idx`, updating the cached columns
+        if they are current.
+
+        Like `list.pop()`, later entries are moved down one
+        slot, so popping the last entry takes constant time.
+        """
+        n = len(self._values) - 1
+        valid = self._columns_valid()
+        positions_valid = self._positions_version == self._version
+        value = self._values.pop(idx)
+        self._version += 1
+        if positions_valid and idx == n \
+           and self._positions.get(id(value)) == n:
+            del self._positions[id(value)]
+            self._positions_version = self._version
+        if self._members[id(value)] > 1:
+            self._members[id(value)] -= 1
+        else:
+            del self._members[id(value)]
+            _unregister(value, self)
+        self._drop_key(value)
+
+        if not valid:
+            return value
+        
+        if self._col_shared:
+            self._col_starts = np.delete(self._col_starts[:n+1], idx)
+            self._col_ends = np.delete(self._col_ends[:n+1], idx)
+            self._col_shared = False
+        else:
+            self._col_starts[idx:n] = self._col_starts[idx+1:n+1]
+            self._col_ends[idx:n] = self._col_ends[idx+1:n+1]
+        self._col_labels.pop(idx)
+        return value
+
+    def _set_times(
+            self, 
+            starts:np.ndarray = None, 
+            ends:np.ndarray = None
+        )->None:
+        """Set the times of all entries from arrays, keeping
+        the cached columns current.
+        """
+        valid = self._columns_valid()
+        is_point = len(self._values) > 0 and hasattr(self._values[0], "time")
+        # the columns are replaced below, rather than
+        # updated entry by entry.
+        self._col_valid = False
+
+        if starts is not None:
+            start_attr = "time" if is_point else "start"
+            for value, t in zip(self._values, starts):
+                setattr(value, start_attr, t)
+
+        if ends is not None and not is_point:
+            for value, t in zip(self._values, ends):
+                value.end = t
+
+        if not valid:
+            return
+
+        if starts is not None:
+            self._col_starts = np.array(starts, dtype = np.float64)
+            if is_point:
+                self._col_ends = self._col_starts.copy()
+        if ends is not None and not is_point:
+            self._col_ends = np.array(ends, dtype = np.float64)
+        self._col_valid = True
+        self._col_shared = False
 
     #@wrap(log_class.entering, log_class.exiting)    
     def _entry_class_checker(self, value) -> None:
@@ -122,55 +685,88 @@ class SequenceList(Sequence):
             raise ValueError("All values must have the same class.")
     
     def _shift(self, increment)->None:
+        valid = self._columns_valid()
+        self._col_valid = False
         for value in self:
             value._shift(increment)
-
-    def _check_no_overlaps(
-          self
-    )->bool:
+        if valid:
+            self._col_starts = self._col_starts[:len(self)] + increment
+            self._col_ends = self._col_ends[:len(self)] + increment
+            self._col_valid = True
+            self._col_shared = False
+
+    def _find_overlaps(self)->np.ndarray:
+        """Find entries that start before an earlier entry ends
+
+        This makes a single pass over the start-sorted columns,
+        keeping track of the entry with the latest end time so far.
+
+        Returns:
+            (np.ndarray):
+                An array of index pairs with shape (n, 2). In each row,
+                the second entry starts before the first one ends.
+        """
         starts = self.starts
         ends = self.ends
+        n = len(starts)
 
-        a = np.array([e > starts for e in ends])
-        b = np.array([s < ends for s in starts])
-
-        n_overlaps = (a&b).sum()
+        if n < 2:
+            return np.empty((0, 2), dtype = np.int64)
+        
+        order = np.arange(n)
+        if not np.all(starts[:-1] <= starts[1:]):
+            order = np.argsort(starts, kind = "stable")
+            starts = starts[order]
+            ends = ends[order]
+
+        latest_end = np.maximum.accumulate(ends)
+        latest_idx = np.maximum.accumulate(
+            np.where(ends == latest_end, np.arange(n), 0)
+        )
+
+        prev_idx = latest_idx[:-1]
+        offending = (latest_end[:-1] > starts[1:]) \
+            & (starts[prev_idx] < ends[1:])
+        
+        pairs = np.stack(
+            [order[prev_idx[offending]], order[1:][offending]],
+            axis = 1
+        )
+        return pairs
 
-        overlaps = n_overlaps > len(self)
+    def _check_no_overlaps(
+          self
+    )->bool:
+        overlaps = self._find_overlaps()
 
-        if overlaps:
-            warnings.warn("Some intervals provided overlap in time")
+        if len(overlaps) > 0:
+            shown = ", ".join([f"{i} & {j}" for i, j in overlaps[:5]])
+            warnings.warn(
+                "Some intervals provided overlap in time. "
+                f"{len(overlaps)} overlap an earlier interval "
+                f"(entries {shown})"
+            )
 
-        return not n_overlaps > len(self)            
+        return len(overlaps) == 0
 
     @property
     def starts(self)->np.array:
-        if len(self) < 1:
-            return np.array([])
-        if hasattr(self[0], "time"):
-            return np.array([x.time for x in self])        
-        if hasattr(self[0], "start"):
-            return np.array([x.start for x in self])
-        
-
+        self._columns()
+        return self._column_view(self._col_starts)
 
     @property
     def ends(self) -> np.array:
-        if len(self) < 1:    
-            return np.array([])
-
-        if hasattr(self[0], "time"):
-            return np.array([x.time for x in self])
-        
-        if hasattr(self[0], "end"):
-            return np.array([x.end for x in self])
+        self._columns()
+        return self._column_view(self._col_ends)
     
     @property
     def labels(self) -> list[str]:
-        if len(self) > 0:
-            return [x.label for x in self]
-
-        return []
+        self._columns()
+        return list(self._col_labels)
+    
+    @property
+    def version(self) -> int:
+        return self._version
     
     def append(self:Sequence[SeqVar], value:SeqVar, shift:bool = False, re_init = False)->None:
         """Append a SequenceInterval to the list.
@@ -190,8 +786,9 @@ class SequenceList(Sequence):
             value.__init__(value)
         
         increment = 0
-        if len(self.ends) > 0:
-            increment = self.ends[-1]
+        ends = self.ends
+        if len(ends) > 0:
+            increment = ends[-1]
         if shift:
             value._shift(increment)
         
@@ -201,12 +798,13 @@ class SequenceList(Sequence):
         elif hasattr(value, "time"):
             this_time = value.time
         
-        if len(self.starts) > 0 and all(self.starts):
-            insert_idx = self.starts.searchsorted(this_time)
-            self._values.insert(insert_idx, value)
+        starts = self.starts
+        if len(starts) > 0 and this_time is not None:
+            insert_idx = int(starts.searchsorted(this_time))
+            self._insert_entry(insert_idx, value)
             return
         
-        self._values.append(value)
+        self._insert_entry(len(self), value)
 
     def concat(self:Sequence[SeqVar], intervals:Sequence[SeqVar])->None:
         """Concatenate two sequence lists
@@ -228,8 +826,7 @@ class SequenceList(Sequence):
         
         intervals._shift(increment)          
         
-        new_values = self + intervals
-        self._values = new_values
+        self.extend(intervals)
 
        
     def remove(self:Sequence[SeqVar], x:SeqVar)->None:
@@ -239,10 +836,8 @@ class SequenceList(Sequence):
             x (SequenceInterval):
                 The SequenceInterval to remove.
         """
-        self_tuples = [tuple(x.return_praatio()) for x in self]
-        x_tuple = tuple(x.return_praatio())        
-        pop_idx = self_tuples.index(x_tuple)
-        self._values.pop(pop_idx)
+        pop_idx = self._index_entry(x)
+        self._pop_entry(pop_idx)
         if hasattr(x, "super_instance"):
             x.remove_superset()
 
@@ -254,9 +849,7 @@ class SequenceList(Sequence):
                 SequenceInterval to pop
         """
         if x in self:
-            self_tuples = [tuple(x.return_praatio()) for x in self]
-            x_tuple = tuple(x.return_praatio())        
-            pop_idx = self_tuples.index(x_tuple)
-            self._values.pop(pop_idx)
+            pop_idx = self._index_entry(x)
+            self._pop_entry(pop_idx)
             if hasattr(x, "super_instance"):
                 x.remove_superset()
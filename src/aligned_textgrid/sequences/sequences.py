@@ -26,6 +26,7 @@ if TYPE_CHECKING:
     from aligned_textgrid import SequenceTier
 
 class HierarchyMixins:
+    __slots__ = ()
 
     # Ultimately, both of these class variables should be be
     # set to subclasses of SequenceInterval, but that can't be
@@ -91,10 +92,15 @@ class HierarchyMixins:
             raise Exception(f"Unknown error setting {subset_class.__name__} as subset class of {cls.__name__}")            
 
 class InstanceMixins(HierarchyMixins, WithinMixins):
-
+    __slots__ = ()
 
     def __add__(self, other:'SequenceInterval')->'SequenceInterval':
         self_copy:SequenceInterval = self.entry_class(self)
+        for name in SequenceInterval.__slots__:
+            if name in ("__dict__", "__weakref__"):
+                continue
+            if hasattr(self, name):
+                setattr(self_copy, name, getattr(self, name))
         self_copy.__dict__ = self.__dict__
 
         if issubclass(self.entry_class, other.superset_class):
@@ -163,6 +169,20 @@ class InstanceMixins(HierarchyMixins, WithinMixins):
             subset_class_set = set([type(x).__name__ for x in subset_list])
             raise Exception(f"The subset_class was defined as {self.subset_class.__name__}, but provided subset_list contained {subset_class_set}")
 
+    def _set_sorted_subset(self, subset_list:SequenceList['SequenceInterval'])->None:
+        """Adopt `subset_list`, a new SequenceList of sorted
+        subset entries that don't have a superset instance yet,
+        and that are already linked to each other in order.
+        """
+        self._subset_list = subset_list
+        self._contains = subset_list
+        for element in subset_list:
+            element.super_instance = self
+            element._within = self
+        if len(subset_list) > 0:
+            subset_list[0].set_initial()
+            subset_list[-1].set_final()
+
     def append_subset_list(self, subset_instance:SequenceList['SequenceInterval'] = None)->None:
         """Append a single item to subset list
 
@@ -297,6 +317,7 @@ class InstanceMixins(HierarchyMixins, WithinMixins):
         return False         
                 
 class HierarchyPart(HierarchyMixins):
+    __slots__ = ()
     def __init__(self):
         pass
 
@@ -365,6 +386,28 @@ class SequenceInterval(SequenceBaseClass, InstanceMixins, InTierMixins, Preceden
             A list of labels from the subset list
     """    
 
+    # Fixed fields are slots. Anything else, like features
+    # added with `set_feature()`, goes in `__dict__`.
+    __slots__ = (
+        "_listed",
+        "_label",
+        "_start",
+        "_end",
+        "fol",
+        "prev",
+        "_subset_list",
+        "super_instance",
+        "intier",
+        "tiername",
+        "_within",
+        "_contains",
+        "_within_index",
+        "_id",
+        "current",
+        "__dict__",
+        "__weakref__"
+    )
+
     # utilities
     def __init__(
         self, 
@@ -372,7 +415,8 @@ class SequenceInterval(SequenceBaseClass, InstanceMixins, InTierMixins, Preceden
         *,
         Interval = None
     ):
-        self._seq_type = SequenceInterval
+        if not hasattr(self, "_listed"):
+            self._listed = None
         if Interval:
             interval = Interval
 
@@ -390,7 +434,8 @@ class SequenceInterval(SequenceBaseClass, InstanceMixins, InTierMixins, Preceden
                 f"{len(interval)} were provided."
             ))
 
-        interval = praatio.utilities.constants.Interval(*interval)
+        if not isinstance(interval, praatio.utilities.constants.Interval):
+            interval = praatio.utilities.constants.Interval(*interval)
 
         self.start = interval.start
         self.end = interval.end
@@ -401,9 +446,8 @@ class SequenceInterval(SequenceBaseClass, InstanceMixins, InTierMixins, Preceden
 
         ## prevent infinite recursion
         if self.label != "#":
-            self.set_final()
-        if self.label != "#":
-            self.set_initial()
+            # as set_final() and set_initial() would
+            self.fol = self.prev = type(self)._edge()
 
         self._subset_list = SequenceList()
         self.super_instance= None
@@ -497,7 +541,9 @@ class SequenceInterval(SequenceBaseClass, InstanceMixins, InTierMixins, Preceden
     
     @start.setter
     def start(self, time:float):
+        old_start = self._start if self._listed is not None else None
         self._start = time
+        self._edited(old_start)
 
     @property
     def end(self)->float:
@@ -506,6 +552,7 @@ class SequenceInterval(SequenceBaseClass, InstanceMixins, InTierMixins, Preceden
     @end.setter
     def end(self, time:float):
         self._end = time
+        self._edited()
 
     @property
     def sub_starts(self)->np.array:
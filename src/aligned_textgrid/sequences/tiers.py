@@ -9,6 +9,7 @@ from aligned_textgrid.sequences.sequences import SequenceInterval, Top, Bottom
 from aligned_textgrid.sequence_list import SequenceList
 from aligned_textgrid.mixins.tiermixins import TierMixins, TierGroupMixins
 from aligned_textgrid.mixins.within import WithinMixins
+from aligned_textgrid.inputs.read_textgrid import _entry_order, _check_intervals
 from aligned_textgrid.sequence_list import SequenceList
 import numpy as np
 import numpy.typing as npt
@@ -23,12 +24,92 @@ else:
 
 import warnings
 
+def _overlap_containers(
+        upper_starts: npt.NDArray,
+        upper_ends: npt.NDArray,
+        lower_starts: npt.NDArray,
+        lower_ends: npt.NDArray
+    ) -> tuple[npt.NDArray, npt.NDArray]:
+    """Find the upper interval each lower interval overlaps the most
+
+    This gives the same result as taking the argmax of the full
+    lower × upper overlap matrix, but only evaluates the upper
+    intervals that could win: those overlapping the lower interval
+    plus its nearest neighbor on either side. Both tiers are
+    expected to be sorted by start time.
+
+    Args:
+        upper_starts (npt.NDArray): Start times of the upper tier
+        upper_ends (npt.NDArray): End times of the upper tier
+        lower_starts (npt.NDArray): Start times of the lower tier
+        lower_ends (npt.NDArray): End times of the lower tier
+
+    Returns:
+        (tuple[npt.NDArray, npt.NDArray]):
+            For every lower interval, the index of the upper interval
+            with the largest overlap, and the size of that overlap.
+    """
+    n_upper = upper_starts.size
+
+    if np.any(upper_ends[1:] < upper_ends[:-1]):
+        # If the upper tier overlaps itself, its end times
+        # aren't sorted, and all pairs need to be compared.
+        mins = np.minimum.outer(lower_ends, upper_ends)
+        maxes = np.maximum.outer(lower_starts, upper_starts)
+        overlaps = (mins-maxes)
+        return overlaps.argmax(axis = 1), overlaps.max(axis = 1)
+
+    # upper intervals in [lo, hi) overlap each lower interval
+    lo = np.searchsorted(upper_ends, lower_starts, side = "right")
+    hi = np.maximum(np.searchsorted(upper_starts, lower_ends, side = "left"), lo)
+
+    # Widen the range by one neighbor on each side. On the left,
+    # start from the first upper interval sharing the neighbor's
+    # end time, so that ties resolve to the same index as argmax.
+    left = lo.copy()
+    has_left = lo > 0
+    left[has_left] = np.searchsorted(
+        upper_ends, 
+        upper_ends[lo[has_left]-1], 
+        side = "left"
+    )
+    right = np.minimum(hi + 1, n_upper)
+
+    counts = right - left
+    offsets = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    owner = np.repeat(np.arange(lower_starts.size), counts)
+    candidates = np.arange(counts.sum()) \
+        - np.repeat(offsets, counts) \
+        + np.repeat(left, counts)
+
+    overlaps = np.minimum(lower_ends[owner], upper_ends[candidates]) \
+        - np.maximum(lower_starts[owner], upper_starts[candidates])
+    
+    max_overlaps = np.maximum.reduceat(overlaps, offsets)
+    positions = np.where(
+        overlaps == max_overlaps[owner],
+        np.arange(overlaps.size),
+        overlaps.size
+    )
+    first = np.minimum.reduceat(positions, offsets)
+
+    return candidates[first], max_overlaps
+
 class SequenceTier(Sequence, TierMixins, WithinMixins):
     """A sequence tier
 
     Given a `praatio` `IntervalTier` or list of `Interval`s, creates
     `entry_class` instances for every interval.
 
+    Tiers made with [](`~aligned_textgrid.SequenceTier.from_arrays`),
+    or loaded with `lazy=True`, first store only arrays of start times,
+    end times and labels. This defers the construction of the tier,
+    rather than replacing it: the first time any entry is accessed,
+    the `entry_class` instances for *every* interval in the tier are 
+    created at once. Until then, `starts`, `ends`, `labels`, `xmin`, 
+    `xmax`, shifting, and `get_interval_at_time()` work directly on
+    the arrays.
+
     In addition to the attributes and methods described below,
     the attributes and methods from [](`~aligned_textgrid.mixins.tiermixins.TierMixins`)
     and [](`~aligned_textgrid.mixins.within.WithinMixins`) are also available.
@@ -111,7 +192,19 @@ class SequenceTier(Sequence, TierMixins, WithinMixins):
         self.entry_list = entries
         self.name = name
         self._sequence_list = SequenceList()
+        self._columns = None
+        self._pending_group = None
         self.__set_classes(entry_class)
+
+        if len(entries) > 0 and all([isinstance(x, Interval) for x in entries]):
+            self._set_columns(
+                np.array([x.start for x in entries], dtype = np.float64),
+                np.array([x.end for x in entries], dtype = np.float64),
+                [x.label for x in entries]
+            )
+            self._materialize()
+            return
+
         self.__build_sequence_list()
         self.__set_precedence()
 
@@ -128,12 +221,161 @@ class SequenceTier(Sequence, TierMixins, WithinMixins):
         self.sequence_list = SequenceList(*intervals)
 
 
+    @classmethod
+    def from_arrays(
+            cls,
+            starts:npt.ArrayLike,
+            ends:npt.ArrayLike,
+            labels:Sequence[str],
+            entry_class:Type[SequenceInterval] = SequenceInterval,
+            name:str|None = None
+        )->Self:
+        """Create a tier from arrays of start times, end times and labels
+
+        The arrays are copied and sorted by start time once. As when
+        a TextGrid is read, a `ValueError` is raised if an interval
+        doesn't end after it starts, or two intervals overlap. Entries 
+        aren't created until one of them is first accessed. Then all
+        of the tier's entries are created in a single pass, with their
+        precedence set once.
+
+        Examples:
+            ```{python}
+            from aligned_textgrid import SequenceTier, Word
+
+            word_tier = SequenceTier.from_arrays(
+                [0, 0.5],
+                [0.5, 1],
+                ["the", "dog"],
+                entry_class = Word
+            )
+            print(word_tier[1].prev.label)
+            ```
+
+        Args:
+            starts (npt.ArrayLike):
+                Start times
+            ends (npt.ArrayLike):
+                End times
+            labels (Sequence[str]):
+                Labels
+            entry_class (Type[SequenceInterval], optional):
+                The entry class of the tier.
+            name (str | None, optional):
+                The tier name. Defaults to the entry class name.
+
+        Returns:
+            (SequenceTier): The new tier
+        """
+        starts = np.array(starts, dtype = np.float64)
+        ends = np.array(ends, dtype = np.float64)
+        labels = list(labels)
+        if starts.ndim != 1 or starts.shape != ends.shape \
+           or len(starts) != len(labels):
+            raise ValueError(
+                "starts, ends and labels must be one dimensional and the same length."
+            )
+        order = _entry_order(starts, ends, labels)
+        if order is not None:
+            starts = starts[order]
+            ends = ends[order]
+            labels = [labels[idx] for idx in order]
+        _check_intervals(
+            name if name is not None else entry_class.__name__,
+            starts,
+            ends,
+            labels
+        )
+        return cls._from_columns(starts, ends, labels, entry_class, name)
+
+    @classmethod
+    def _from_columns(
+            cls,
+            starts:npt.NDArray,
+            ends:npt.NDArray,
+            labels:list,
+            entry_class:Type[SequenceInterval] = SequenceInterval,
+            name:str|None = None
+        )->Self:
+        """Create a tier from columns without checking them, for
+        columns that were already checked when they were read or
+        that come from an existing tier.
+        """
+        tier = cls(entry_class = entry_class)
+        tier.entry_list = []
+        if name is not None:
+            tier.name = name
+        if len(labels) > 0:
+            tier._set_columns(starts, ends, labels)
+        return tier
+
+    def _set_columns(
+            self,
+            starts:npt.NDArray,
+            ends:npt.NDArray,
+            labels:list
+        )->None:
+        """Store the tier as start, end and label columns,
+        sorted by start time, deferring the creation of its
+        entries until `_materialize()`.
+        """
+        if np.any(starts[1:] < starts[:-1]):
+            order = np.argsort(starts, kind = "stable")
+            starts = starts[order]
+            ends = ends[order]
+            labels = [labels[idx] for idx in order]
+        self._columns = (starts, ends, labels)
+        self._sequence_list = SequenceList()
+
+    def _materialize(self)->None:
+        """Create the `entry_class` instances for a tier
+        that is only stored as columns.
+
+        This builds the whole tier, and relates its TierGroup if
+        that was deferred, which builds the group's other tiers too.
+        """
+        if self._columns is None:
+            return
+        starts, ends, labels = self._columns
+        self._columns = None
+        intervals = [
+            self.entry_class(Interval(start, end, label))
+            for start, end, label in zip(starts.tolist(), ends.tolist(), labels)
+        ]
+        self._sequence_list = SequenceList._from_sorted(
+            intervals, 
+            starts, 
+            ends, 
+            labels
+        )
+        name = self.name
+        for entry in intervals:
+            entry.intier = self
+            entry.tiername = name
+        self.entry_class._link_entries(intervals)
+        if issubclass(self.superset_class, Top):
+            self.contains = self._sequence_list
+        if self._pending_group is not None:
+            self._pending_group._relate_pending()
+
     def __getitem__(self, idx:int)->SequenceInterval:
         return self.sequence_list[idx]
 
     def __len__(self)->int:
+        if self._columns is not None:
+            return len(self._columns[2])
         return len(self.sequence_list)
 
+    def __contains__(self, entry:SequenceInterval)->bool:
+        # Entries are compared by identity, as when
+        # searching the tier entry by entry.
+        return self.sequence_list._has_entry(entry)
+
+    def __reduce__(self):
+        # Pickled as columns, rather than as linked entries.
+        from aligned_textgrid.pickling import _reduce_tier
+        return _reduce_tier(self)
+
 
     def __set_precedence(self)->None:
         for idx,seq in enumerate(self._sequence_list):
@@ -181,56 +423,91 @@ class SequenceTier(Sequence, TierMixins, WithinMixins):
     
     @property
     def sequence_list(self)->SequenceList:
+        self._materialize()
         return self._sequence_list
     
     @sequence_list.setter
     def sequence_list(self, new:Sequence):
+        self._materialize()
         self._sequence_list = SequenceList(*new)
         self.__set_precedence()        
 
+    @property
+    def contains(self)->SequenceList:
+        self._materialize()
+        return WithinMixins.contains.fget(self)
+    
+    @contains.setter
+    def contains(self, new_contains:Sequence):
+        WithinMixins.contains.fset(self, new_contains)
+
+    @property
+    def _time_columns(self)->tuple[npt.NDArray, npt.NDArray]:
+        if self._columns is not None:
+            return self._columns[0], self._columns[1]
+        return self._sequence_list.starts, self._sequence_list.ends
+
+    def _column_arrays(self)->dict[str, npt.NDArray]:
+        starts, ends = self._time_columns
+        return {"start": starts, "end": ends}
+
     @property
     def starts(self)->npt.NDArray:
-        return np.array([x.start for x in self.sequence_list])
+        return self._time_columns[0].copy()
     
     @starts.setter
     def starts(self, times:npt.NDArray):
-        if not len(self.sequence_list) == len(times):
+        if not len(self) == len(times):
             raise Exception("There aren't the same number of new start times as intervals")
         
-        for t, i in zip(times, self.sequence_list):
-            i.start = t
+        if self._columns is not None:
+            _, ends, labels = self._columns
+            self._columns = (np.array(times, dtype = np.float64), ends, labels)
+            return
+        self.sequence_list._set_times(starts = times)
 
     @property
     def ends(self)->npt.NDArray:
-        return np.array([x.end for x in self.sequence_list])
+        return self._time_columns[1].copy()
 
     @ends.setter
     def ends(self, times:npt.NDArray):
-        if not len(self.sequence_list) == len(times):
+        if not len(self) == len(times):
             raise Exception("There aren't the same number of new start times as intervals")
         
-        for t, i in zip(times, self.sequence_list):
-            i.end = t
+        if self._columns is not None:
+            starts, _, labels = self._columns
+            self._columns = (starts, np.array(times, dtype = np.float64), labels)
+            return
+        self.sequence_list._set_times(ends = times)
 
     def _shift(self, increment:float) -> None:
-        self.starts += increment
-        self.ends   += increment
+        if self._columns is not None:
+            starts, ends, labels = self._columns
+            self._columns = (starts + increment, ends + increment, labels)
+            return
+        self.sequence_list._set_times(
+            starts = self.sequence_list.starts + increment,
+            ends = self.sequence_list.ends + increment
+        )
 
     @property
     def labels(self)->list[str]:
-        return [x.label for x in self.sequence_list]
+        if self._columns is not None:
+            return list(self._columns[2])
+        return self.sequence_list.labels
 
     @property
     def xmin(self)->float:
-        if len(self.sequence_list) > 0:
-            return self.sequence_list.starts.min()
+        if len(self) > 0:
+            return self._time_columns[0].min()
         else:
             return None
     
     @property
     def xmax(self)->float:
-        if len(self.sequence_list) > 0:
-            return self.sequence_list.ends.max()
+        if len(self) > 0:
+            return self._time_columns[1].max()
         else:
             return None
 
@@ -296,16 +573,36 @@ class SequenceTier(Sequence, TierMixins, WithinMixins):
         Returns:
             (int): Index of the interval
         """
-        out_idx = np.argwhere(
-            np.logical_and(
-                self.starts <= time,
-                self.ends > time
-            )
-        )
-        if out_idx.size >= 1:
-            return int(out_idx.squeeze())
-        else:
+        out_idx = int(self.get_intervals_at_times(time))
+        if out_idx < 0:
             return None
+        return out_idx
+
+    def get_intervals_at_times(
+            self,
+            times: npt.ArrayLike
+        ) -> npt.NDArray:
+        """Gets the interval index at each of an array of times
+
+        Intervals are found by binary search on the tier's
+        sorted start times, without creating any entries. Lazily
+        loaded tiers give the same indices as eagerly loaded ones.
+
+        Args:
+            times (npt.ArrayLike): times at which to get intervals
+
+        Returns:
+            (npt.NDArray): 
+                For each time, the index of the interval it falls within,
+                or -1 if it falls in a gap or outside of the tier.
+        """
+        times = np.asarray(times, dtype = np.float64)
+        starts, ends = self._time_columns
+        if len(starts) < 1:
+            return np.full(times.shape, -1, dtype = np.int64)
+        out_idx = np.searchsorted(starts, times, side = "right") - 1
+        within = (out_idx >= 0) & (ends[np.maximum(out_idx, 0)] > times)
+        return np.where(within, out_idx, -1).astype(np.int64)
     
     def return_tier(self, name:str|None = None) -> IntervalTier:
         """Returns a `praatio` interval tier
@@ -318,7 +615,14 @@ class SequenceTier(Sequence, TierMixins, WithinMixins):
         
         if name is None:
             name = self.name
-        all_intervals = [entry.return_interval() for entry in self.sequence_list]
+        if self._columns is not None:
+            starts, ends, labels = self._columns
+            all_intervals = [
+                Interval(start, end, label)
+                for start, end, label in zip(starts.tolist(), ends.tolist(), labels)
+            ]
+        else:
+            all_intervals = [entry.return_interval() for entry in self.sequence_list]
         interval_tier = IntervalTier(name = name, entries = all_intervals)
         return interval_tier
 
@@ -350,6 +654,19 @@ class TierGroup(Sequence,TierGroupMixins, WithinMixins):
     Args:
         tiers (list[SequenceTier]): A list of sequence tiers that are 
             meant to be in hierarchical relationships with eachother
+        delay_cleanup (bool, optional):
+            Whether to skip trimming and squishing intervals
+            while relating tiers.
+        lazy (bool, optional):
+            If `True`, and every tier is still stored as columns,
+            the tiers aren't related until the entries of any of them
+            are first accessed. At that point, every tier in the group
+            is built and related at once. `tier.labels`, `tier.starts` 
+            and `tier.ends` can be read without relating the tiers.
+            If relating or cleaning up the tiers would add or move 
+            intervals, as when a tier has gaps, they're related 
+            right away instead, so that their columns are the same
+            as without `lazy`.
     
     Attributes:
         tier_list (list[SequenceTier]): List of sequence tiers that have been
@@ -367,7 +684,10 @@ class TierGroup(Sequence,TierGroupMixins, WithinMixins):
     def __init__(
         self,
         tiers: list[SequenceTier]|Self = [SequenceTier()],
-        delay_cleanup = False
+        delay_cleanup = False,
+        lazy = False,
+        *,
+        _parents_known = False
     ):
         name = None        
         if hasattr(tiers, "name"):
@@ -376,6 +696,8 @@ class TierGroup(Sequence,TierGroupMixins, WithinMixins):
         if isinstance(tiers, TierGroup):
             tiers = [tier for tier in tiers]
 
+        for tier in tiers:
+            tier._pending_group = None
         self.tier_list = self._arrange_tiers(tiers)
 
         if name:
@@ -384,6 +706,153 @@ class TierGroup(Sequence,TierGroupMixins, WithinMixins):
             self._name = self.make_name()
         self._set_tier_names()
 
+        self._relation_pending = False
+        self._delay_cleanup = delay_cleanup
+        self._pending_parents = None
+
+        if lazy and all([tier._columns is not None for tier in self.tier_list]) \
+           and (_parents_known or self._columns_settled()):
+            self._relation_pending = True
+            for tier in self.tier_list:
+                tier._pending_group = self
+            return
+
+        self._relate(delay_cleanup)
+
+    def _columns_settled(self)->bool:
+        """Check, on the columns of tiers whose entries haven't 
+        been built, that relating and cleaning up the tiers 
+        wouldn't add or move any intervals. 
+        
+        That's the case if no tier has gaps, every interval lies
+        entirely within an interval of the tier above, and the 
+        intervals within each upper interval span it exactly.
+        Only then can relation be deferred, so that the columns
+        read before and after relating the tiers are the same.
+        """
+        columns = [tier._columns for tier in self.tier_list]
+        for starts, ends, _ in columns:
+            if not np.allclose(starts[1:], ends[:-1]):
+                return False
+
+        for (upper_starts, upper_ends, _), (lower_starts, lower_ends, _) \
+            in zip(columns[:-1], columns[1:]):
+            upper_container, max_overlaps = _overlap_containers(
+                upper_starts,
+                upper_ends,
+                lower_starts,
+                lower_ends
+            )
+            lower_durations = lower_ends - lower_starts
+            if np.any(lower_durations - max_overlaps > 0):
+                return False
+            
+            lower_total = np.zeros(len(upper_starts))
+            np.add.at(lower_total, upper_container, lower_durations)
+            if np.any(np.bincount(upper_container, minlength = len(upper_starts)) < 1) \
+               or not np.allclose(upper_ends - upper_starts, lower_total):
+                return False
+        return True
+
+    def _relate_pending(self)->None:
+        """Relate tiers that were deferred with `lazy=True`"""
+        if not self._relation_pending:
+            return
+        self._relation_pending = False
+        for tier in self.tier_list:
+            tier._pending_group = None
+        if self._pending_parents is not None:
+            parents = self._pending_parents
+            self._pending_parents = None
+            self._relate_parents(parents)
+            return
+        self._relate(self._delay_cleanup)
+
+    def _superset_indices(self)->list[npt.NDArray]:
+        """For each tier, get the index of each entry's superset
+        entry in the tier above, or -1. Lazy tiers with known
+        superset entries aren't related.
+        """
+        from aligned_textgrid.pickling import _tier_parents
+        if self._relation_pending and self._pending_parents is not None:
+            return self._pending_parents
+        self._relate_pending()
+        return [np.full(len(self.tier_list[0]), -1, dtype = np.int64)] + [
+            _tier_parents(upper_tier, lower_tier)
+            for upper_tier, lower_tier in zip(self.tier_list[:-1], self.tier_list[1:])
+        ]
+
+    @classmethod
+    def _from_parents(
+            cls,
+            tiers: list[SequenceTier],
+            parents: list[npt.NDArray],
+            lazy: bool = False
+        )->Self:
+        """Create a TierGroup where the superset entry
+        of every entry is already known.
+
+        Args:
+            tiers (list[SequenceTier]):
+                Sequence tiers, from the top of the hierarchy down.
+            parents (list[npt.NDArray]):
+                For each tier, the index of each entry's 
+                superset entry in the tier above.
+            lazy (bool, optional):
+                Whether to defer relating the tiers.
+        """
+        group = cls(tiers, lazy = True, _parents_known = True)
+        if not group._relation_pending:
+            # Some tiers had no entries, and were related by overlap.
+            return group
+        tier_parents = {id(tier): par for tier, par in zip(tiers, parents)}
+        group._pending_parents = [
+            tier_parents[id(tier)] for tier in group.tier_list
+        ]
+        if not lazy:
+            group._relate_pending()
+        return group
+
+    def _relate_parents(self, parents: list[npt.NDArray])->None:
+        """Set the subset lists of every tier from the
+        index of each entry's superset entry.
+
+        The tiers are only stored as columns until now, so each
+        is materialized with its entries already linked in order.
+        """
+        for upper_tier, lower_tier, lower_parents in zip(
+            self.tier_list[:-1], 
+            self.tier_list[1:],
+            parents[1:]
+        ):
+            lower_parents = np.asarray(lower_parents)
+            if np.any(lower_parents[1:] < lower_parents[:-1]):
+                raise ValueError(
+                    f"Superset indices for tier {lower_tier.name} are out of order."
+                )
+            bounds = np.searchsorted(
+                lower_parents, 
+                np.arange(len(upper_tier)+1)
+            ).tolist()
+            lower_list = lower_tier.sequence_list
+            lower_entries = lower_list._values
+            starts = lower_list.starts
+            ends = lower_list.ends
+            labels = lower_list.labels
+            for idx, upper in enumerate(upper_tier.sequence_list._values):
+                lo, hi = bounds[idx], bounds[idx+1]
+                upper._set_sorted_subset(SequenceList._from_sorted(
+                    lower_entries[lo:hi],
+                    starts[lo:hi],
+                    ends[lo:hi],
+                    labels[lo:hi]
+                ))
+
+    def _relate(self, delay_cleanup = False)->None:
+        """Set the subset and superset relationships
+        between entries in adjacent tiers.
+        """
+        tiers = self.tier_list
         for tier in tiers:
             for entry in tier:
                 if hasattr(entry, "super_instance"):
@@ -402,41 +871,29 @@ class TierGroup(Sequence,TierGroupMixins, WithinMixins):
                 lower_starts = lower_tier.starts
                 lower_ends = lower_tier.ends
 
-                # This calculates how much each pairwise
-                # comparison of intervals overlap
-                mins = np.minimum.outer(lower_ends, upper_ends)
-                maxes = np.maximum.outer(lower_starts, upper_starts)
-                overlaps = (mins-maxes)
-
-                if overlaps.size < 1:
+                if len(upper_tier) < 1 or len(lower_tier) < 1:
                     continue
 
-                max_overlaps = overlaps.max(axis = 1)
                 lower_durations = (lower_ends - lower_starts)
 
                 # For each lower interval
                 # get the index of the upper interval
                 # it has the most overlap with.
-                upper_container = overlaps.argmax(axis = 1)
+                upper_container, max_overlaps = _overlap_containers(
+                    upper_starts,
+                    upper_ends,
+                    lower_starts,
+                    lower_ends
+                )
                 lower_idx = np.arange(len(lower_tier))
 
-                _starts = np.array([
-                    lower_idx[upper_container==idx].min()
-                    if (upper_container == idx).sum() > 0
-                    else -1
-                    for idx in range(len(upper_tier))
-                ])
+                starts = np.full(len(upper_tier), len(lower_tier))
+                np.minimum.at(starts, upper_container, lower_idx)
+                starts[starts == len(lower_tier)] = -1
 
-                _ends = np.array([
-                    lower_idx[upper_container==idx].max()+1
-                    if (upper_container == idx).sum() > 0
-                    else -1
-                    for idx in range(len(upper_tier))
-                ])
+                ends = np.full(len(upper_tier), -1)
+                np.maximum.at(ends, upper_container, lower_idx+1)
 
-                starts = np.ma.masked_array(_starts, _starts < 0)
-                ends = np.ma.masked_array(_ends, _ends < 0)
-                
                 mismatches = lower_durations - max_overlaps
                 any_mismatch = bool(np.any(mismatches > 0))
 
@@ -454,7 +911,7 @@ class TierGroup(Sequence,TierGroupMixins, WithinMixins):
 
                 lower_sequences = []
                 for idx, _ in enumerate(upper_tier):
-                    if np.ma.is_masked(starts[idx]):
+                    if starts[idx] < 0:
                         lower_sequences.append(SequenceList())
                     else:
                         lower_sequences.append(
@@ -525,7 +982,12 @@ class TierGroup(Sequence,TierGroupMixins, WithinMixins):
         n_tiers = len(self.tier_list)
         classes = [x.__name__ for x in self.entry_classes]
         return f"TierGroup with {n_tiers} tiers. {repr(classes)}"
-    
+
+    def __reduce__(self):
+        # Pickled as columns and superset indices,
+        # rather than as linked entries.
+        from aligned_textgrid.pickling import _reduce_group
+        return _reduce_group(self)
         
     def __setstate__(self, d):
         self.__dict__ = d
@@ -614,6 +1076,12 @@ class TierGroup(Sequence,TierGroupMixins, WithinMixins):
         This will fill any gaps between intervals with intervals
         with an empty label.
         """
+        if self._relation_pending and self._pending_parents is None:
+            # Relation is only deferred when cleaning
+            # up the tiers wouldn't change them.
+            return
+        self._relate_pending()
+
         not_tight = False
         
         for tier in self:
@@ -680,6 +1148,26 @@ class TierGroup(Sequence,TierGroupMixins, WithinMixins):
         """
         return [tier.get_interval_at_time(time) for tier in self.tier_list]
 
+    def get_intervals_at_times(
+            self,
+            times: npt.ArrayLike
+        ) -> npt.NDArray:
+        """Get intervals at an array of times
+
+        See [](`~aligned_textgrid.sequences.tiers.SequenceTier.get_intervals_at_times`).
+
+        Args:
+            times (npt.ArrayLike): Times in intervals
+
+        Returns:
+            (npt.NDArray): 
+                An array of interval indices with a row for each tier 
+                in `tier_list`, and -1 where a time falls in a gap.
+        """
+        return np.stack([
+            tier.get_intervals_at_times(times) for tier in self.tier_list
+        ])
+
     def show_structure(self):
         """Show the hierarchical structure
         """
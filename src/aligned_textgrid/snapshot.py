@@ -0,0 +1,266 @@
+"""
+Module for saving and loading columnar snapshots
+of an AlignedTextGrid
+"""
+
+import polars as pl
+import numpy as np
+import json
+from aligned_textgrid.aligned_textgrid import AlignedTextGrid
+from aligned_textgrid.sequences.sequences import SequenceInterval
+from aligned_textgrid.sequences.tiers import TierGroup
+from aligned_textgrid.sequences.word_and_phone import Word, Phone
+from aligned_textgrid.points.points import SequencePoint
+from aligned_textgrid.custom_classes import custom_classes
+from aligned_textgrid.pickling import _group_parents
+from aligned_textgrid.inputs.read_textgrid import TierData, TextGridData, \
+                                                  INTERVAL_TIER, POINT_TIER
+from typing import Type
+from collections.abc import Sequence
+from pathlib import Path
+
+SNAPSHOT_KEY = "aligned_textgrid"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_SCHEMA = {
+    "group": pl.UInt32,
+    "tier": pl.UInt32,
+    "start": pl.Float64,
+    "end": pl.Float64,
+    "label": pl.String,
+    "parent": pl.Int64
+}
+
+def save_snapshot(
+        atg: AlignedTextGrid,
+        path: str|Path
+    ) -> None:
+    """Save a columnar snapshot of an AlignedTextGrid
+
+    The start times, end times and labels of every tier are
+    written to a parquet file, along with the index of each
+    entry's superset entry. Entry class names and tier group
+    names are stored in the file metadata.
+
+    Examples:
+        ```{python}
+        from aligned_textgrid import AlignedTextGrid, Word, Phone
+        from aligned_textgrid.snapshot import save_snapshot, load_snapshot
+
+        atg = AlignedTextGrid(
+            "../usage/resources/the_dog.TextGrid",
+            entry_classes = [Word, Phone]
+        )
+        save_snapshot(atg, "the_dog.parquet")
+        print(load_snapshot("the_dog.parquet"))
+        ```
+
+    Args:
+        atg (AlignedTextGrid):
+            The AlignedTextGrid to save
+        path (str | Path):
+            The parquet file to write
+    """
+    frames = []
+    groups = []
+    for group_idx, group in enumerate(atg):
+        tiers = []
+        group_parents = None
+        if isinstance(group, TierGroup):
+            group_parents = _group_parents(group)
+        for tier_idx, tier in enumerate(group):
+            n = len(tier)
+            is_interval = issubclass(tier.entry_class, SequenceInterval)
+            if is_interval:
+                starts = tier.starts
+                ends = tier.ends
+            else:
+                starts = tier.times
+                ends = None
+
+            if group_parents is not None:
+                parents = group_parents[tier_idx]
+            elif is_interval:
+                # Superset indices that can't be used to relate
+                # the tiers again are left out.
+                parents = np.full(n, None)
+            else:
+                parents = np.full(n, -1, dtype = np.int64)
+
+            frames.append(pl.DataFrame(
+                {
+                    "group": np.full(n, group_idx, dtype = np.uint32),
+                    "tier": np.full(n, tier_idx, dtype = np.uint32),
+                    "start": starts,
+                    "end": ends,
+                    "label": list(tier.labels),
+                    "parent": parents
+                },
+                schema = SNAPSHOT_SCHEMA
+            ))
+            tiers.append({
+                "name": tier.name,
+                "tier_class": INTERVAL_TIER if is_interval else POINT_TIER,
+                "entry_class": tier.entry_class.__name__
+            })
+        groups.append({"name": group.name, "tiers": tiers})
+
+    df = pl.concat(frames, how = "vertical")
+    metadata = {
+        "version": SNAPSHOT_VERSION,
+        "xmin": float(atg.xmin),
+        "xmax": float(atg.xmax),
+        "groups": groups
+    }
+    df.write_parquet(path, metadata = {SNAPSHOT_KEY: json.dumps(metadata)})
+
+def read_snapshot(
+        path: str|Path
+    ) -> tuple[TextGridData, list[list[str]]]:
+    """Read the columns of a snapshot
+
+    Args:
+        path (str | Path):
+            A parquet file written by
+            [](`~aligned_textgrid.snapshot.save_snapshot`)
+
+    Returns:
+        (tuple[TextGridData, list[list[str]]]):
+            The tier columns, and the entry class names
+            for each tier group.
+    """
+    tg_data, class_names, _ = _read_snapshot(path)
+    return tg_data, class_names
+
+def _read_snapshot(
+        path: str|Path
+    ) -> tuple[TextGridData, list[list[str]], list[str]]:
+    """Read the columns of a snapshot, the entry class names
+    and the name of each tier group.
+    """
+    file_metadata = pl.read_parquet_metadata(path)
+    if not SNAPSHOT_KEY in file_metadata:
+        raise ValueError(f"{path} is not an aligned_textgrid snapshot.")
+    metadata = json.loads(file_metadata[SNAPSHOT_KEY])
+
+    df = pl.read_parquet(path)
+    tier_dfs = {
+        key: tier_df
+        for key, tier_df in df.group_by(
+            ["group", "tier"],
+            maintain_order = True
+        )
+    }
+
+    tiers = []
+    class_names = []
+    for group_idx, group in enumerate(metadata["groups"]):
+        class_names.append([])
+        for tier_idx, tier in enumerate(group["tiers"]):
+            class_names[-1].append(tier["entry_class"])
+            tier_df = tier_dfs.get(
+                (group_idx, tier_idx),
+                df.clear()
+            )
+            starts = tier_df["start"].to_numpy()
+            ends = None
+            if tier["tier_class"] == INTERVAL_TIER:
+                ends = tier_df["end"].to_numpy()
+            parents = None
+            if tier_df["parent"].null_count() < 1:
+                parents = tier_df["parent"].to_numpy()
+            tiers.append(TierData(
+                name = tier["name"],
+                tier_class = tier["tier_class"],
+                xmin = metadata["xmin"],
+                xmax = metadata["xmax"],
+                starts = starts,
+                ends = ends,
+                labels = tier_df["label"].to_list(),
+                parents = parents
+            ))
+
+    tg_data = TextGridData(
+        xmin = metadata["xmin"],
+        xmax = metadata["xmax"],
+        tiers = tiers,
+        cleaned = True
+    )
+    group_names = [group["name"] for group in metadata["groups"]]
+    return tg_data, class_names, group_names
+
+def _snapshot_classes(
+        class_names: list[list[str]],
+        point_groups: list[bool],
+        entry_classes: Sequence[Type[SequenceInterval|SequencePoint]]
+    ) -> list[list[Type[SequenceInterval|SequencePoint]]]:
+    """Find or create the entry classes named in a snapshot.
+    """
+    known = {
+        entry_class.__name__: entry_class
+        for entry_class in [SequenceInterval, SequencePoint, Word, Phone] + list(entry_classes)
+    }
+    created = {}
+    group_classes = []
+    for names, is_points in zip(class_names, point_groups):
+        if all([name in known for name in names]):
+            group_classes.append([known[name] for name in names])
+            continue
+        key = (tuple(names), is_points)
+        if not key in created:
+            created[key] = custom_classes(
+                list(names),
+                points = list(range(len(names))) if is_points else []
+            )
+        group_classes.append(created[key])
+    return group_classes
+
+def load_snapshot(
+        path: str|Path,
+        entry_classes: Sequence[Type[SequenceInterval|SequencePoint]] = [],
+        lazy: bool = False
+    ) -> AlignedTextGrid:
+    """Load an AlignedTextGrid from a snapshot
+
+    Tiers are related using the stored superset indices,
+    rather than by their timing, and aren't cleaned up again.
+    Tier group names are restored.
+
+    Reading the snapshot itself is fast, but a full load still
+    creates every entry, which is most of the cost of loading 
+    a TextGrid. It is typically only 3 to 4 times faster than
+    reading the original TextGrid. With `lazy=True`, entries 
+    aren't created until they're accessed, and a load that only
+    reads tier columns is much faster.
+
+    Args:
+        path (str | Path):
+            A parquet file written by
+            [](`~aligned_textgrid.snapshot.save_snapshot`)
+        entry_classes (Sequence[Type[SequenceInterval|SequencePoint]], optional):
+            Entry classes to use, matched to the snapshot by class name.
+            `Word` and `Phone` are always matched. For tier groups
+            with other class names, new classes are created with
+            [](`~aligned_textgrid.custom_classes`).
+        lazy (bool, optional):
+            If `True`, tiers aren't related until their entries
+            are first accessed.
+
+    Returns:
+        (AlignedTextGrid): The loaded AlignedTextGrid
+    """
+    tg_data, class_names, group_names = _read_snapshot(path)
+    point_groups = []
+    tier_idx = 0
+    for names in class_names:
+        point_groups.append(tg_data.tiers[tier_idx].tier_class == POINT_TIER)
+        tier_idx += len(names)
+    group_classes = _snapshot_classes(class_names, point_groups, entry_classes)
+    atg = AlignedTextGrid(tg_data, group_classes, lazy = lazy)
+
+    renamed = False
+    for group, name in zip(atg.tier_groups, group_names):
+        renamed |= group.name != name
+        group._name = name
+    if renamed:
+        atg._set_group_names()
+    return atg
@@ -200,6 +200,28 @@ class TestTiers:
 
         assert word1.fol is word2
 
+    def test_sequence_tier_append_in_place(self):
+        MyWord, = custom_classes(["MyWord"])
+        words = [MyWord((x, x+1, str(x))) for x in range(6)]
+
+        word_tier = SequenceTier(entry_class=MyWord)
+        word_tier.append(words[0])
+        seq_list = word_tier.sequence_list
+        for idx in [4, 2, 5, 1, 3]:
+            word_tier.append(words[idx])
+
+        assert word_tier.sequence_list is seq_list
+        assert word_tier.labels == [w.label for w in words]
+        assert words[0].prev.label == "#"
+        assert words[5].fol.label == "#"
+        for prev, fol in zip(words, words[1:]):
+            assert prev.fol is fol
+            assert fol.prev is prev
+        assert MyWord((0, 1, "0")) not in word_tier
+
+        with pytest.warns(UserWarning, match="overlap"):
+            word_tier.append(MyWord((2.5, 3.5, "x")))
+
     def test_sequence_tier_intg_append(self):
         MyWord, MyPhone = custom_classes(["MyWord", "MyPhone"])
         word1 = MyWord((0,10,"a"))
@@ -400,6 +422,42 @@ class TestTierGroups:
 
         assert word1.fol is word2
 
+    def test_tier_group_concat_many(self):
+        MyWord, MyPhone = custom_classes(["MyWord", "MyPhone"])
+
+        def make_group(label):
+            return TierGroup([
+                SequenceTier([MyWord((0, 10, label))]),
+                SequenceTier([
+                    MyPhone((0, 5, label.upper())), 
+                    MyPhone((5, 10, label.upper()*2))
+                ])
+            ])
+        
+        tier_group = make_group("a")
+        for label in ["b", "c", "d"]:
+            tier_group.concat(make_group(label))
+        
+        assert tier_group.xmax == 40
+        assert tier_group.MyWord.labels == ["a", "b", "c", "d"]
+        assert len(tier_group.MyPhone) == 8
+        assert np.allclose(tier_group.MyPhone.starts, np.arange(0, 40, 5))
+        for word in tier_group.MyWord:
+            assert len(word) == 2
+            assert word.first.start == word.start
+            assert word.last.end == word.end
+
+    def test_points_group_concat(self):
+        MyPoint, = custom_classes(["MyPoint"], points = [0])
+        points1 = PointsGroup([SequencePointTier([MyPoint((1, "a")), MyPoint((2, "b"))])])
+        points2 = PointsGroup([SequencePointTier([MyPoint((1, "c"))])])
+
+        points1.concat(points2)
+
+        assert points1[0].labels == ["a", "b", "c"]
+        assert np.allclose(points1[0].times, [1, 2, 3])
+        assert points1[0][-1].prev is points1[0][1]
+
 class TestATG:
 
     def test_atg_append(self):
@@ -276,6 +276,19 @@ class TestGetInterval:
         idxes = [x.get_intervals_at_time(target_time) for x in self.atg]
         assert self.atg.get_intervals_at_time(target_time) == idxes
 
+    def test_get_intervals_at_times(self):
+        times = [5, 11, -1]
+        idxes = self.atg.get_intervals_at_times(times)
+        assert len(idxes) == len(self.atg)
+        for group_idx, group in enumerate(self.atg):
+            assert idxes[group_idx].shape == (len(group), len(times))
+            for time_idx, time in enumerate(times):
+                expected = [
+                    -1 if x is None else x 
+                    for x in group.get_intervals_at_time(time)
+                ]
+                assert idxes[group_idx][:, time_idx].tolist() == expected
+
     def test_get_intervals(self):
         target_time = 11
         idxes = self.atg.get_intervals_at_time(target_time)
@@ -645,4 +658,50 @@ class TestClassCloning:
 
         assert not p_entry.superset_class is Phone.superset_class
         assert Phone.superset_class is Word
-        assert not p_entry.superset_class is Word
\ No newline at end of file
+        assert not p_entry.superset_class is Word
+class TestLazy:
+    path = "tests/test_data/KY25A_1_multi.TextGrid"
+
+    def columns(self, atg):
+        return [
+            (tier.name, len(tier), tier.labels, tier.starts.tolist(), tier.ends.tolist())
+            for tg in atg
+            for tier in tg
+        ]
+
+    def test_gapped_columns(self):
+        eager = AlignedTextGrid(self.path, [Word, Phone])
+        for reader in ["praatio", "native"]:
+            lazy = AlignedTextGrid(self.path, [Word, Phone], reader = reader, lazy = True)
+
+            # groups with gaps or mismatched boundaries are related right away
+            assert lazy[0]._relation_pending
+            assert not lazy[1]._relation_pending
+            assert self.columns(lazy) == self.columns(eager)
+
+            lazy[0][0][0]
+            assert not lazy[0]._relation_pending
+            assert self.columns(lazy) == self.columns(eager)
+
+    def test_gapped_lookups(self):
+        eager = AlignedTextGrid(self.path, [Word, Phone])
+        lazy = AlignedTextGrid(self.path, [Word, Phone], lazy = True)
+        times = np.linspace(eager.xmin, eager.xmax, 2000)
+
+        for lazy_idx, eager_idx in zip(
+            lazy.get_intervals_at_times(times),
+            eager.get_intervals_at_times(times)
+        ):
+            assert np.array_equal(lazy_idx, eager_idx)
+        for lazy_group, eager_group in zip(lazy, eager):
+            assert np.array_equal(
+                lazy_group.get_intervals_at_times([12.99]),
+                eager_group.get_intervals_at_times([12.99])
+            )
+
+        lazy[0][0][0]
+        for lazy_idx, eager_idx in zip(
+            lazy.get_intervals_at_times(times),
+            eager.get_intervals_at_times(times)
+        ):
+            assert np.array_equal(lazy_idx, eager_idx)
@@ -0,0 +1,144 @@
+import pytest
+import polars as pl
+from pathlib import Path
+from aligned_textgrid import AlignedTextGrid, Word, Phone
+from aligned_textgrid.corpus import load_corpus, corpus_paths, CorpusResult, \
+                                   corpus_to_parquet
+from aligned_textgrid.outputs.to_dataframe import to_df
+
+CORPUS = [
+    "tests/test_data/KY25A_1.TextGrid",
+    "tests/test_data/josef-fruehwald_speaker.TextGrid",
+    "tests/test_data/amelia_knew2-basic.TextGrid"
+] * 3
+
+class TestCorpusPaths:
+
+    def test_directory(self):
+        paths = corpus_paths("tests/test_data")
+        assert len(paths) > 0
+        assert paths == sorted(paths)
+        assert all([path.suffix == ".TextGrid" for path in paths])
+
+    def test_files(self):
+        paths = corpus_paths(CORPUS)
+        assert paths == [Path(x) for x in CORPUS]
+
+class TestLoadCorpus:
+
+    def test_ordered(self):
+        results = list(load_corpus(
+            CORPUS, 
+            [Word, Phone], 
+            max_workers = 2, 
+            chunksize = 2
+        ))
+        assert [result.path for result in results] == [Path(x) for x in CORPUS]
+        
+        atg = AlignedTextGrid(CORPUS[0], [Word, Phone])
+        assert to_df(results[0].textgrid).equals(to_df(atg))
+        assert results[0].textgrid[0].Word.first.first.within.label == \
+            atg[0].Word.first.first.within.label
+
+    def test_errors(self):
+        results = list(load_corpus(CORPUS, [Word, Phone], max_workers = 2))
+        failed = [result for result in results if not result.ok]
+
+        assert len(failed) == 3
+        assert all([result.path.name.startswith("amelia") for result in failed])
+        assert all([result.textgrid is None for result in failed])
+        assert all([isinstance(result.error, Exception) for result in failed])
+        assert "Traceback" in failed[0].traceback
+        assert all([
+            isinstance(result.textgrid, AlignedTextGrid)
+            for result in results
+            if result.ok
+        ])
+
+    def test_unordered(self):
+        results = list(load_corpus(
+            CORPUS,
+            [Word, Phone], 
+            max_workers = 2, 
+            chunksize = 1, 
+            ordered = False
+        ))
+        assert sorted([str(x.path) for x in results]) == sorted(CORPUS)
+
+    def test_shared_classes(self):
+        results = [
+            result 
+            for result in load_corpus(CORPUS, [Word, Phone], max_workers = 2, chunksize = 1)
+            if result.ok
+        ]
+        classes = results[0].textgrid[0].entry_classes
+        assert all([
+            result.textgrid[0].entry_classes == classes
+            for result in results
+        ])
+
+    def test_in_process(self):
+        results = load_corpus(CORPUS[:2], [Word, Phone], max_workers = 1, lazy = True)
+        assert not isinstance(results, list)
+        results = list(results)
+        assert all([isinstance(result, CorpusResult) for result in results])
+        assert results[0].textgrid[0]._relation_pending
+
+    def test_readers(self):
+        praatio, = load_corpus(CORPUS[:1], [Word, Phone], max_workers = 1)
+        native, = load_corpus(
+            CORPUS[:1],
+            [Word, Phone],
+            max_workers = 1,
+            reader = "native"
+        )
+        atg = AlignedTextGrid(CORPUS[0], [Word, Phone])
+        assert to_df(praatio.textgrid).equals(to_df(atg))
+        assert to_df(native.textgrid).equals(to_df(atg))
+
+    def test_chunksize(self):
+        with pytest.raises(ValueError):
+            load_corpus(CORPUS, [Word, Phone], chunksize = 0)
+
+class TestCorpusToParquet:
+
+    def test_parts(self, tmp_path):
+        index = corpus_to_parquet(
+            CORPUS, 
+            tmp_path, 
+            [Word, Phone], 
+            max_workers = 2, 
+            chunksize = 2
+        )
+        assert index["file_id"].to_list() == list(range(len(CORPUS)))
+        assert index["path"].to_list() == [str(Path(x)) for x in CORPUS]
+
+        failed = index.filter(pl.col("error").is_not_null())
+        assert failed.height == 3
+        assert failed["part"].is_null().all()
+        assert (failed["rows"] == 0).all()
+
+        df = pl.scan_parquet(tmp_path / "*.parquet").collect()
+        assert df.height == index["rows"].sum()
+        assert df.columns[0] == "file_id"
+
+        atg = AlignedTextGrid(CORPUS[0], [Word, Phone])
+        assert df.filter(pl.col("file_id") == 3).drop("file_id").equals(to_df(atg))
+
+    def test_in_process(self, tmp_path):
+        index = corpus_to_parquet(
+            CORPUS[:2], 
+            tmp_path, 
+            [Word, Phone], 
+            max_workers = 1,
+            with_subset = False
+        )
+        assert index["part"].to_list() == ["part-000000.parquet"] * 2
+        df = pl.read_parquet(tmp_path / "part-000000.parquet")
+        assert "entry_class" in df.columns
+        assert df.height == index["rows"].sum()
+
+    def test_existing_parts(self, tmp_path):
+        corpus_to_parquet(CORPUS[:1], tmp_path, [Word, Phone], max_workers = 1)
+        with pytest.raises(ValueError):
+            corpus_to_parquet(CORPUS[:1], tmp_path, [Word, Phone], max_workers = 1)
@@ -1,8 +1,13 @@
 import pytest
+import pickle
+import subprocess
+import sys
+import os
 from aligned_textgrid.sequences.sequences import *
 from aligned_textgrid.sequences.tiers import *
 from aligned_textgrid.custom_classes import custom_classes, clone_class, get_class_hierarchy
 from aligned_textgrid.aligned_textgrid import AlignedTextGrid
+from aligned_textgrid.sequences.word_and_phone import Word, Phone
 
 class TestCustomCreation:
 
@@ -102,6 +107,22 @@ class TestCloning:
 
         assert isinstance(foo2_inst, FooPoint)
 
+    def test_clone_slots(self):
+        Foo, Bar = custom_classes(["Foo", "Bar"])
+        Foo2 = clone_class(Foo)
+
+        assert "__slots__" not in Foo.__dict__
+        assert "__slots__" not in Foo2.__dict__
+
+        foo2 = Foo2((0, 1, "foo"))
+        foo2.set_feature("new_feat", 5)
+        assert foo2.new_feat == 5
+        assert foo2.__dict__ == {"new_feat": 5}
+
+        foo = Foo._cast(foo2)
+        assert type(foo) is Foo
+        assert foo.label == "foo"
+
 
 class TestGetHierarchy:
 
@@ -112,4 +133,118 @@ class TestGetHierarchy:
         baz_hierarchy = get_class_hierarchy(Baz)
 
         for f,b in zip(foo_hierarchy, baz_hierarchy):
-            assert f is b
\ No newline at end of file
+            assert f is b
+
+class TestPickleClasses:
+
+    def test_pickle_by_reference(self):
+        Foo, Bar = custom_classes(["Foo", "Bar"])
+        Foo2 = clone_class(Foo)
+
+        assert Foo.__qualname__ == "Foo"
+        assert pickle.loads(pickle.dumps(Foo)) is Foo
+        assert pickle.loads(pickle.dumps(Foo2)) is Foo2
+        assert pickle.loads(pickle.dumps(Foo2.subset_class)) is Foo2.subset_class
+        assert pickle.loads(pickle.dumps(Foo.superset_class)) is Foo.superset_class
+
+    def test_new_process(self):
+        Foo, Bar = custom_classes(["Foo", "Bar"])
+        FooPoint, = custom_classes(["FooPoint"], points = [0])
+        Foo2 = clone_class(Foo)
+
+        code = "\n".join([
+            "import pickle, sys",
+            "Foo, Bar, FooPoint, Foo2 = pickle.loads(sys.stdin.buffer.read())",
+            "assert Foo.subset_class is Bar and Bar.superset_class is Foo",
+            "assert Foo.superset_class.__name__ == sys.argv[1]",
+            "assert issubclass(Foo2, Foo) and issubclass(Foo2.subset_class, Bar)",
+            "assert not Foo2.subset_class is Bar",
+            "assert FooPoint((0, 'a')).label == 'a'",
+            "assert pickle.loads(pickle.dumps(Foo2)) is Foo2",
+        ])
+        result = subprocess.run(
+            [sys.executable, "-c", code, Foo.superset_class.__name__],
+            input = pickle.dumps((Foo, Bar, FooPoint, Foo2)),
+            capture_output = True,
+            env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        )
+        assert result.returncode == 0, result.stderr.decode()
+
+    def test_module_keys(self):
+        Key1, = custom_classes(["Key"])
+        Key2, = custom_classes(["Key"])
+        Utt, Word, Phone = custom_classes(["Utt", "Word", "Phone"])
+
+        assert Key1.__module__ != Key2.__module__
+        assert Key1.__module__.rsplit("_", 1)[0] == Key2.__module__.rsplit("_", 1)[0]
+        assert len(Utt.__module__) < 60
+        assert pickle.loads(pickle.dumps(Key2)) is Key2
+
+        import aligned_textgrid._generated as generated
+        key = Utt.__module__.rsplit(".", 1)[1]
+        assert getattr(generated, key).Word is Word
+
+    def test_new_process_same_key(self):
+        Foo, Bar = custom_classes(["Foo", "Bar"])
+        Foo2 = clone_class(Foo)
+
+        code = "\n".join([
+            "import pickle, sys",
+            "from aligned_textgrid import custom_classes",
+            "LocalFoo, LocalBar = custom_classes(['Foo', 'Bar'])",
+            "Foo, Bar, Foo2 = pickle.loads(sys.stdin.buffer.read())",
+            "assert not Foo is LocalFoo",
+            "assert Foo.subset_class is Bar and LocalFoo.subset_class is LocalBar",
+            "assert issubclass(Foo2, Foo)",
+            "assert pickle.loads(pickle.dumps(Foo)) is Foo",
+            "assert pickle.loads(pickle.dumps(LocalFoo)) is LocalFoo",
+        ])
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            input = pickle.dumps((Foo, Bar, Foo2)),
+            capture_output = True,
+            env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        )
+        assert result.returncode == 0, result.stderr.decode()
+
+class TestSharedClasses:
+    tg_path = "tests/test_data/KY25A_1.TextGrid"
+
+    def test_shared_by_default(self):
+        atg1 = AlignedTextGrid(textgrid_path=self.tg_path, entry_classes=[Word, Phone])
+        atg2 = AlignedTextGrid(textgrid_path=self.tg_path, entry_classes=[Word, Phone])
+        assert atg1[0].entry_classes == atg2[0].entry_classes
+        assert not atg1[0].entry_classes[0] is Word
+
+    def test_isolated(self):
+        atg1 = AlignedTextGrid(textgrid_path=self.tg_path, entry_classes=[Word, Phone])
+        atg2 = AlignedTextGrid(
+            textgrid_path=self.tg_path, 
+            entry_classes=[Word, Phone],
+            isolate_classes=True
+        )
+        assert atg1[0].entry_classes[0] is not atg2[0].entry_classes[0]
+        assert atg1[0].entry_classes[1] is not atg2[0].entry_classes[1]
+
+    def test_interleave_isolates(self):
+        atg1 = AlignedTextGrid(textgrid_path=self.tg_path, entry_classes=[Word, Phone])
+        atg2 = AlignedTextGrid(textgrid_path=self.tg_path, entry_classes=[Word, Phone])
+        SharedWord = atg2[0].entry_classes[0]
+
+        atg1.interleave_class("Syllable", above = "Phone")
+        assert atg1[0].entry_classes[0] is not SharedWord
+        assert atg1[0].Word.first.subset_class.__name__ == "Syllable"
+        assert SharedWord.subset_class is atg2[0].entry_classes[1]
+        assert atg2[0].Word.first.fol.label == atg2[0].Word[1].label
+        assert atg2[0].Phone.first.within is atg2[0].Word.first
+
+        atg3 = AlignedTextGrid(textgrid_path=self.tg_path, entry_classes=[Word, Phone])
+        assert atg3[0].entry_classes[0] is SharedWord
+
+    def test_no_class_growth(self):
+        from aligned_textgrid.sequences.sequences import Top
+        AlignedTextGrid(textgrid_path=self.tg_path, entry_classes=[Word, Phone])
+        n_top = len(Top.__subclasses__())
+        for _ in range(10):
+            AlignedTextGrid(textgrid_path=self.tg_path, entry_classes=[Word, Phone])
+        assert len(Top.__subclasses__()) <= n_top
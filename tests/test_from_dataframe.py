@@ -0,0 +1,188 @@
+import pytest
+import warnings
+import numpy as np
+import polars as pl
+from aligned_textgrid import AlignedTextGrid, Word, Phone, to_df
+from aligned_textgrid.polar.polar_classes import ToBI, PrStr, TurningPoints, Levels, Ranges
+from aligned_textgrid.inputs.from_dataframe import from_df, from_arrays
+
+class TestRoundTrip:
+    atg = AlignedTextGrid(
+        "tests/test_data/KY25A_1.TextGrid", 
+        [Word, Phone], 
+        reader = "native"
+    )
+
+    def test_wide(self):
+        df = to_df(self.atg)
+        new_atg = from_df(df, entry_classes = [Word, Phone])
+
+        assert to_df(new_atg).equals(df)
+        assert [tg.name for tg in new_atg] == [tg.name for tg in self.atg]
+        assert new_atg[0].entry_classes[0].__name__ == "Word"
+        word = new_atg[0][0][10]
+        assert word.sub_labels == self.atg[0][0][10].sub_labels
+        assert word.first.super_instance is word
+
+    def test_wide_without_index(self):
+        columns = ["label", "start", "end"]
+        df = to_df(self.atg, columns = columns)
+        new_atg = from_df(df, entry_classes = [Word, Phone])
+        assert to_df(new_atg, columns = columns).equals(df)
+
+    def test_long(self):
+        df = to_df(self.atg, with_subset = False)
+        new_atg = from_df(df, entry_classes = [Word, Phone])
+        assert to_df(new_atg, with_subset = False).equals(df)
+
+    def test_tiergroup_polars(self):
+        new_atg = from_df(self.atg[0].to_polars(), lazy = True)
+        assert new_atg[0]._relation_pending
+        assert to_df(new_atg[0]).drop("name").equals(
+            to_df(self.atg[0]).drop("name")
+        )
+
+    def test_duplicate_names(self):
+        atg = AlignedTextGrid(
+            "tests/test_data/josef-fruehwald_speaker_dup.TextGrid", 
+            [Word, Phone], 
+            reader = "native"
+        )
+        df = to_df(atg)
+        new_atg = from_df(df, entry_classes = [Word, Phone])
+        assert len(new_atg) == 2
+        assert to_df(new_atg).equals(df)
+
+    def test_unordered_parents(self):
+        atg = AlignedTextGrid(
+            "tests/test_data/KY25A_1_multi.TextGrid",
+            [Word, Phone],
+            reader = "native"
+        )
+        df = to_df(atg)
+        with pytest.warns(UserWarning, match = "out of order"):
+            from_df(df, entry_classes = [Word, Phone])
+
+    def test_points(self):
+        entry_classes = [[Word, Phone],[ToBI, PrStr, TurningPoints, Levels],[Ranges]]
+        atg = AlignedTextGrid(
+            "tests/test_data/amelia_knew2-basic.TextGrid", 
+            entry_classes
+        )
+        df = to_df(atg)
+        new_atg = from_df(
+            df, 
+            entry_classes = [ToBI, PrStr, TurningPoints, Levels, Ranges]
+        )
+        assert to_df(new_atg).equals(df)
+        assert new_atg[1][0].entry_class.__name__ == "ToBI"
+
+
+class TestFromArrays:
+    starts = [0, 0.5, 0, 0.2, 0.5, 0.6, 0.8]
+    ends = [0.5, 1, 0.2, 0.5, 0.6, 0.8, 1]
+    labels = ["the", "dog", "DH", "AH0", "D", "AO1", "G"]
+    tiers = ["Word"] * 2 + ["Phone"] * 5
+
+    def test_overlap(self):
+        atg = from_arrays(
+            self.starts,
+            self.ends,
+            self.labels,
+            tiers = self.tiers,
+            entry_classes = [Word, Phone]
+        )
+        assert atg[0].entry_classes[0].__name__ == "Word"
+        assert atg[0].Word[1].sub_labels == ["D", "AO1", "G"]
+
+    def test_parents(self):
+        # "AH0" overlaps "dog" the most, but belongs to "the"
+        ends = list(self.ends)
+        ends[3] = 0.9
+        starts = list(self.starts)
+        starts[4] = 0.9
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            atg = from_arrays(
+                starts,
+                ends,
+                self.labels,
+                tiers = self.tiers,
+                parents = [-1, -1, 0, 0, 1, 1, 1],
+                entry_classes = [Word, Phone]
+            )
+        assert atg[0].Word[0].sub_labels == ["DH", "AH0"]
+
+    def test_unsorted(self):
+        order = [1, 0, 6, 5, 4, 3, 2]
+        parents = np.array([-1, -1, 1, 1, 0, 0, 0])
+        atg = from_arrays(
+            np.array(self.starts)[order],
+            np.array(self.ends)[order],
+            [self.labels[idx] for idx in order],
+            tiers = [self.tiers[idx] for idx in order],
+            parents = parents,
+            groups = ["speaker"] * 7
+        )
+        assert atg[0].name == "speaker"
+        assert atg[0][0].labels == ["the", "dog"]
+        assert atg[0][0][0].sub_labels == ["DH", "AH0"]
+        assert atg[0][0][1].sub_labels == ["D", "AO1", "G"]
+
+    def test_unordered_parents(self):
+        # "AH0" starts after "D" but belongs to "the"
+        starts = list(self.starts)
+        starts[3] = 0.55
+        ends = list(self.ends)
+        ends[3] = 0.6
+        ends[4] = 0.55
+        with pytest.warns(UserWarning, match = "Phone tier"):
+            atg = from_arrays(
+                starts,
+                ends,
+                self.labels,
+                tiers = self.tiers,
+                parents = [-1, -1, 0, 0, 1, 1, 1],
+                entry_classes = [Word, Phone]
+            )
+        assert atg[0].Word[1].sub_labels == ["D", "AH0", "AO1", "G"]
+
+    def test_custom_classes(self):
+        atg = from_arrays(
+            self.starts,
+            self.ends,
+            self.labels,
+            tiers = ["Utt"] * 2 + ["Seg"] * 5
+        )
+        assert [x.__name__ for x in atg[0].entry_classes] == ["Utt", "Seg"]
+        assert atg[0][0][0].sub_labels == ["DH", "AH0"]
+
+    def test_points(self):
+        atg = from_arrays([1, 2], None, ["a", "b"])
+        assert atg[0][0].entry_class.__name__ == "SequencePoint"
+        assert atg[0][0].labels == ["a", "b"]
+
+    def test_errors(self):
+        with pytest.raises(ValueError):
+            from_arrays(self.starts, self.ends, self.labels[1:])
+
+        with pytest.raises(ValueError):
+            from_arrays(
+                self.starts,
+                self.ends,
+                self.labels,
+                tiers = self.tiers,
+                parents = [-1, -1, 0, 0, 1, 1, 2]
+            )
+        
+        with pytest.raises(ValueError):
+            from_arrays(
+                self.starts,
+                self.ends[:2] + [np.nan] * 5,
+                self.labels,
+                tiers = self.tiers,
+                groups = ["speaker"] * 7
+            )
+
+        with pytest.raises(ValueError):
+            from_df(pl.DataFrame({"label": ["a"]}))
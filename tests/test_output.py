@@ -3,8 +3,12 @@ from aligned_textgrid.polar.polar_classes import PrStr, ToBI, \
     TurningPoints, Ranges, Levels, Misc
 from aligned_textgrid.polar.polar_grid import PolarGrid
 from aligned_textgrid.outputs.to_dataframe import to_df
+from aligned_textgrid.snapshot import save_snapshot, load_snapshot
 from functools import reduce
+import polars as pl
+import pytest
 import cloudpickle
+import pickle
 class TestDataframes:
 
     atg = AlignedTextGrid(
@@ -76,6 +80,43 @@ class TestDataframes:
         assert df1.shape[0] == len(self.atg[0].Phone)+ len(self.atg[1].Phone)
         assert df2.shape[0] == total_len
 
+    def test_columns(self):
+        df1 = to_df(self.atg, columns = ["label", "start", "end"])
+        df2 = to_df(self.atg[0], with_subset = False, columns = "label")
+
+        assert df1.columns == [
+            "Word_label", "Word_start", "Word_end",
+            "Phone_label", "Phone_start", "Phone_end",
+            "name"
+        ]
+        assert df1.equals(to_df(self.atg).select(df1.columns))
+        assert df2.columns == ["label", "entry_class", "name"]
+
+        with pytest.raises(ValueError):
+            to_df(self.atg, columns = ["duration"])
+        with pytest.raises(ValueError):
+            to_df(self.atg, columns = [])
+
+    def test_ids(self):
+        df = to_df(self.atg[0])
+        phone = self.atg[0].Phone[10]
+        row = df.filter(pl.col("Phone_tier_index") == 10)
+
+        assert row["Phone_id"].item() == phone.id
+        assert row["Word_id"].item() == phone.inword.id
+        assert row["Word_tier_index"].item() == phone.inword.tier_index
+
+        df = to_df(self.atg[0].Phone, with_subset = False)
+        assert df["id"].to_list() == [x.id for x in self.atg[0].Phone]
+
+    def test_lazy_df(self, tmp_path):
+        path = tmp_path / "snapshot.parquet"
+        save_snapshot(self.atg, path)
+        atg = load_snapshot(path, lazy = True)
+
+        assert to_df(atg).equals(to_df(self.atg))
+        assert all([tg._relation_pending for tg in atg])
+
 class TestPickle:
     atg = AlignedTextGrid(
         textgrid_path="tests/test_data/KY25A_1.TextGrid",
@@ -84,6 +125,82 @@ class TestPickle:
     def test_pickling(self):
         assert cloudpickle.loads(cloudpickle.dumps(self.atg))
 
+    def test_plain_pickle(self):
+        new_atg = pickle.loads(pickle.dumps(self.atg))
+
+        assert new_atg.tier_names == self.atg.tier_names
+        for new_group, group in zip(new_atg, self.atg):
+            for new_tier, tier in zip(new_group, group):
+                assert new_tier.labels == tier.labels
+                assert (new_tier.starts == tier.starts).all()
+                assert (new_tier.ends == tier.ends).all()
+        
+        word = new_atg[0].Word[10]
+        assert word.subset_list.labels == self.atg[0].Word[10].subset_list.labels
+        assert word.first.super_instance is word
+        assert word.fol is new_atg[0].Word[11]
+
+    def test_long_textgrid(self):
+        atg = AlignedTextGrid(
+            "tests/test_data/josef-fruehwald_speaker.TextGrid",
+            entry_classes = [Word, Phone]
+        )
+        atg[0].Word[3].set_feature("note", "checked")
+        atg[0].name = "speaker"
+        new_atg = pickle.loads(pickle.dumps(atg))
+
+        assert len(new_atg[0].Phone) == len(atg[0].Phone)
+        assert new_atg[0].Word[3].note == "checked"
+        assert new_atg.speaker is new_atg[0]
+
+    def test_custom_and_points(self):
+        atg = AlignedTextGrid(
+            "tests/test_data/KY25A_1_multi.TextGrid",
+            entry_classes = [
+                [Word, Phone], 
+                custom_classes(["Turn"]), 
+                [Word, Phone], 
+                custom_classes(["Turn"])
+            ]
+        )
+        new_atg = pickle.loads(pickle.dumps(atg))
+        assert [x.__name__ for x in new_atg[1].entry_classes] == ["Turn"]
+        assert new_atg[1].Turn.labels == atg[1].Turn.labels
+
+        ptg = PolarGrid(
+            textgrid_path = "tests/test_data/amelia_knew2-basic.TextGrid",
+            entry_classes = [[Word, Phone], [ToBI, PrStr, TurningPoints, Levels], [Ranges]]
+        )
+        new_ptg = pickle.loads(pickle.dumps(ptg))
+        assert isinstance(new_ptg, PolarGrid)
+        assert (new_ptg.Levels.times == ptg.Levels.times).all()
+        assert new_ptg.Levels[0].turning_point is new_ptg.TurningPoints[0]
+
+    def test_textgrid_attributes(self):
+        atg = AlignedTextGrid(
+            "tests/test_data/KY25A_1.TextGrid",
+            entry_classes = [Word, Phone]
+        )
+        atg.source = {"speaker": "KY25A"}
+        atg.interviewer = atg[1]
+        atg.phones = atg[0].Phone
+        new_atg = pickle.loads(pickle.dumps(atg))
+
+        assert new_atg.source == {"speaker": "KY25A"}
+        assert new_atg.interviewer is new_atg[1]
+        assert new_atg.phones is new_atg[0].Phone
+        assert new_atg.xmin == atg.xmin
+        assert new_atg.xmax == atg.xmax
+
+    def test_tiers_and_groups(self):
+        group = pickle.loads(pickle.dumps(self.atg[0]))
+        assert isinstance(group, TierGroup)
+        assert group.Word[0].subset_list.labels == self.atg[0].Word[0].subset_list.labels
+
+        tier = pickle.loads(pickle.dumps(self.atg[0].Phone))
+        assert isinstance(tier, SequenceTier)
+        assert tier.labels == self.atg[0].Phone.labels
+
 class TestCustomWrite:
 
     def test_write(self):
@@ -0,0 +1,163 @@
+import pytest
+from aligned_textgrid.inputs.read_textgrid import read_textgrid, parse_textgrid
+from aligned_textgrid import AlignedTextGrid, Word, Phone
+from aligned_textgrid.polar.polar_classes import ToBI, PrStr, TurningPoints, Levels, Ranges
+from aligned_textgrid.outputs.to_dataframe import to_df
+from praatio.textgrid import openTextgrid
+import numpy as np
+
+class TestReadTextGrid:
+
+    def test_matches_praatio(self):
+        path = "tests/test_data/josef-fruehwald_speaker_dup.TextGrid"
+        tg_data = read_textgrid(path)
+        tg = openTextgrid(path, True, duplicateNamesMode = "rename")
+
+        assert tg_data.tier_names == list(tg.tierNames)
+        for tier_data, tier in zip(tg_data.tiers, tg.tiers):
+            assert tier_data.labels == [x.label for x in tier.entries]
+            assert np.array_equal(tier_data.starts, [x.start for x in tier.entries])
+            assert np.array_equal(tier_data.ends, [x.end for x in tier.entries])
+
+    def test_short_format(self, tmp_path):
+        path = "tests/test_data/KY25A_1.TextGrid"
+        short_path = tmp_path / "short.TextGrid"
+        openTextgrid(path, True).save(
+            str(short_path),
+            format = "short_textgrid",
+            includeBlankSpaces = True
+        )
+        long_data = read_textgrid(path)
+        short_data = read_textgrid(short_path)
+
+        assert short_data.tier_names == long_data.tier_names
+        for short_tier, long_tier in zip(short_data.tiers, long_data.tiers):
+            assert short_tier.labels == long_tier.labels
+            assert np.array_equal(short_tier.starts, long_tier.starts)
+
+    def test_utf16(self, tmp_path):
+        path = "tests/test_data/KY25A_1.TextGrid"
+        utf16_path = tmp_path / "utf16.TextGrid"
+        with open(path, encoding = "utf-8") as f:
+            utf16_path.write_bytes(f.read().encode("utf-16"))
+
+        assert read_textgrid(utf16_path).tiers[0].labels == \
+            read_textgrid(path).tiers[0].labels
+
+    def test_quotes(self):
+        data = '\n'.join([
+            'File type = "ooTextFile"',
+            'Object class = "TextGrid"',
+            '',
+            '0', '1', '<exists>', '1',
+            '"IntervalTier"', '"words"', '0', '1', '2',
+            '0', '0.5', '"say ""hi"""',
+            '0.5', '1', '""'
+        ])
+        tg_data = parse_textgrid(data)
+        assert tg_data.tiers[0].labels == ['say "hi"', '']
+
+    def test_include_tiers(self):
+        path = "tests/test_data/KY25A_1_multi.TextGrid"
+        all_data = read_textgrid(path)
+        tg_data = read_textgrid(path, include_tiers = [".* - words", "IVR - phones"])
+
+        assert tg_data.tier_names == ["KY25A - words", "IVR - words", "IVR - phones"]
+        assert tg_data.tiers[2].labels == all_data.tiers[4].labels
+
+    def test_label_headings(self):
+        data = '\n'.join([
+            'File type = "ooTextFile"',
+            'Object class = "TextGrid"',
+            '',
+            'xmin = 0',
+            'xmax = 1',
+            'tiers? <exists>',
+            'size = 2',
+            'item []:',
+            '    item [1]:',
+            '        class = "IntervalTier"',
+            '        name = "a"',
+            '        xmin = 0',
+            '        xmax = 1',
+            '        intervals: size = 1',
+            '        intervals [1]:',
+            '            xmin = 0',
+            '            xmax = 1',
+            '            text = "x',
+            '    item [3]:',
+            '"',
+            '    item [2]:',
+            '        class = "IntervalTier"',
+            '        name = "b"',
+            '        xmin = 0',
+            '        xmax = 1',
+            '        intervals: size = 1',
+            '        intervals [1]:',
+            '            xmin = 0',
+            '            xmax = 1',
+            '            text = "y"',
+        ])
+        tg_data = parse_textgrid(data, include_tiers = ["b"])
+        assert tg_data.tier_names == ["b"]
+        assert tg_data.tiers[0].labels == ["y"]
+        assert parse_textgrid(data).tiers[0].labels == ["x\n    item [3]:"]
+
+    def test_bad_file(self):
+        with pytest.raises(ValueError):
+            parse_textgrid("not a textgrid")
+
+class TestNativeReader:
+
+    def test_aligned_textgrid(self):
+        path = "tests/test_data/KY25A_1.TextGrid"
+        praatio_atg = AlignedTextGrid(path, [Word, Phone])
+        native_atg = AlignedTextGrid(path, [Word, Phone], reader = "native")
+
+        assert native_atg.tier_names == praatio_atg.tier_names
+        assert to_df(native_atg).equals(to_df(praatio_atg))
+
+    def test_point_tiers(self):
+        path = "tests/test_data/amelia_knew2-basic.TextGrid"
+        entry_classes = [[Word, Phone],[ToBI, PrStr, TurningPoints, Levels],[Ranges]]
+        praatio_atg = AlignedTextGrid(path, entry_classes)
+        native_atg = AlignedTextGrid(path, entry_classes, reader = "native")
+
+        assert to_df(native_atg).equals(to_df(praatio_atg))
+        assert native_atg[1][0].name == praatio_atg[1][0].name
+
+    def test_include_tiers(self):
+        path = "tests/test_data/KY25A_1_multi.TextGrid"
+        for reader in ["praatio", "native"]:
+            atg = AlignedTextGrid(
+                path, 
+                [Word, Phone], 
+                reader = reader,
+                include_tiers = ["KY25A - (words|phones)"]
+            )
+            assert len(atg) == 1
+            assert atg.tier_names == [["KY25A - words", "KY25A - phones"]]
+
+        with pytest.raises(ValueError):
+            AlignedTextGrid(path, include_tiers = ["missing"])
+
+    def test_include_tiers_reader(self, monkeypatch):
+        import aligned_textgrid.aligned_textgrid as atg_module
+
+        def no_praatio(*args, **kwargs):
+            raise AssertionError("praatio was used")
+
+        monkeypatch.setattr(atg_module, "openTextgrid", no_praatio)
+        atg = AlignedTextGrid(
+            "tests/test_data/KY25A_1_multi.TextGrid",
+            [Word, Phone],
+            include_tiers = ["IVR - (words|phones)"]
+        )
+        assert atg.tier_names == [["IVR - words", "IVR - phones"]]
+
+        with pytest.raises(AssertionError):
+            AlignedTextGrid("tests/test_data/KY25A_1.TextGrid", [Word, Phone])
+
+    def test_bad_reader(self):
+        with pytest.raises(ValueError):
+            AlignedTextGrid("tests/test_data/KY25A_1.TextGrid", reader = "other")
@@ -121,6 +121,58 @@ class TestSequenceList:
         my_list.remove(second_word)
         assert not second_word in my_list
 
+    def test_value_membership(self):
+        MyWord, = custom_classes(["MyWord"])
+        words = make_sequences(MyWord, 20)
+        my_list = SequenceList(*words)
+
+        twin = MyWord(words[4])
+        assert not twin is words[4]
+        assert twin in my_list
+
+        words[4].label = "changed"
+        assert not twin in my_list
+        assert words[4] in my_list
+
+        my_list.remove(MyWord(words[4]))
+        assert not words[4] in my_list
+        assert len(my_list) == 19
+
+        with pytest.raises(ValueError):
+            my_list.remove(words[4])
+
+        my_list.pop(MyWord(words[5]))
+        assert not words[5] in my_list
+        assert len(my_list) == 18
+
+        words[6].label = words[7].label
+        words[6].end = words[7].end
+        words[6].start = words[7].start
+        twin = MyWord(words[7])
+        assert my_list._index_entry(twin) == my_list.index(words[6])
+        my_list.remove(twin)
+        assert not any(x is words[6] for x in my_list)
+        assert any(x is words[7] for x in my_list)
+        assert my_list._index_entry(twin) == my_list.index(words[7])
+
+    def test_overlaps(self):
+        MyWord, = custom_classes(["MyWord"])
+        tight = SequenceList(*make_sequences(MyWord, 50))
+        assert tight._find_overlaps().shape == (0, 2)
+        assert tight._check_no_overlaps()
+
+        loose = SequenceList(
+            MyWord((0, 5, "a")),
+            MyWord((1, 2, "b")),
+            MyWord((5, 6, "c")),
+            MyWord((5.5, 7, "d"))
+        )
+        pairs = loose._find_overlaps()
+        assert pairs.tolist() == [[0, 1], [2, 3]]
+
+        with pytest.warns(UserWarning, match="overlap"):
+            assert not loose._check_no_overlaps()
+
     def test_remove_super_instance(self):
         MyWord, MyPhone = custom_classes(["MyWord", "MyPhone"])
 
@@ -159,6 +211,121 @@ class TestSequenceList:
         assert len(my_list1) == (n*2)
         assert my_list1.ends.max() == orig_end + orig_end
 
+    def test_extend(self):
+        MyWord, = custom_classes(["MyWord"])
+        words = make_sequences(MyWord, 20)
+
+        my_list = SequenceList(*words[::2])
+        orig_version = my_list.version
+        my_list.extend(words[1::2] + [words[0]])
+
+        assert len(my_list) == 20
+        assert my_list.version > orig_version
+        assert [x is w for x, w in zip(my_list, words)] == [True] * 20
+        assert np.array_equal(my_list.starts, [w.start for w in words])
+        assert my_list.labels == [w.label for w in words]
+
+        added = my_list + [MyWord((25, 26, "new"))]
+        assert len(added) == 21
+        assert len(my_list) == 20
+        assert added[-1].label == "new"
+
+        with pytest.raises(ValueError):
+            my_list.extend([MyWord((30, 31, "x")), SequenceInterval((31, 32, "y"))])
+
+    def test_cached_columns(self):
+        MyWord, = custom_classes(["MyWord"])
+        words = make_sequences(MyWord, 10)
+        my_list = SequenceList(*words[1:])
+
+        starts = my_list.starts
+        assert not starts.flags.writeable
+        assert my_list.starts.base is starts.base
+
+        orig_version = my_list.version
+        my_list.append(words[0])
+        assert my_list.version > orig_version
+        assert my_list.starts[0] == words[0].start
+        assert len(starts) == 9
+        assert np.array_equal(my_list.starts, [w.start for w in words])
+        assert my_list.labels == [w.label for w in words]
+
+        words[3].label = "new"
+        words[3].start = -1
+        assert my_list.labels[3] == "new"
+        assert my_list.starts[3] == -1
+
+        my_list.remove(words[5])
+        assert len(my_list.starts) == 9
+        assert np.array_equal(my_list.ends, [w.end for w in my_list])
+
+        my_list._shift(1)
+        assert np.array_equal(my_list.starts, [w.start for w in my_list])
+
+    def test_edits_per_list(self):
+        MyWord, = custom_classes(["MyWord"])
+        words = make_sequences(MyWord, 10)
+        list_a = SequenceList(*words[:5])
+        list_b = SequenceList(*words[5:])
+        both = SequenceList(*words[3:7])
+
+        b_starts = list_b.starts
+        a_starts = list_a.starts
+        words[2].start = -1
+        words[2].label = "new"
+
+        # the other list's cached columns are untouched
+        assert list_b.starts.base is b_starts.base
+        assert list_a.starts[2] == -1
+        assert list_a.labels[2] == "new"
+        assert a_starts[2] != -1
+
+        words[4].end = 100
+        assert list_a.ends[4] == 100
+        assert both.ends[1] == 100
+
+        list_a.remove(words[4])
+        words[4].end = 200
+        assert both.ends[1] == 200
+        assert list_a.ends[-1] == words[3].end
+
+    def test_edit_lookup(self):
+        MyWord, = custom_classes(["MyWord"])
+        words = make_sequences(MyWord, 20)
+        my_list = SequenceList(*words[1:])
+        my_list.append(words[0])
+        my_list.starts
+
+        # edits find the entry by its old start time,
+        # without rebuilding the position cache
+        for word in words[5:10]:
+            word.start = word.start + 0.01
+            word.end = word.end - 0.01
+            word.label = "new"
+        assert my_list._positions_version != my_list.version
+        assert np.array_equal(my_list.starts, [w.start for w in words])
+        assert np.array_equal(my_list.ends, [w.end for w in words])
+        assert my_list.labels == [w.label for w in words]
+
+    def test_index(self):
+        MyWord, = custom_classes(["MyWord"])
+        words = make_sequences(MyWord, 10)
+        my_list = SequenceList(*words[1:])
+
+        assert [my_list.index(w) for w in words[1:]] == list(range(9))
+
+        my_list.append(words[0])
+        assert [my_list.index(w) for w in words] == list(range(10))
+
+        my_list.remove(words[4])
+        assert my_list.index(words[5]) == 4
+        with pytest.raises(ValueError):
+            my_list.index(words[4])
+
+        with pytest.raises(ValueError):
+            my_list.index(words[2], start=3)
+        assert my_list.index(words[2], 1, 3) == 2
+
 
 
     pass
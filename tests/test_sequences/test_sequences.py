@@ -57,6 +57,17 @@ class TestSequenceIntervalDefault:
     def test_default_prev(self):
         assert self.seq_int.fol.label == "#"
 
+    def test_shared_edges(self):
+        local_sample = self.SampleClassI()
+        other_sample = self.SampleClassI()
+        assert local_sample.fol is other_sample.prev
+        assert type(local_sample.fol) is self.SampleClassI
+        assert self.seq_int.fol is not local_sample.fol
+        assert local_sample.fol.fol is None
+
+        with pytest.raises(AttributeError):
+            local_sample.fol.label = "x"
+
     def test_default_super_strictness(self):
         local_sample = self.SampleClassI()
         with pytest.raises(Exception):
@@ -0,0 +1,98 @@
+import pytest
+import pickle
+from aligned_textgrid import AlignedTextGrid, Word, Phone, custom_classes
+from aligned_textgrid.polar.polar_classes import ToBI, PrStr, TurningPoints, Levels, Ranges
+from aligned_textgrid.snapshot import save_snapshot, load_snapshot, read_snapshot
+from aligned_textgrid.outputs.to_dataframe import to_df
+
+class TestSnapshot:
+
+    def test_round_trip(self, tmp_path):
+        atg = AlignedTextGrid("tests/test_data/KY25A_1.TextGrid", [Word, Phone])
+        path = tmp_path / "snapshot.parquet"
+        atg.save_snapshot(path)
+
+        new_atg = load_snapshot(path)
+        assert new_atg.tier_names == atg.tier_names
+        assert [tg.name for tg in new_atg] == [tg.name for tg in atg]
+        assert to_df(new_atg).equals(to_df(atg))
+        assert new_atg[0].entry_classes[0].__name__ == "Word"
+
+        word = new_atg[0][0][10]
+        assert [x.label for x in word] == [x.label for x in atg[0][0][10]]
+        assert word.first.super_instance is word
+        assert word.last.fol.label == "#"
+
+    def test_group_names(self, tmp_path):
+        atg = AlignedTextGrid("tests/test_data/KY25A_1.TextGrid", [Word, Phone])
+        atg[0].name = "renamed"
+        atg._set_group_names()
+        path = tmp_path / "snapshot.parquet"
+        save_snapshot(atg, path)
+
+        new_atg = load_snapshot(path)
+        assert new_atg[0].name == "renamed"
+        assert [tg.name for tg in new_atg] == [tg.name for tg in atg]
+        assert new_atg.renamed is new_atg[0]
+
+    def test_lazy(self, tmp_path):
+        atg = AlignedTextGrid("tests/test_data/KY25A_1.TextGrid", [Word, Phone])
+        path = tmp_path / "snapshot.parquet"
+        save_snapshot(atg, path)
+
+        new_atg = load_snapshot(path, lazy = True)
+        assert new_atg[0]._relation_pending
+        assert new_atg[0][1].labels == atg[0][1].labels
+        assert new_atg[0][1][5].super_instance.label == atg[0][1][5].super_instance.label
+        assert not new_atg[0]._relation_pending
+
+    def test_custom_and_points(self, tmp_path):
+        entry_classes = [[Word, Phone],[ToBI, PrStr, TurningPoints, Levels],[Ranges]]
+        atg = AlignedTextGrid("tests/test_data/amelia_knew2-basic.TextGrid", entry_classes)
+        path = tmp_path / "snapshot.parquet"
+        save_snapshot(atg, path)
+
+        tg_data, class_names = read_snapshot(path)
+        assert class_names == [
+            ["Word", "Phone"], 
+            ["ToBI", "PrStr", "TurningPoints", "Levels"], 
+            ["Ranges"]
+        ]
+        assert tg_data.related
+
+        new_atg = load_snapshot(path, entry_classes = [ToBI, PrStr, TurningPoints, Levels, Ranges])
+        assert to_df(new_atg).equals(to_df(atg))
+        assert new_atg[1][0].entry_class.__name__ == "ToBI"
+
+    def test_links(self, tmp_path):
+        atg = AlignedTextGrid("tests/test_data/josef-fruehwald_speaker.TextGrid", [Word, Phone])
+        path = tmp_path / "snapshot.parquet"
+        save_snapshot(atg, path)
+
+        new_atg = load_snapshot(path)
+        for new_tier, tier in zip(new_atg[0], atg[0]):
+            assert [(x.prev.label, x.fol.label) for x in new_tier] == \
+                [(x.prev.label, x.fol.label) for x in tier]
+            assert [x.id for x in new_tier] == [x.id for x in tier]
+        assert new_atg[0].Phone[0].intier is new_atg[0].Phone
+
+    def test_unordered_parents(self, tmp_path):
+        atg = AlignedTextGrid("tests/test_data/KY25A_1_multi.TextGrid", [Word, Phone])
+        path = tmp_path / "snapshot.parquet"
+        save_snapshot(atg, path)
+
+        # Tiers whose superset indices are out of order 
+        # are related by their timing instead.
+        tg_data, _ = read_snapshot(path)
+        assert not tg_data.related
+        new_atg = load_snapshot(path)
+        assert [len(tg) for tg in new_atg] == [len(tg) for tg in atg]
+        for new_tier, tier in zip(new_atg[0], atg[0]):
+            assert new_tier.labels == tier.labels
+        assert to_df(new_atg).equals(to_df(pickle.loads(pickle.dumps(atg))))
+
+    def test_not_snapshot(self, tmp_path):
+        path = tmp_path / "other.parquet"
+        to_df(AlignedTextGrid("tests/test_data/KY25A_1.TextGrid", [Word, Phone])).write_parquet(path)
+        with pytest.raises(ValueError):
+            load_snapshot(path)
@@ -68,6 +68,30 @@ class TestPointTierCreation:
         out_tier = self.seq_point_tier.return_tier()
         assert isinstance(out_tier, PointTier)
 
+class TestPointFromArrays:
+    def test_from_arrays(self):
+        times = np.array([2, 1, 3])
+        point_tier = SequencePointTier.from_arrays(
+            times, 
+            ["b", "a", "c"],
+            name = "test"
+        )
+        assert point_tier.labels == ["a", "b", "c"]
+        assert point_tier.times.tolist() == [1, 2, 3]
+        assert point_tier.name == "test"
+        assert point_tier[0].tiername == "test"
+        assert point_tier[1].prev is point_tier[0]
+        assert point_tier[1].fol is point_tier[2]
+        assert point_tier[0].intier is point_tier
+        assert point_tier.sequence_list.labels == ["a", "b", "c"]
+
+        times[0] = 10
+        assert point_tier.times.tolist() == [1, 2, 3]
+
+    def test_errors(self):
+        with pytest.raises(ValueError):
+            SequencePointTier.from_arrays([1, 2], ["a"])
+
 class TestClassSetting:
 
     class MyPointA(SequencePoint):
@@ -264,4 +288,27 @@ class TestAccessors:
     def test_too_many(self):
         with pytest.warns():
             seq_point_group2 = PointsGroup(tiers = [self.seq_point_tier1, self.seq_point_tier3])
-            
\ No newline at end of file
+            
+class TestPointColumnExport:
+    seq_point_tier = SequencePointTier([
+        SequencePoint((1, "a")),
+        SequencePoint((2, "b"))
+    ])
+
+    def test_numpy(self):
+        arrays = self.seq_point_tier.to_numpy()
+        assert list(arrays) == ["start", "label"]
+        assert arrays["start"].tolist() == [1, 2]
+        assert arrays["label"].tolist() == ["a", "b"]
+        assert not arrays["start"].flags.writeable
+
+    def test_polars(self):
+        df = self.seq_point_tier.to_polars()
+        assert df.columns == ["start", "label"]
+        assert df["start"].to_list() == [1, 2]
+
+    def test_group(self):
+        group = PointsGroup([self.seq_point_tier])
+        df = group.to_polars()
+        assert df.columns == ["tier", "start", "label"]
+        assert df["tier"].to_list() == ["SequencePoint"] * 2
@@ -7,6 +7,15 @@ from praatio.utilities.constants import Interval
 from praatio.data_classes.interval_tier import IntervalTier
 from praatio.textgrid import openTextgrid
 
+def column_tier(tier:IntervalTier, entry_class)->SequenceTier:
+    """A tier stored only as columns, as with `lazy=True`"""
+    return SequenceTier.from_arrays(
+        [x.start for x in tier.entries],
+        [x.end for x in tier.entries],
+        [x.label for x in tier.entries],
+        entry_class = entry_class
+    )
+
 class TestSequenceTierDefault:
 
     default_tier = SequenceTier()
@@ -252,6 +261,85 @@ class TestReadTier:
         assert type(out_tier) is IntervalTier
         assert len(out_tier.entries) == len(word_tier)
 
+    def test_columns(self):
+        assert SequenceTier(self.read_tg.tiers[0])._columns is None
+        word_tier = column_tier(self.read_tg.tiers[0], self.MyWord)
+        orig_entries = self.read_tg.tiers[0].entries
+
+        ## nothing created yet
+        assert word_tier._columns is not None
+        assert len(word_tier) == len(orig_entries)
+        assert word_tier.labels == [x.label for x in orig_entries]
+        assert word_tier.xmin == orig_entries[0].start
+
+        word_tier._shift(5)
+        assert word_tier.get_interval_at_time(orig_entries[3].start + 5) == 3
+        assert word_tier.return_tier().entries[3].start == orig_entries[3].start + 5
+        assert word_tier._columns is not None
+
+        ## created on access
+        entry = word_tier[3]
+        assert word_tier._columns is None
+        assert type(entry) is self.MyWord
+        assert entry.start == orig_entries[3].start + 5
+        assert entry.intier is word_tier
+        assert entry.fol is word_tier[4]
+        assert entry.within is word_tier
+
+class TestFromArrays:
+    starts = np.array([0.5, 0, 1])
+    ends = np.array([1, 0.5, 2])
+    labels = ["dog", "the", "barked"]
+
+    def test_from_arrays(self):
+        tier = SequenceTier.from_arrays(
+            self.starts,
+            self.ends,
+            self.labels,
+            entry_class = Word,
+            name = "words"
+        )
+        assert tier.name == "words"
+        assert tier.entry_class is Word
+        assert tier.labels == ["the", "dog", "barked"]
+        assert np.array_equal(tier.starts, [0, 0.5, 1])
+        assert tier._columns is not None
+
+        ## inputs are copied
+        self.starts[0] = 10
+        assert tier.starts[1] == 0.5
+        self.starts[0] = 0.5
+
+        assert type(tier[1]) is Word
+        assert tier[1].prev is tier[0]
+        assert tier[1].fol is tier[2]
+        assert tier[2].fol.label == "#"
+        assert tier[0].intier is tier
+        assert np.array_equal(tier.sequence_list.ends, [0.5, 1, 2])
+
+    def test_errors(self):
+        with pytest.raises(ValueError):
+            SequenceTier.from_arrays(self.starts, self.ends[:2], self.labels)
+        with pytest.raises(ValueError):
+            SequenceTier.from_arrays(self.starts, self.ends, self.labels[:2])
+
+    def test_invalid_intervals(self):
+        with pytest.raises(ValueError, match = "start time"):
+            SequenceTier.from_arrays([0, 1], [0.5, 1], ["a", "b"])
+        with pytest.raises(ValueError, match = "start time"):
+            SequenceTier.from_arrays([0, 2], [0.5, 1], ["a", "b"])
+        with pytest.raises(ValueError, match = "overlap"):
+            SequenceTier.from_arrays([0.5, 0], [1, 0.6], ["b", "a"], name = "words")
+
+        tier = SequenceTier.from_arrays([0.5, 0], [1, 0.5], ["b", "a"])
+        assert tier.labels == ["a", "b"]
+
+    def test_empty(self):
+        tier = SequenceTier.from_arrays([], [], [])
+        assert len(tier) == 0
+        assert tier.entry_class is SequenceInterval
+
+
 class TestIntierSetting:
     interval1 = Interval(0,1,"one")
     interval2 = Interval(1,2, "two")
@@ -411,5 +499,163 @@ class TestReadTiers:
 
         assert rt.get_intervals_at_time(5) == [idx1, idx2]
 
+    def test_get_intervals_at_times(self):
+        rt = TierGroup([self.tg_word, self.tg_phone])
+        times = np.random.default_rng(5).uniform(-1, self.tg_word.xmax + 1, 500)
+        times[:10] = self.tg_phone.starts[:10]
+        times[10:20] = self.tg_phone.ends[:10]
+
+        idxes = rt.get_intervals_at_times(times)
+        assert idxes.shape == (2, 500)
+        for tier, tier_idxes in zip(rt, idxes):
+            expected = [
+                np.flatnonzero((tier.starts <= time) & (tier.ends > time))
+                for time in times
+            ]
+            expected = [x[0] if x.size > 0 else -1 for x in expected]
+            assert tier_idxes.tolist() == expected
+            assert tier.get_interval_at_time(times[0]) == tier_idxes[0]
+        
+        assert rt[0].get_interval_at_time(-1) is None
+        assert SequenceTier().get_intervals_at_times([1, 2]).tolist() == [-1, -1]
+
+    def test_lazy(self):
+        word_tier = column_tier(self.read_tg.tiers[0], self.MyWord)
+        phone_tier = column_tier(self.read_tg.tiers[1], self.MyPhone)
+        rt = TierGroup([word_tier, phone_tier], lazy = True)
+
+        assert rt._relation_pending
+        assert word_tier.labels == [x.label for x in self.read_tg.tiers[0].entries]
+        assert len(phone_tier.starts) == len(self.read_tg.tiers[1].entries)
+        rt.cleanup()
+        assert rt._relation_pending
+
+        phone = phone_tier[10]
+        assert not rt._relation_pending
+        assert phone.super_instance is not None
+        assert phone in phone.super_instance
+
+
+
+
+class TestOverlapRelation:
+
+    def dense_containers(self, us, ue, ls, le):
+        overlaps = np.minimum.outer(le, ue) - np.maximum.outer(ls, us)
+        return overlaps.argmax(axis = 1), overlaps.max(axis = 1)
+
+    def test_matches_dense(self):
+        from aligned_textgrid.sequences.tiers import _overlap_containers
+        rng = np.random.default_rng(10)
+        for _ in range(500):
+            upper = np.sort(rng.integers(0, 20, size = 6)).astype(float)
+            lower = np.sort(rng.integers(0, 20, size = 10)).astype(float)
+            us, ue = upper[:-1], upper[1:]
+            ls, le = lower[:-1], lower[1:]
+            container, overlap = _overlap_containers(us, ue, ls, le)
+            d_container, d_overlap = self.dense_containers(us, ue, ls, le)
+            assert np.array_equal(container, d_container)
+            assert np.array_equal(overlap, d_overlap)
+
+    def test_mismatched_relation(self):
+        words = SequenceTier([
+            Word((0, 1, "the")),
+            Word((1, 2, "dog"))
+        ])
+        phones = SequenceTier([
+            Phone((0, 0.5, "DH")),
+            Phone((0.5, 1.1, "AH0")),
+            Phone((1.1, 1.5, "D")),
+            Phone((1.5, 2, "G"))
+        ])
+
+        with pytest.warns(UserWarning, match="didn't exactly match"):
+            tg = TierGroup([words, phones])
+
+        assert tg[0][0].sub_labels == ["DH", "AH0"]
+        assert tg[0][1].sub_labels == ["D", "G"]
+
+class TestColumnExport:
+    read_tg = openTextgrid(
+        fnFullPath="tests/test_data/josef-fruehwald_speaker.TextGrid",
+        includeEmptyIntervals=True
+    )
 
-
+    class ArrowWrapper:
+        def __init__(self, obj):
+            self.obj = obj
+
+        def __arrow_c_stream__(self, requested_schema = None):
+            return self.obj.__arrow_c_stream__(requested_schema)
+
+    def test_tier_numpy(self):
+        import polars as pl
+        word_tier = column_tier(self.read_tg.tiers[0], Word)
+        arrays = word_tier.to_numpy()
+
+        assert list(arrays) == ["start", "end", "label"]
+        assert np.array_equal(arrays["start"], word_tier.starts)
+        assert np.array_equal(arrays["end"], word_tier.ends)
+        assert arrays["label"].dtype == np.dtypes.StringDType()
+        assert arrays["label"].tolist() == word_tier.labels
+        assert np.shares_memory(arrays["start"], word_tier._time_columns[0])
+        assert word_tier._columns is not None
+        for array in arrays.values():
+            assert not array.flags.writeable
+        with pytest.raises(ValueError):
+            arrays["start"][0] = 1
+
+    def test_tier_polars(self):
+        import polars as pl
+        word_tier = SequenceTier(self.read_tg.tiers[0], entry_class=Word)
+        df = word_tier.to_polars()
+
+        assert df.columns == ["start", "end", "label"]
+        assert df.dtypes == [pl.Float64, pl.Float64, pl.String]
+        assert np.shares_memory(
+            df["start"].to_numpy(), 
+            word_tier._time_columns[0]
+        )
+        assert df["label"].to_list() == word_tier.labels
+
+        from_arrow = pl.from_arrow(self.ArrowWrapper(word_tier))
+        assert from_arrow.struct.unnest().equals(df)
+
+    def test_group(self):
+        import polars as pl
+        word_tier = SequenceTier(self.read_tg.tiers[0], entry_class=Word)
+        phone_tier = SequenceTier(self.read_tg.tiers[1], entry_class=Phone)
+        group = TierGroup([word_tier, phone_tier])
+
+        arrays = group.to_numpy()
+        assert list(arrays) == ["Word", "Phone"]
+        assert np.all(arrays["Word"]["parent"] == -1)
+        assert [
+            group[0][idx] for idx in arrays["Phone"]["parent"]
+        ] == [phone.super_instance for phone in group[1]]
+
+        df = group.to_polars()
+        assert df.columns == ["tier", "start", "end", "label", "parent"]
+        assert df.height == len(word_tier) + len(phone_tier)
+        assert df.filter(pl.col("tier") == "Phone")["parent"].to_list() \
+            == arrays["Phone"]["parent"].tolist()
+
+        from_arrow = pl.from_arrow(self.ArrowWrapper(group))
+        assert from_arrow.struct.unnest().equals(df)
+
+    def test_lazy_group(self):
+        word_tier = SequenceTier(self.read_tg.tiers[0], entry_class=Word)
+        phone_tier = SequenceTier(self.read_tg.tiers[1], entry_class=Phone)
+        parents = TierGroup([word_tier, phone_tier])._superset_indices()
+
+        word_tier = column_tier(self.read_tg.tiers[0], Word)
+        phone_tier = column_tier(self.read_tg.tiers[1], Phone)
+        group = TierGroup._from_parents(
+            [word_tier, phone_tier], 
+            parents, 
+            lazy = True
+        )
+        arrays = group.to_numpy()
+        group.to_polars()
+        assert group._relation_pending
+        assert np.array_equal(arrays["Phone"]["parent"], parents[1])
@@ -92,6 +92,48 @@ class TestContains:
         assert this_d1.id == "0-0"
         assert this_d2.id == "1-0"
 
+    def test_id_after_reorder(self):
+        this_a1 = self.Alpha()
+        this_b1 = self.Beta()
+        this_b2 = self.Beta()
+        this_d1 = self.Delta()
+        this_d2 = self.Delta()
+
+        this_a1.contains = [this_b1, this_b2]
+        this_b1.contains = [this_d1]
+        this_b2.contains = [this_d2]
+
+        assert this_d2.id == "1-0"
+
+        this_a1.contains.reverse()
+        assert this_d2.id == "0-0"
+        assert this_d1.id == "1-0"
+
+        this_b2.contains.insert(0, this_d1)
+        this_d1.within = this_b2
+        assert this_d1.id == "0-0"
+        assert this_d2.id == "0-1"
+
+    def test_cached_id(self):
+        this_a1 = self.Alpha()
+        this_b1 = self.Beta()
+        this_b2 = self.Beta()
+        this_d1 = self.Delta()
+
+        this_a1.contains = [this_b1, this_b2]
+        this_b2.contains = [this_d1]
+
+        cached = this_d1._cached_path()
+        assert this_d1.id == "1-0"
+        assert this_d1._cached_path() is cached
+        assert this_b2._cached_path()[1] is cached[0]
+
+        # a reordered container invalidates the paths below it
+        this_a1.contains.reverse()
+        assert this_d1._cached_path() is not cached
+        assert this_d1.id == "0-0"
+        assert this_d1.within_path == [0, 0]
+
 class TestWithinTG:
 
     one_tg = AlignedTextGrid(
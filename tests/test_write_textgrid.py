@@ -0,0 +1,80 @@
+import pytest
+import io
+from aligned_textgrid.outputs.write_textgrid import write_textgrid
+import aligned_textgrid.outputs.write_textgrid as write_textgrid_module
+from aligned_textgrid import AlignedTextGrid, Word, Phone
+from aligned_textgrid.polar.polar_classes import ToBI, PrStr, TurningPoints, Levels, Ranges
+
+FORMATS = ["long_textgrid", "short_textgrid", "json", "textgrid_json"]
+
+class TestWriteTextGrid:
+
+    @pytest.mark.parametrize("format", FORMATS)
+    def test_matches_praatio(self, tmp_path, format):
+        atg = AlignedTextGrid(
+            "tests/test_data/josef-fruehwald_speaker_dup.TextGrid",
+            entry_classes = [Word, Phone]
+        )
+        # leave a gap and quote a label
+        atg[0].Phone.pop(atg[0].Phone[5])
+        atg[0].Word[3].label = ' a "quoted" label '
+
+        praatio_path = tmp_path / "praatio.TextGrid"
+        native_path = tmp_path / "native.TextGrid"
+        atg.save_textgrid(str(praatio_path), format)
+        atg.save_textgrid(str(native_path), format, writer = "native")
+
+        assert native_path.read_bytes() == praatio_path.read_bytes()
+
+    @pytest.mark.parametrize("format", FORMATS)
+    def test_points(self, tmp_path, format):
+        atg = AlignedTextGrid(
+            "tests/test_data/amelia_knew2-basic.TextGrid",
+            entry_classes = [
+                [Word, Phone],
+                [ToBI, PrStr, TurningPoints, Levels],
+                [Ranges]
+            ]
+        )
+        praatio_path = tmp_path / "praatio.TextGrid"
+        native_path = tmp_path / "native.TextGrid"
+        atg.save_textgrid(str(praatio_path), format)
+        write_textgrid(atg, native_path, format)
+
+        assert native_path.read_bytes() == praatio_path.read_bytes()
+
+    @pytest.mark.parametrize("format", FORMATS)
+    def test_chunks(self, tmp_path, format, monkeypatch):
+        atg = AlignedTextGrid(
+            "tests/test_data/KY25A_1.TextGrid",
+            entry_classes = [Word, Phone]
+        )
+        praatio_path = tmp_path / "praatio.TextGrid"
+        atg.save_textgrid(str(praatio_path), format)
+
+        monkeypatch.setattr(write_textgrid_module, "CHUNK_SIZE", 3)
+        out = io.StringIO()
+        write_textgrid(atg, out, format)
+        assert out.getvalue() == praatio_path.read_text(encoding = "utf-8")
+
+    def test_file_handle(self, tmp_path):
+        atg = AlignedTextGrid(
+            "tests/test_data/KY25A_1.TextGrid",
+            entry_classes = [Word, Phone]
+        )
+        praatio_path = tmp_path / "praatio.TextGrid"
+        atg.save_textgrid(str(praatio_path))
+
+        out = io.StringIO()
+        write_textgrid(atg, out)
+        assert out.getvalue() == praatio_path.read_text(encoding = "utf-8")
+
+    def test_errors(self, tmp_path):
+        atg = AlignedTextGrid(
+            "tests/test_data/KY25A_1.TextGrid",
+            entry_classes = [Word, Phone]
+        )
+        with pytest.raises(ValueError):
+            write_textgrid(atg, tmp_path / "out.TextGrid", "binary")
+        with pytest.raises(ValueError):
+            atg.save_textgrid(str(tmp_path / "out.TextGrid"), writer = "other")